@@ -0,0 +1,3 @@
+"""
+Нагрузочное тестирование и измерение производительности сервиса.
+"""
@@ -0,0 +1,491 @@
+"""
+Нагрузочное тестирование API любимых мест.
+
+Приложение запускается в текущем процессе (через ASGI-транспорт httpx или uvicorn),
+провайдер данных о местонахождении и RabbitMQ заменяются заглушками,
+база данных используется настоящая (DATABASE_URL), таблица мест заполняется
+до заданного количества строк. Для каждого размера таблицы, уровня конкурентности
+и сценария (list, get, create, update, delete) измеряются пропускная способность
+и перцентили времени ответа, результаты сохраняются в формате JSON.
+
+Внимание: таблица мест в используемой базе данных изменяется,
+запускать только на отдельной базе данных.
+
+.. code-block:: shell
+
+    python -m benchmarks.load --rows 10000,1000000 --concurrency 1,16,64
+    python -m benchmarks.load --transport uvicorn --compare load-baseline.json
+"""
+import argparse
+import asyncio
+import json
+import logging.config
+import random
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from benchmarks.report import (
+    build_report,
+    compare,
+    format_comparison,
+    summarize,
+    write_report,
+)
+from benchmarks.stubs import stub_services
+from bootstrap import build_app
+from integrations.db.session import engine
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+#: сценарии в порядке выполнения (удаляются объекты, созданные сценарием create)
+SCENARIOS = ("list", "get", "create", "update", "delete")
+#: адрес API любимых мест
+PLACES_URL = "/api/v1/places"
+#: количество строк, добавляемых в таблицу одним запросом
+SEED_CHUNK_SIZE = 1_000_000
+#: количество идентификаторов существующих объектов для сценариев get и update
+SAMPLE_SIZE = 10_000
+
+SEED_QUERY = text(
+    """
+    INSERT INTO place (
+        latitude, longitude, description, country, city, locality,
+        created_at, updated_at
+    )
+    SELECT
+        random() * 180 - 90,
+        random() * 360 - 180,
+        'Seeded place ' || n,
+        (ARRAY['AA', 'BB', 'CC', 'DD'])[1 + n % 4],
+        'City ' || n % 1000,
+        'Locality ' || n % 10000,
+        timezone('utc', now()) - make_interval(secs => :count - n),
+        timezone('utc', now())
+    FROM generate_series(1, :count) AS n
+    """
+)
+
+#: операция сценария: выполняет запрос и возвращает признак успеха
+Operation = Callable[[httpx.AsyncClient], Awaitable[bool]]
+
+
+async def seed(rows: int) -> int:
+    """
+    Заполнение таблицы мест до заданного количества строк.
+    Если строк больше, таблица очищается и заполняется заново.
+
+    :param rows: Количество строк.
+    :return: Количество добавленных строк.
+    """
+
+    async with engine.begin() as connection:
+        current = (
+            await connection.execute(text("SELECT count(*) FROM place"))
+        ).scalar() or 0
+        if current > rows:
+            await connection.execute(text("TRUNCATE place RESTART IDENTITY CASCADE"))
+            current = 0
+
+        missing = rows - current
+        for offset in range(0, missing, SEED_CHUNK_SIZE):
+            count = min(SEED_CHUNK_SIZE, missing - offset)
+            await connection.execute(SEED_QUERY, {"count": count})
+            logger.info("Seeded %s of %s rows.", offset + count, missing)
+
+    if missing:
+        async with engine.connect() as connection:
+            await connection.execution_options(isolation_level="AUTOCOMMIT")
+            await connection.execute(text("VACUUM ANALYZE place"))
+
+    return missing
+
+
+async def sample_ids(rows: int) -> list[int]:
+    """
+    Получение случайной выборки идентификаторов существующих объектов.
+
+    :param rows: Количество строк в таблице.
+    :return:
+    """
+
+    share = min(100.0, SAMPLE_SIZE * 2 * 100 / max(rows, 1))
+    async with engine.connect() as connection:
+        result = await connection.execute(
+            text(f"SELECT id FROM place TABLESAMPLE BERNOULLI ({share}) LIMIT :limit"),
+            {"limit": SAMPLE_SIZE},
+        )
+
+        return list(result.scalars())
+
+
+class Scenarios:
+    """
+    Операции сценариев нагрузочного тестирования.
+    """
+
+    def __init__(self, ids: list[int], seed_value: int = 0) -> None:
+        """
+        Инициализация сценариев.
+
+        :param ids: Идентификаторы существующих объектов.
+        :param seed_value: Начальное значение генератора случайных чисел.
+        """
+
+        self.ids = ids
+        self.random = random.Random(seed_value)
+        #: идентификаторы объектов, созданных сценарием create
+        self.created: list[int] = []
+        #: операции по названиям сценариев
+        self.operations: dict[str, Operation] = {
+            "list": self.get_list,
+            "get": self.get_one,
+            "create": self.create,
+            "update": self.update,
+            "delete": self.delete,
+        }
+
+    def point(self) -> dict:
+        """
+        Случайные координаты.
+
+        :return:
+        """
+
+        return {
+            "latitude": round(self.random.uniform(-90, 90), 6),
+            "longitude": round(self.random.uniform(-180, 180), 6),
+        }
+
+    async def get_list(self, client: httpx.AsyncClient) -> bool:
+        """
+        Получение первой страницы списка объектов.
+
+        :param client: HTTP-клиент.
+        :return: Признак успешного выполнения запроса.
+        """
+
+        response = await client.get(
+            PLACES_URL, params={"limit": 20, "order_by": "created_at"}
+        )
+
+        return response.status_code == 200
+
+    async def get_one(self, client: httpx.AsyncClient) -> bool:
+        """
+        Получение случайного существующего объекта.
+
+        :param client: HTTP-клиент.
+        :return: Признак успешного выполнения запроса.
+        """
+
+        response = await client.get(f"{PLACES_URL}/{self.random.choice(self.ids)}")
+
+        return response.status_code == 200
+
+    async def create(self, client: httpx.AsyncClient) -> bool:
+        """
+        Создание объекта (с получением данных о местонахождении).
+
+        :param client: HTTP-клиент.
+        :return: Признак успешного выполнения запроса.
+        """
+
+        response = await client.post(
+            PLACES_URL, json={"description": "Benchmark place", **self.point()}
+        )
+        if response.status_code != 201:
+            return False
+
+        self.created.append(response.json()["data"]["id"])
+
+        return True
+
+    async def update(self, client: httpx.AsyncClient) -> bool:
+        """
+        Изменение описания случайного существующего объекта.
+
+        :param client: HTTP-клиент.
+        :return: Признак успешного выполнения запроса.
+        """
+
+        response = await client.patch(
+            f"{PLACES_URL}/{self.random.choice(self.ids)}",
+            json={"description": f"Updated place {self.random.random():.6f}"},
+        )
+
+        return response.status_code == 200
+
+    async def delete(self, client: httpx.AsyncClient) -> bool:
+        """
+        Удаление объекта, созданного сценарием create.
+
+        :param client: HTTP-клиент.
+        :return: Признак успешного выполнения запроса.
+        """
+
+        response = await client.delete(f"{PLACES_URL}/{self.created.pop()}")
+
+        return response.status_code == 204
+
+
+async def measure(
+    client: httpx.AsyncClient, operation: Operation, requests: int, concurrency: int
+) -> dict:
+    """
+    Выполнение операции заданное количество раз с заданной конкурентностью.
+
+    :param client: HTTP-клиент.
+    :param operation: Операция сценария.
+    :param requests: Количество запросов.
+    :param concurrency: Количество одновременных запросов.
+    :return: Пропускная способность и перцентили времени ответа.
+    """
+
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                succeeded = await operation(client)
+            except httpx.HTTPError:
+                succeeded = False
+            latencies.append(time.perf_counter() - started)
+            errors += not succeeded
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+async def run_round(
+    client: httpx.AsyncClient,
+    rows: int,
+    concurrency: int,
+    requests: int,
+    scenarios: tuple[str, ...],
+) -> list[dict]:
+    """
+    Выполнение сценариев для одного размера таблицы и уровня конкурентности.
+
+    :param client: HTTP-клиент.
+    :param rows: Количество строк в таблице.
+    :param concurrency: Количество одновременных запросов.
+    :param requests: Количество запросов в каждом сценарии.
+    :param scenarios: Названия выполняемых сценариев.
+    :return: Результаты по сценариям.
+    """
+
+    operations = Scenarios(await sample_ids(rows), seed_value=rows + concurrency)
+    results = []
+    for scenario in scenarios:
+        count = requests
+        if scenario == "delete":
+            # удаляются только объекты, созданные в этом раунде
+            count = min(requests, len(operations.created))
+            if not count:
+                continue
+
+        result = await measure(
+            client, operations.operations[scenario], count, concurrency
+        )
+        logger.info(
+            "rows=%s concurrency=%s %s: %.1f req/s, p95 %.2f ms, errors %s",
+            rows,
+            concurrency,
+            scenario,
+            result["throughput"],
+            result["latency_ms"]["p95"],
+            result["errors"],
+        )
+        results.append(
+            {"rows": rows, "concurrency": concurrency, "scenario": scenario, **result}
+        )
+
+    # созданные и не удаленные объекты удаляются, чтобы сохранить размер таблицы
+    if operations.created:
+        async with engine.begin() as connection:
+            await connection.execute(
+                text("DELETE FROM place WHERE id = ANY(:ids)"),
+                {"ids": operations.created},
+            )
+
+    return results
+
+
+async def serve(app: FastAPI, port: int) -> tuple[uvicorn.Server, asyncio.Task]:
+    """
+    Запуск приложения через uvicorn в текущем процессе.
+
+    :param app: Приложение.
+    :param port: Порт.
+    :return: Сервер и задача его выполнения.
+    """
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.05)
+
+    return server, task
+
+
+async def main(args: argparse.Namespace) -> dict:
+    """
+    Нагрузочное тестирование по параметрам запуска.
+
+    :param args: Параметры запуска.
+    :return: Отчет.
+    """
+
+    app = build_app()
+    max_concurrency = max(args.concurrency)
+    limits = httpx.Limits(
+        max_connections=max_concurrency, max_keepalive_connections=max_concurrency
+    )
+    server: Optional[uvicorn.Server] = None
+    if args.transport == "uvicorn":
+        server, task = await serve(app, args.port)
+        client = httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=60
+        )
+    else:
+        await app.router.startup()
+        client = httpx.AsyncClient(
+            app=app, base_url="http://benchmark", limits=limits, timeout=60
+        )
+
+    results: list[dict] = []
+    try:
+        async with client:
+            for rows in sorted(args.rows):
+                await seed(rows)
+                # прогрев кэшей и пула соединений
+                await run_round(client, rows, max_concurrency, args.warmup, ("get",))
+                for concurrency in args.concurrency:
+                    results.extend(
+                        await run_round(
+                            client, rows, concurrency, args.requests, args.scenarios
+                        )
+                    )
+    finally:
+        if server is not None:
+            server.should_exit = True
+            await task
+        else:
+            await app.router.shutdown()
+
+    return build_report(
+        "load",
+        {
+            "transport": args.transport,
+            "rows": sorted(args.rows),
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "scenarios": list(args.scenarios),
+            "geocoder_latency": args.geocoder_latency,
+            "broker_latency": args.broker_latency,
+        },
+        results,
+    )
+
+
+def int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Нагрузочное тестирование API.")
+    parser.add_argument(
+        "--rows",
+        type=int_list,
+        default=[10_000],
+        help="Размеры таблицы мест через запятую (по умолчанию – 10000)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int_list,
+        default=[1, 16, 64],
+        help="Количество одновременных запросов через запятую",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=2000,
+        help="Количество запросов в каждом сценарии",
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=200, help="Количество запросов для прогрева"
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value: tuple(value.split(",")),
+        default=SCENARIOS,
+        help="Сценарии через запятую: " + ", ".join(SCENARIOS),
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["asgi", "uvicorn"],
+        default="asgi",
+        help="Запуск приложения через ASGI-транспорт httpx или через uvicorn",
+    )
+    parser.add_argument("--port", type=int, default=8765, help="Порт для uvicorn")
+    parser.add_argument(
+        "--geocoder-latency",
+        type=float,
+        default=0.05,
+        help="Время ответа заглушки провайдера данных о местонахождении (в секундах)",
+    )
+    parser.add_argument(
+        "--broker-latency",
+        type=float,
+        default=0.002,
+        help="Время публикации в заглушке RabbitMQ (в секундах)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("benchmarks/results/load.json"),
+        help="Путь к файлу отчета",
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="Отчет для сравнения с текущими результатами"
+    )
+    arguments = parser.parse_args()
+    if min(arguments.rows, default=0) <= 0:
+        parser.error("table sizes must be positive")
+    if unknown := set(arguments.scenarios) - set(SCENARIOS):
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    with stub_services(arguments.geocoder_latency, arguments.broker_latency):
+        load_report = asyncio.run(main(arguments))
+    write_report(load_report, arguments.output)
+    logger.info("Report saved: %s", arguments.output)
+
+    if arguments.compare:
+        print(
+            format_comparison(
+                compare(
+                    json.loads(arguments.compare.read_text(encoding="utf-8")),
+                    load_report,
+                    keys=("rows", "concurrency", "scenario"),
+                    metrics=("throughput", "latency_ms.p50", "latency_ms.p95"),
+                ),
+                keys=("rows", "concurrency", "scenario"),
+            )
+        )
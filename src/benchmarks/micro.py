@@ -0,0 +1,463 @@
+"""
+Измерение производительности отдельных операций репозиториев и сериализации.
+
+Для каждой операции измеряются количество операций в секунду и выделение памяти
+(tracemalloc): пиковый объем памяти за одну операцию и объем памяти,
+оставшийся занятым после операции. Операции сгруппированы по этапам обработки,
+чтобы отделить построение запроса и компиляцию SQL от создания объектов ORM
+и проверки данных pydantic.
+Операции группы db выполняются в транзакции, которая откатывается после измерения
+(требуется доступная база данных DATABASE_URL, иначе группа пропускается).
+
+.. code-block:: shell
+
+    python -m benchmarks.micro
+    python -m benchmarks.micro --filter sql. --duration 2 --compare micro.json
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import logging.config
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional, cast
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.report import build_report, compare, format_comparison, write_report
+from benchmarks.stubs import location_response, stub_services
+from clients.geo import LocationClient
+from clients.shemas import LocalityDTO
+from integrations.db.session import engine
+from models import Place
+from repositories.places_repository import PlacesRepository
+from schemas.places import PlacesListResponse
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+#: количество строк, создаваемых для операций группы db
+DB_ROWS = 1000
+#: количество объектов на странице списка
+PAGE_SIZE = 20
+
+
+@dataclass
+class Benchmark:
+    """
+    Измеряемая операция.
+    """
+
+    #: название (группа и операция через точку)
+    name: str
+    #: функция операции (принимает контекст, может быть асинхронной)
+    function: Callable[["Context"], Any]
+    #: необходимость подключения к базе данных
+    needs_db: bool = False
+
+
+#: измеряемые операции в порядке выполнения
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, needs_db: bool = False) -> Callable:
+    """
+    Регистрация измеряемой операции.
+
+    :param name: Название (группа и операция через точку).
+    :param needs_db: Необходимость подключения к базе данных.
+    :return:
+    """
+
+    def register(function: Callable) -> Callable:
+        BENCHMARKS.append(Benchmark(name, function, needs_db))
+
+        return function
+
+    return register
+
+
+class CacheKeySession:
+    """
+    Сессия без подключения к базе данных для измерения подготовки запросов.
+    Вычисляет ключ кэша скомпилированных запросов, как при выполнении запроса,
+    и возвращает пустой результат.
+    """
+
+    class Result:
+        def scalar(self) -> None:
+            return None
+
+        def scalars(self) -> "CacheKeySession.Result":
+            return self
+
+        def all(self) -> list:
+            return []
+
+        def fetchall(self) -> list:
+            return []
+
+    async def execute(self, statement: Any, _params: Optional[dict] = None) -> Result:
+        statement._generate_cache_key()  # pylint: disable=protected-access
+
+        return self.Result()
+
+
+class Context:
+    """
+    Данные для выполнения операций.
+    """
+
+    def __init__(self, session: Optional[AsyncSession] = None) -> None:
+        """
+        Инициализация данных.
+
+        :param session: Сессия в откатываемой транзакции (для операций группы db).
+        """
+
+        now = datetime.utcnow()
+        self.session = session
+        # без подключения к БД репозиторий используется только для подготовки запросов
+        self.repository = PlacesRepository(
+            session if session is not None else AsyncSession()
+        )
+        self.statement_repository = PlacesRepository(
+            cast(AsyncSession, CacheKeySession())
+        )
+        self.rows = [
+            {
+                "id": index,
+                "latitude": 10.0 + index / 1000,
+                "longitude": 20.0 + index / 1000,
+                "description": f"Benchmark place {index}",
+                "country": "AA",
+                "city": "City",
+                "locality": "Locality",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for index in range(1, PAGE_SIZE + 1)
+        ]
+        self.places = [Place(**row) for row in self.rows]
+        self.location_client = LocationClient()
+        self.location = location_response(10.0, 20.0)
+        #: идентификаторы созданных записей (для операций группы db)
+        self.ids: list[int] = []
+        self.counter = 0
+
+
+@benchmark("sql.select_build")
+def select_build(context: Context) -> Any:
+    return context.repository._select(  # pylint: disable=protected-access
+        country="AA", city="City"
+    )
+
+
+@benchmark("sql.select_cache_key")
+def select_cache_key(context: Context) -> Any:
+    # ключ кэша скомпилированных запросов вычисляется при каждом выполнении запроса
+    query = select_build(context)
+    return query._generate_cache_key()  # pylint: disable=protected-access
+
+
+@benchmark("sql.select_compile")
+def select_compile(context: Context) -> Any:
+    # полная компиляция (без кэша) – при промахе кэша скомпилированных запросов
+    return select_build(context).compile(dialect=engine.sync_engine.dialect)
+
+
+@benchmark("sql.select_template")
+def select_template(context: Context) -> Any:
+    # шаблон запроса, созданный при первом обращении, и значения параметров
+    return context.repository._select_template(  # pylint: disable=protected-access
+        country="AA", city="City"
+    )
+
+
+@benchmark("sql.select_template_cache_key")
+def select_template_cache_key(context: Context) -> Any:
+    # для повторно используемого запроса ключ кэша вычисляется один раз
+    statement, _ = select_template(context)
+
+    return statement._generate_cache_key()  # pylint: disable=protected-access
+
+
+@benchmark("sql.find_all_by_rebuild")
+async def find_all_by_rebuild(context: Context) -> Any:
+    # построение запроса заново при каждом вызове (без шаблонов)
+    repository = context.statement_repository
+    query = (
+        repository._select(country="AA")  # pylint: disable=protected-access
+        .order_by(repository.get_attr("id"))
+        .limit(PAGE_SIZE)
+        .offset(0)
+    )
+
+    return (await repository.session.execute(query)).scalars().all()
+
+
+@benchmark("sql.find_all_by_template")
+async def find_all_by_template(context: Context) -> Any:
+    return await context.statement_repository.find_all_by(limit=PAGE_SIZE, country="AA")
+
+
+@benchmark("orm.model_from_row")
+def model_from_row(context: Context) -> Any:
+    # создание объекта из строки RETURNING (BaseRepository._fetch_model)
+    return Place(**context.rows[0])
+
+
+@benchmark("orm.model_validate")
+def model_validate(context: Context) -> Any:
+    return Place.validate(context.rows[0])
+
+
+@benchmark("serialization.list_response")
+def list_response(context: Context) -> Any:
+    return PlacesListResponse(data=context.places)
+
+
+@benchmark("serialization.list_response_json")
+def list_response_json(context: Context) -> Any:
+    return PlacesListResponse(data=context.places).json()
+
+
+@benchmark("serialization.list_response_fastapi")
+def list_response_fastapi(context: Context) -> Any:
+    # преобразование ответа обработчика, как это делает FastAPI (response_model)
+    response = PlacesListResponse(data=context.places)
+    content = jsonable_encoder(PlacesListResponse.validate(response))
+
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+@benchmark("geocoding.locality_dto")
+def locality_dto(context: Context) -> Any:
+    return LocalityDTO(
+        city=context.location["city"],
+        alpha2code=context.location["countryCode"],
+        locality=context.location["locality"],
+    )
+
+
+@benchmark("geocoding.get_location")
+async def get_location(context: Context) -> Any:
+    # запрос к провайдеру заменен заглушкой без задержки
+    return await context.location_client.get_location(10.0, 20.0)
+
+
+@benchmark("db.find", needs_db=True)
+async def find(context: Context) -> Any:
+    context.counter += 1
+
+    return await context.repository.find(
+        context.ids[context.counter % len(context.ids)]
+    )
+
+
+@benchmark("db.find_all_by", needs_db=True)
+async def find_all_by(context: Context) -> Any:
+    return await context.repository.find_all_by(limit=PAGE_SIZE, country="AA")
+
+
+@benchmark("db.create_model", needs_db=True)
+async def create_model(context: Context) -> Any:
+    return await context.repository.create_model_returning(
+        {"latitude": 10.0, "longitude": 20.0, "description": "Benchmark place"}
+    )
+
+
+async def call(function: Callable, context: Context, number: int) -> float:
+    """
+    Выполнение операции заданное количество раз.
+
+    :param function: Функция операции.
+    :param context: Данные для выполнения операций.
+    :param number: Количество выполнений.
+    :return: Продолжительность (в секундах).
+    """
+
+    if inspect.iscoroutinefunction(function):
+        started = time.perf_counter()
+        for _ in range(number):
+            await function(context)
+    else:
+        started = time.perf_counter()
+        for _ in range(number):
+            function(context)
+
+    return time.perf_counter() - started
+
+
+async def measure(
+    function: Callable, context: Context, duration: float, repeat: int
+) -> dict:
+    """
+    Измерение скорости выполнения и выделения памяти для операции.
+
+    :param function: Функция операции.
+    :param context: Данные для выполнения операций.
+    :param duration: Общая продолжительность измерения скорости (в секундах).
+    :param repeat: Количество повторов измерения (используется медиана).
+    :return:
+    """
+
+    # подбор количества выполнений для одного повтора
+    number = 1
+    while (elapsed := await call(function, context, number)) < 0.05:
+        number *= 2
+    number = max(int(number * duration / repeat / elapsed), 1)
+
+    rates = [number / await call(function, context, number) for _ in range(repeat)]
+
+    tracemalloc.start()
+    try:
+        await call(function, context, 1)
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        await call(function, context, 1)
+        current, peak = tracemalloc.get_traced_memory()
+        peak_bytes = peak - before
+        sample = min(number, 1000)
+        await call(function, context, sample)
+        retained = (tracemalloc.get_traced_memory()[0] - current) / sample
+    finally:
+        tracemalloc.stop()
+
+    ops_per_sec = statistics.median(rates)
+
+    return {
+        "ops_per_sec": round(ops_per_sec, 1),
+        "us_per_op": round(1_000_000 / ops_per_sec, 3),
+        "peak_bytes": peak_bytes,
+        "retained_bytes_per_op": round(retained, 1),
+    }
+
+
+async def run(benchmarks: list[Benchmark], duration: float, repeat: int) -> list[dict]:
+    """
+    Измерение операций.
+
+    :param benchmarks: Измеряемые операции.
+    :param duration: Продолжительность измерения каждой операции (в секундах).
+    :param repeat: Количество повторов измерения.
+    :return: Результаты по операциям.
+    """
+
+    results = []
+
+    async def run_all(context: Context, benchmarks: list[Benchmark]) -> None:
+        for item in benchmarks:
+            result = {
+                "name": item.name,
+                **await measure(item.function, context, duration, repeat),
+            }
+            logger.info(
+                "%s: %.0f ops/s, %.2f us/op, peak %s B",
+                item.name,
+                result["ops_per_sec"],
+                result["us_per_op"],
+                result["peak_bytes"],
+            )
+            results.append(result)
+
+    with stub_services():
+        await run_all(Context(), [item for item in benchmarks if not item.needs_db])
+
+        if db_benchmarks := [item for item in benchmarks if item.needs_db]:
+            try:
+                connection = await engine.connect()
+            except OSError:
+                logger.warning("Database is not available, db benchmarks skipped.")
+
+                return results
+
+            transaction = await connection.begin()
+            session = AsyncSession(bind=connection)
+            try:
+                context = Context(session)
+                context.ids = await context.repository.create_many(
+                    [
+                        {
+                            "latitude": index % 90,
+                            "longitude": index % 180,
+                            "description": f"Benchmark place {index}",
+                            "country": ("AA", "BB")[index % 2],
+                        }
+                        for index in range(DB_ROWS)
+                    ]
+                )
+                await run_all(context, db_benchmarks)
+            finally:
+                await session.close()
+                await transaction.rollback()
+                await connection.close()
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Измерение производительности отдельных операций."
+    )
+    parser.add_argument(
+        "--filter", default="", help="Подстрока названия измеряемых операций"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=1.0,
+        help="Продолжительность измерения каждой операции (в секундах)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Количество повторов измерения"
+    )
+    parser.add_argument(
+        "--no-db", action="store_true", help="Пропуск операций с базой данных"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("benchmarks/results/micro.json"),
+        help="Путь к файлу отчета",
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="Отчет для сравнения с текущими результатами"
+    )
+    arguments = parser.parse_args()
+
+    selected = [
+        item
+        for item in BENCHMARKS
+        if arguments.filter in item.name and not (arguments.no_db and item.needs_db)
+    ]
+    micro_report = build_report(
+        "micro",
+        {
+            "filter": arguments.filter,
+            "duration": arguments.duration,
+            "repeat": arguments.repeat,
+        },
+        asyncio.run(run(selected, arguments.duration, arguments.repeat)),
+    )
+    write_report(micro_report, arguments.output)
+    logger.info("Report saved: %s", arguments.output)
+
+    if arguments.compare:
+        print(
+            format_comparison(
+                compare(
+                    json.loads(arguments.compare.read_text(encoding="utf-8")),
+                    micro_report,
+                    keys=("name",),
+                    metrics=("ops_per_sec", "peak_bytes"),
+                ),
+                keys=("name",),
+            )
+        )
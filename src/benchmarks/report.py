@@ -0,0 +1,169 @@
+"""
+Формирование и сравнение отчетов об измерении производительности.
+"""
+import json
+import math
+import platform
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Sequence
+
+
+def percentile(samples: Sequence[float], percent: float) -> float:
+    """
+    Расчет перцентиля (метод ближайшего ранга).
+
+    :param samples: Упорядоченные по возрастанию значения.
+    :param percent: Перцентиль (от 0 до 100).
+    :return:
+    """
+
+    if not samples:
+        return 0.0
+
+    rank = max(math.ceil(percent / 100 * len(samples)), 1)
+
+    return samples[rank - 1]
+
+
+def summarize(latencies: Sequence[float], elapsed: float, errors: int = 0) -> dict:
+    """
+    Расчет пропускной способности и перцентилей времени ответа.
+
+    :param latencies: Время выполнения операций (в секундах).
+    :param elapsed: Общая продолжительность измерения (в секундах).
+    :param errors: Количество неуспешных операций.
+    :return:
+    """
+
+    ordered = sorted(latencies)
+
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "elapsed": round(elapsed, 4),
+        "throughput": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+            "p50": round(percentile(ordered, 50) * 1000, 3),
+            "p95": round(percentile(ordered, 95) * 1000, 3),
+            "p99": round(percentile(ordered, 99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        },
+    }
+
+
+def git_revision() -> Optional[str]:
+    """
+    Получение идентификатора текущего коммита.
+
+    :return: Идентификатор или None вне репозитория.
+    """
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(kind: str, parameters: dict, results: list[dict]) -> dict:
+    """
+    Формирование отчета.
+
+    :param kind: Вид измерения (load, micro).
+    :param parameters: Параметры запуска.
+    :param results: Результаты измерений.
+    :return:
+    """
+
+    return {
+        "kind": kind,
+        "revision": git_revision(),
+        "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "results": results,
+    }
+
+
+def write_report(report: dict, path: Path) -> None:
+    """
+    Сохранение отчета в формате JSON.
+
+    :param report: Отчет.
+    :param path: Путь к файлу.
+    :return:
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def compare(
+    baseline: dict, current: dict, keys: Sequence[str], metrics: Sequence[str]
+) -> list[dict]:
+    """
+    Сравнение результатов двух отчетов.
+
+    :param baseline: Отчет, с которым выполняется сравнение.
+    :param current: Текущий отчет.
+    :param keys: Атрибуты результата, определяющие измерение (например, сценарий).
+    :param metrics: Пути к сравниваемым значениям (например, latency_ms.p95).
+    :return: Значения и изменения (в процентах) для измерений из обоих отчетов.
+    """
+
+    def value(result: dict, metric: str) -> float:
+        for part in metric.split("."):
+            result = result[part]
+
+        return result  # type: ignore
+
+    previous = {
+        tuple(result[key] for key in keys): result for result in baseline["results"]
+    }
+    rows = []
+    for result in current["results"]:
+        if (before := previous.get(tuple(result[key] for key in keys))) is None:
+            continue
+
+        row = {key: result[key] for key in keys}
+        for metric in metrics:
+            old, new = value(before, metric), value(result, metric)
+            row[metric] = {
+                "baseline": old,
+                "current": new,
+                "change": round((new - old) / old * 100, 1) if old else None,
+            }
+        rows.append(row)
+
+    return rows
+
+
+def format_comparison(rows: list[dict], keys: Sequence[str]) -> str:
+    """
+    Представление результатов сравнения в виде текстовой таблицы.
+
+    :param rows: Результаты сравнения.
+    :param keys: Атрибуты результата, определяющие измерение.
+    :return:
+    """
+
+    lines = []
+    for row in rows:
+        name = " ".join(f"{key}={row[key]}" for key in keys)
+        changes = ", ".join(
+            f"{metric}: {values['baseline']} -> {values['current']}"
+            + (f" ({values['change']:+.1f}%)" if values["change"] is not None else "")
+            for metric, values in row.items()
+            if metric not in keys
+        )
+        lines.append(f"{name}: {changes}")
+
+    return "\n".join(lines)
@@ -0,0 +1,69 @@
+"""
+Заглушки внешних сервисов для измерения производительности.
+"""
+import asyncio
+from contextlib import ExitStack, contextmanager
+from typing import Iterator, Optional, Sequence, Union
+from unittest import mock
+
+from clients.geo import LocationClient
+from integrations.events.producer import EventProducer
+from settings import settings
+
+
+def location_response(latitude: float, longitude: float) -> dict:
+    """
+    Формирование ответа провайдера данных о местонахождении для координат.
+    Города зависят от координат, чтобы данные различались между объектами.
+
+    :param latitude: Широта
+    :param longitude: Долгота
+    :return:
+    """
+
+    return {
+        "city": f"City {int(latitude) % 90:02d}{int(longitude) % 180:03d}",
+        "countryCode": ("AA", "BB", "CC", "DD")[int(abs(latitude)) % 4],
+        "locality": f"Locality {round(latitude, 1)} {round(longitude, 1)}",
+    }
+
+
+@contextmanager
+def stub_services(
+    geocoder_latency: float = 0.0, broker_latency: float = 0.0
+) -> Iterator[None]:
+    """
+    Замена запросов к провайдеру данных о местонахождении и публикации в RabbitMQ.
+    Заменяются только сетевые вызовы, поэтому кэши, объединение запросов,
+    выключатели и таблица исходящих событий работают как обычно.
+
+    :param geocoder_latency: Время ответа провайдера данных о местонахождении (в секундах).
+    :param broker_latency: Время публикации пакета сообщений (в секундах).
+    :return:
+    """
+
+    async def request(_client: LocationClient, url: str) -> Optional[dict]:
+        await asyncio.sleep(geocoder_latency)
+        params = dict(part.split("=", 1) for part in url.split("?", 1)[1].split("&"))
+
+        return location_response(float(params["latitude"]), float(params["longitude"]))
+
+    async def connect(_producer: EventProducer) -> None:
+        return None
+
+    async def publish(
+        _producer: EventProducer,
+        _queue_name: str,
+        _bodies: Sequence[Union[bytes, str]],
+    ) -> bool:
+        await asyncio.sleep(broker_latency)
+
+        return True
+
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(settings.geocoder, "provider", "remote"))
+        stack.enter_context(mock.patch.object(settings.resilience, "hedging", False))
+        stack.enter_context(mock.patch.object(LocationClient, "_request", request))
+        stack.enter_context(mock.patch.object(EventProducer, "connect", connect))
+        stack.enter_context(mock.patch.object(EventProducer, "_publish", publish))
+        yield
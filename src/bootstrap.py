@@ -1,7 +1,17 @@
 from fastapi import FastAPI
 
+from clients.base.base import close_http_client, open_http_client
+from clients.offline_geo import load_gazetteer
 from exceptions import setup_exception_handlers
+from integrations.db.session import engine
+from integrations.events.producer import event_producer
+from integrations.metrics import MetricsMiddleware, instrument_engine, metrics
+from integrations.profiling import ProfilingMiddleware
 from routes import metadata_tags, setup_routes
+from services.enrichment_service import enrichment_worker, pending_enrichment
+from services.locations_service import location_cache_eviction
+from services.metrics_service import register_collector
+from services.outbox_service import outbox_relay
 from settings import settings
 
 
@@ -19,5 +29,31 @@ def build_app() -> FastAPI:
 
     setup_routes(app)
     setup_exception_handlers(app)
+    if settings.metrics.enabled:
+        app.add_route("/metrics", metrics, include_in_schema=False)
+        app.add_middleware(MetricsMiddleware)
+        instrument_engine(engine)
+        register_collector()
+    if settings.profiling.enabled:
+        app.add_middleware(ProfilingMiddleware)
+
+    app.add_event_handler("startup", open_http_client)
+    if settings.geocoder.provider == "offline":
+        app.add_event_handler("startup", load_gazetteer)
+    app.add_event_handler("startup", event_producer.connect)
+    if settings.enrichment.mode == "background":
+        app.add_event_handler("startup", enrichment_worker.start)
+        app.add_event_handler("shutdown", enrichment_worker.stop)
+    if settings.enrichment.pending_relay:
+        app.add_event_handler("startup", pending_enrichment.start)
+        app.add_event_handler("shutdown", pending_enrichment.stop)
+    if settings.location_cache.eviction_interval:
+        app.add_event_handler("startup", location_cache_eviction.start)
+        app.add_event_handler("shutdown", location_cache_eviction.stop)
+    if settings.outbox.relay_enabled:
+        app.add_event_handler("startup", outbox_relay.start)
+        app.add_event_handler("shutdown", outbox_relay.stop)
+    app.add_event_handler("shutdown", event_producer.close)
+    app.add_event_handler("shutdown", close_http_client)
 
     return app
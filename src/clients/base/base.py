@@ -2,15 +2,266 @@
 Базовые функции для клиентов внешних сервисов.
 """
 
+import asyncio
+import logging.config
+import time
 from abc import ABC, abstractmethod
+from importlib.util import find_spec
 from typing import Optional
 
+import httpx
+
+from clients.base.resilience import CircuitBreaker, LatencyTracker
+from integrations.metrics import observe_geocode
+from settings import settings
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+# HTTP-клиент, общий для всех клиентов внешних сервисов в рамках процесса
+_http_client: Optional[httpx.AsyncClient] = None
+# выключатели и учет времени ответа по базовым адресам внешних сервисов
+_breakers: dict[str, CircuitBreaker] = {}
+_latencies: dict[str, LatencyTracker] = {}
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Создание HTTP-клиента с пулом соединений по настройкам приложения.
+    HTTP/2 используется, только если установлена библиотека h2.
+
+    :return:
+    """
+
+    config = settings.http_client
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        http2=config.http2 and find_spec("h2") is not None,
+        retries=config.retries,
+    )
+
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Получение общего HTTP-клиента (создается при первом обращении).
+
+    :return:
+    """
+
+    global _http_client  # pylint: disable=global-statement,invalid-name
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+
+    return _http_client
+
+
+async def open_http_client() -> None:
+    """
+    Создание общего HTTP-клиента при запуске приложения.
+
+    :return:
+    """
+
+    get_http_client()
+
+
+async def close_http_client() -> None:
+    """
+    Закрытие общего HTTP-клиента и его соединений при остановке приложения.
+
+    :return:
+    """
+
+    global _http_client  # pylint: disable=global-statement,invalid-name
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class BaseClient(ABC):
     """
     Базовый класс, реализующий интерфейс для клиентов.
     """
 
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        Общий HTTP-клиент с пулом соединений.
+
+        :return:
+        """
+
+        return get_http_client()
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """
+        Автоматический выключатель внешнего сервиса (общий для процесса).
+
+        :return:
+        """
+
+        if (breaker := _breakers.get(self.base_url)) is None:
+            config = settings.resilience
+            breaker = _breakers[self.base_url] = CircuitBreaker(
+                failure_rate_threshold=config.failure_rate_threshold,
+                minimum_calls=config.minimum_calls,
+                window_size=config.window_size,
+                open_duration=config.open_duration,
+                half_open_calls=config.half_open_calls,
+            )
+
+        return breaker
+
+    @property
+    def latency(self) -> LatencyTracker:
+        """
+        Учет времени ответа внешнего сервиса (общий для процесса).
+
+        :return:
+        """
+
+        if (latency := _latencies.get(self.base_url)) is None:
+            latency = _latencies[self.base_url] = LatencyTracker(
+                window_size=settings.resilience.latency_window,
+                minimum_samples=settings.resilience.latency_minimum_samples,
+            )
+
+        return latency
+
+    async def fetch(self, url: str) -> Optional[dict]:
+        """
+        Выполнение запроса с защитой от деградации внешнего сервиса.
+        При разомкнутом выключателе запрос не выполняется.
+        Время ожидания ответа рассчитывается по перцентилю времени предыдущих ответов,
+        при долгом ожидании отправляется дублирующий запрос (используется первый ответ).
+
+        :param url: URL для выполнения запроса.
+        :return: Данные ответа или None при ошибке (в т.ч. при разомкнутом выключателе).
+        """
+
+        if not self.breaker.allow():
+            logger.warning(
+                "Circuit breaker is open, request skipped (%s).", self.base_url
+            )
+            observe_geocode(self.base_url, "rejected")
+
+            return None
+
+        started = time.perf_counter()
+        result = None
+        outcome = "error"
+        try:
+            result = await self._hedged_request(url)
+            if result is not None:
+                outcome = "success"
+        except (httpx.HTTPError, asyncio.TimeoutError, ValueError):
+            logger.warning("Error during request (%s).", self.base_url, exc_info=True)
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            # исход учитывается при любом завершении, иначе пробный вызов
+            # полуоткрытого выключателя остается занятым
+            if outcome == "success":
+                self.breaker.record_success()
+            elif outcome == "cancelled":
+                # отмена вызова не характеризует внешний сервис
+                self.breaker.release()
+            else:
+                self.breaker.record_failure()
+            observe_geocode(self.base_url, outcome, started)
+
+        return result
+
+    def _timeout(self) -> float:
+        """
+        Расчет времени ожидания ответа по перцентилю времени предыдущих ответов.
+
+        :return: Таймаут (в секундах).
+        """
+
+        config = settings.resilience
+        max_timeout = settings.http_client.timeout
+        latency = self.latency.percentile(config.timeout_percentile)
+        if latency is None:
+            return max_timeout
+
+        return min(
+            max(latency * config.timeout_multiplier, config.min_timeout), max_timeout
+        )
+
+    async def _hedged_request(self, url: str) -> Optional[dict]:
+        """
+        Выполнение запроса с отправкой дублирующего запроса при долгом ожидании.
+
+        :param url: URL для выполнения запроса.
+        :return: Первый успешный ответ.
+        """
+
+        timeout = self._timeout()
+        delay = (
+            self.latency.percentile(settings.resilience.hedge_percentile)
+            if settings.resilience.hedging
+            else None
+        )
+
+        tasks = {asyncio.ensure_future(self._timed_request(url, timeout))}
+        try:
+            if delay is not None and delay < timeout:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    tasks.add(asyncio.ensure_future(self._timed_request(url, timeout)))
+
+            error: Optional[BaseException] = None
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if (exception := task.exception()) is not None:
+                        error = exception
+                    elif (result := task.result()) is not None:
+                        return result
+
+            if error is not None:
+                raise error
+
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _timed_request(self, url: str, timeout: float) -> Optional[dict]:
+        """
+        Выполнение запроса с ограничением времени ожидания и учетом времени ответа.
+
+        :param url: URL для выполнения запроса.
+        :param timeout: Время ожидания ответа (в секундах).
+        :return:
+        """
+
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(self._request(url), timeout)
+        except asyncio.TimeoutError:
+            # время ответа не меньше таймаута: без учета таких запросов
+            # таймаут не увеличивается при росте времени ответа сервиса
+            self.latency.record(timeout)
+            raise
+        self.latency.record(time.perf_counter() - started)
+
+        return result
+
     @property
     @abstractmethod
     def base_url(self) -> str:
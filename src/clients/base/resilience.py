@@ -0,0 +1,211 @@
+"""
+Защита от деградации внешних сервисов: автоматический выключатель (circuit breaker)
+и адаптивные таймауты по перцентилям времени ответа.
+"""
+import math
+import time
+from collections import deque
+from typing import Optional
+
+
+class CircuitBreakerStats:
+    """
+    Счетчики автоматического выключателя.
+    """
+
+    def __init__(self) -> None:
+        #: количество успешных вызовов
+        self.successes = 0
+        #: количество неуспешных вызовов
+        self.failures = 0
+        #: количество вызовов, отклоненных без обращения к сервису
+        self.rejected = 0
+        #: количество размыканий
+        self.opened = 0
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель.
+    Размыкается, когда доля ошибок среди последних вызовов превышает порог.
+    В разомкнутом состоянии вызовы отклоняются сразу.
+    По истечении времени размыкания пропускается ограниченное количество пробных вызовов
+    (полуоткрытое состояние): при их успехе выключатель замыкается, при ошибке – снова размыкается.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        failure_rate_threshold: float,
+        minimum_calls: int,
+        window_size: int,
+        open_duration: float,
+        half_open_calls: int,
+    ) -> None:
+        """
+        Инициализация выключателя.
+
+        :param failure_rate_threshold: Доля ошибок для размыкания (от 0 до 1).
+        :param minimum_calls: Минимальное количество вызовов для расчета доли ошибок.
+        :param window_size: Количество последних вызовов для расчета доли ошибок.
+        :param open_duration: Время нахождения в разомкнутом состоянии (в секундах).
+        :param half_open_calls: Количество пробных вызовов в полуоткрытом состоянии.
+        """
+
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.stats = CircuitBreakerStats()
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        #: количество выданных и успешных пробных вызовов
+        self._probes = 0
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> str:
+        """
+        Текущее состояние выключателя.
+
+        :return:
+        """
+
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.open_duration
+        ):
+            self._state = self.HALF_OPEN
+            self._probes = self._probe_successes = 0
+
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Проверка возможности выполнения вызова.
+
+        :return:
+        """
+
+        state = self.state
+        if state == self.CLOSED:
+            return True
+
+        if state == self.HALF_OPEN and self._probes < self.half_open_calls:
+            self._probes += 1
+
+            return True
+
+        self.stats.rejected += 1
+
+        return False
+
+    def record_success(self) -> None:
+        """
+        Учет успешного вызова.
+
+        :return:
+        """
+
+        self.stats.successes += 1
+        if self._state == self.HALF_OPEN:
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_calls:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+        else:
+            self._outcomes.append(True)
+
+    def release(self) -> None:
+        """
+        Освобождение пробного вызова без учета результата (например, при отмене вызова).
+
+        :return:
+        """
+
+        if self._state == self.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def record_failure(self) -> None:
+        """
+        Учет неуспешного вызова.
+
+        :return:
+        """
+
+        self.stats.failures += 1
+        if self._state == self.HALF_OPEN:
+            self._open()
+
+            return
+
+        self._outcomes.append(False)
+        if (
+            self._state == self.CLOSED
+            and len(self._outcomes) >= self.minimum_calls
+            and self._outcomes.count(False) / len(self._outcomes)
+            >= self.failure_rate_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        """
+        Размыкание выключателя.
+
+        :return:
+        """
+
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self.stats.opened += 1
+
+
+class LatencyTracker:
+    """
+    Учет времени ответа внешнего сервиса для расчета адаптивных таймаутов.
+    """
+
+    def __init__(self, window_size: int, minimum_samples: int) -> None:
+        """
+        Инициализация учета.
+
+        :param window_size: Количество последних измерений.
+        :param minimum_samples: Минимальное количество измерений для расчета перцентилей.
+        """
+
+        self.minimum_samples = minimum_samples
+        self._samples: deque[float] = deque(maxlen=window_size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        """
+        Учет времени ответа.
+
+        :param latency: Время ответа (в секундах).
+        :return:
+        """
+
+        self._samples.append(latency)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Расчет перцентиля времени ответа (метод ближайшего ранга).
+
+        :param percent: Перцентиль (от 0 до 100).
+        :return: Значение или None, если измерений недостаточно.
+        """
+
+        if len(self._samples) < self.minimum_samples:
+            return None
+
+        ordered = sorted(self._samples)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+
+        return ordered[rank - 1]
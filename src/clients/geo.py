@@ -1,14 +1,85 @@
 """
 Функции для взаимодействия с внешним сервисом-провайдером данных о местонахождении.
 """
+import asyncio
+from functools import partial
 from http import HTTPStatus
-from typing import Optional
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
 from urllib.parse import urlencode, urljoin
 
-import httpx
-
 from clients.base.base import BaseClient
+from clients.offline_geo import OfflineLocationClient
 from clients.shemas import LocalityDTO
+from settings import settings
+from utils.geo import quantize_coordinates
+
+
+class SingleFlightStats:
+    """
+    Счетчики объединения одновременных вызовов.
+    """
+
+    def __init__(self) -> None:
+        #: количество выполненных вызовов
+        self.calls = 0
+        #: количество вызовов, объединенных с уже выполняющимися
+        self.coalesced = 0
+
+
+class SingleFlight:
+    """
+    Объединение одновременных вызовов с одинаковым ключом (single-flight).
+    Пока вызов выполняется, остальные вызовы с тем же ключом ожидают его результат.
+    Отмена одного из ожидающих не отменяет общий вызов.
+    """
+
+    def __init__(self) -> None:
+        self.stats = SingleFlightStats()
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(  # pylint: disable=invalid-name
+        self, key: Hashable, function: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Выполнение вызова или ожидание результата уже выполняющегося вызова.
+
+        :param key: Ключ вызова.
+        :param function: Функция, выполняющая вызов.
+        :return: Результат вызова (ошибка вызова передается всем ожидающим).
+        """
+
+        task = self._calls.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.calls += 1
+            task = asyncio.ensure_future(function())
+            self._calls[key] = task
+            task.add_done_callback(partial(self._forget, key))
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """
+        Удаление завершенного вызова.
+
+        :param key: Ключ вызова.
+        :param task: Задача вызова.
+        :return:
+        """
+
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # ошибка считается обработанной, даже если все ожидающие были отменены
+        if not task.cancelled():
+            task.exception()
+
+
+# объединение одновременных запросов данных о местонахождении (общее для процесса)
+location_flights = SingleFlight()
 
 
 class LocationClient(BaseClient):
@@ -21,21 +92,40 @@ class LocationClient(BaseClient):
         return "https://api.bigdatacloud.net/data/"
 
     async def _request(self, url: str) -> Optional[dict]:
-        async with httpx.AsyncClient() as client:
-            # получение ответа
-            response = await client.get(url)
-            # проверка статус-кода ответа от сервера
-            if response.status_code == HTTPStatus.OK:
-                # преобразование ответа из JSON в словарь
-                return response.json()
+        # получение ответа (через общий пул соединений)
+        response = await self.http_client.get(url)
+        # проверка статус-кода ответа от сервера
+        if response.status_code == HTTPStatus.OK:
+            # преобразование ответа из JSON в словарь
+            return response.json()
 
-            return None
+        return None
 
     async def get_location(
         self, latitude: float, longitude: float
     ) -> Optional[LocalityDTO]:
         """
         Получение данных о местонахождении по переданным координатам.
+        Одновременные запросы для одинаковых (после округления) координат
+        объединяются в один запрос к внешнему сервису.
+
+        :param latitude: Широта
+        :param longitude: Долгота
+        :return:
+        """
+
+        return await location_flights.do(
+            quantize_coordinates(
+                latitude, longitude, settings.location_cache.precision
+            ),
+            lambda: self._get_location(latitude, longitude),
+        )
+
+    async def _get_location(
+        self, latitude: float, longitude: float
+    ) -> Optional[LocalityDTO]:
+        """
+        Запрос данных о местонахождении у внешнего сервиса.
 
         :param latitude: Широта
         :param longitude: Долгота
@@ -52,7 +142,7 @@ class LocationClient(BaseClient):
             self.base_url,
             f"{endpoint}?{urlencode(query_params)}",
         )
-        if response := await self._request(url):
+        if response := await self.fetch(url):
             return LocalityDTO(
                 city=response.get("city") if response.get("city", "").strip() else None,
                 alpha2code=response.get("countryCode")
@@ -64,3 +154,17 @@ class LocationClient(BaseClient):
             )
 
         return None
+
+
+def get_location_client() -> Union[LocationClient, OfflineLocationClient]:
+    """
+    Получение клиента для получения данных о местонахождении
+    в соответствии с настройкой GEOCODER__PROVIDER.
+
+    :return:
+    """
+
+    if settings.geocoder.provider == "offline":
+        return OfflineLocationClient()
+
+    return LocationClient()
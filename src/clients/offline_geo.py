@@ -0,0 +1,340 @@
+"""
+Получение данных о местонахождении по локальному справочнику городов GeoNames
+(без запросов к внешним сервисам).
+
+Справочник загружается в k-мерное дерево (KD-tree) по координатам точек
+на единичной сфере, поэтому поиск ближайшего населенного пункта
+выполняется за логарифмическое время и учитывает переход через 180-й меридиан.
+"""
+import asyncio
+import io
+import math
+import zipfile
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+from clients.base.base import BaseClient
+from clients.shemas import LocalityDTO
+from settings import settings
+from utils.geo import EARTH_RADIUS
+
+#: точка на единичной сфере
+Point = tuple[float, float, float]
+
+
+class GazetteerEntry(NamedTuple):
+    """
+    Запись справочника населенных пунктов.
+    """
+
+    #: название
+    name: str
+    #: ISO Alpha2-код страны
+    country: str
+    #: численность населения
+    population: int
+
+
+def to_point(latitude: float, longitude: float) -> Point:
+    """
+    Преобразование географических координат в точку на единичной сфере.
+
+    :param latitude: Широта
+    :param longitude: Долгота
+    :return:
+    """
+
+    phi, lambda_ = math.radians(latitude), math.radians(longitude)
+
+    return (
+        math.cos(phi) * math.cos(lambda_),
+        math.cos(phi) * math.sin(lambda_),
+        math.sin(phi),
+    )
+
+
+def chord_to_distance(chord: float) -> float:
+    """
+    Преобразование длины хорды единичной сферы в расстояние по поверхности Земли.
+
+    :param chord: Длина хорды.
+    :return: Расстояние (в метрах).
+    """
+
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, chord / 2))
+
+
+class KDTree:
+    """
+    Дерево для поиска ближайшей точки в трехмерном пространстве.
+    Узлы хранятся в массивах, дерево строится по медианам координат.
+    """
+
+    def __init__(self, points: Sequence[Point]) -> None:
+        """
+        Построение дерева.
+
+        :param points: Точки (индексы точек используются как результаты поиска).
+        """
+
+        self.points = points
+        #: индекс точки, ось разбиения, левое и правое поддеревья (-1 – отсутствует)
+        self._index: list[int] = []
+        self._axis: list[int] = []
+        self._left: list[int] = []
+        self._right: list[int] = []
+        self._root = self._build(list(range(len(points))), 0)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _build(self, indexes: list[int], depth: int) -> int:
+        """
+        Построение поддерева.
+
+        :param indexes: Индексы точек поддерева.
+        :param depth: Глубина поддерева.
+        :return: Номер корневого узла поддерева.
+        """
+
+        if not indexes:
+            return -1
+
+        axis = depth % 3
+        indexes.sort(key=lambda index: self.points[index][axis])
+        median = len(indexes) // 2
+
+        node = len(self._index)
+        self._index.append(indexes[median])
+        self._axis.append(axis)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._left[node] = self._build(indexes[:median], depth + 1)
+        after = median + 1
+        self._right[node] = self._build(indexes[after:], depth + 1)
+
+        return node
+
+    def nearest(self, point: Point) -> tuple[int, float]:
+        """
+        Поиск ближайшей точки.
+
+        :param point: Точка поиска.
+        :return: Индекс ближайшей точки и расстояние до нее (-1, если дерево пустое).
+        """
+
+        best_index, best_distance = -1, math.inf
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                continue
+
+            index = self._index[node]
+            candidate = self.points[index]
+            distance = (
+                (candidate[0] - point[0]) ** 2
+                + (candidate[1] - point[1]) ** 2
+                + (candidate[2] - point[2]) ** 2
+            )
+            if distance < best_distance:
+                best_index, best_distance = index, distance
+
+            axis = self._axis[node]
+            delta = point[axis] - candidate[axis]
+            near, far = (
+                (self._left[node], self._right[node])
+                if delta < 0
+                else (self._right[node], self._left[node])
+            )
+            # дальнее поддерево проверяется, только если оно может содержать более близкую точку
+            if delta * delta < best_distance:
+                stack.append(far)
+            stack.append(near)
+
+        return best_index, math.sqrt(best_distance)
+
+
+class Gazetteer:
+    """
+    Справочник населенных пунктов с поиском ближайшего населенного пункта и города.
+    """
+
+    def __init__(self, entries: Sequence[tuple[float, float, GazetteerEntry]]) -> None:
+        """
+        Построение индексов справочника.
+
+        :param entries: Координаты и данные населенных пунктов.
+        """
+
+        self.localities = [entry for _, _, entry in entries]
+        self.locality_tree = KDTree(
+            [to_point(latitude, longitude) for latitude, longitude, _ in entries]
+        )
+        cities = [
+            (latitude, longitude, entry)
+            for latitude, longitude, entry in entries
+            if entry.population >= settings.geocoder.city_population
+        ]
+        self.cities = [entry for _, _, entry in cities]
+        self.city_tree = KDTree(
+            [to_point(latitude, longitude) for latitude, longitude, _ in cities]
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "Gazetteer":
+        """
+        Загрузка справочника из файла GeoNames (текстового или архива zip).
+
+        :param path: Путь к файлу.
+        :return:
+        """
+
+        return cls(list(cls._read(path)))
+
+    @staticmethod
+    def _read(path: Path) -> Iterator[tuple[float, float, GazetteerEntry]]:
+        """
+        Чтение записей файла GeoNames (формат описан в readme.txt справочника).
+
+        :param path: Путь к файлу.
+        :return: Координаты и данные населенных пунктов.
+        """
+
+        if zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                name = next(
+                    (item for item in archive.namelist() if item.endswith(".txt")),
+                    None,
+                )
+                if name is None:
+                    raise ValueError(f"No .txt file found in archive {path}")
+                with archive.open(name) as file:
+                    yield from Gazetteer._parse(io.TextIOWrapper(file, "utf-8"))
+        else:
+            with path.open(encoding="utf-8") as file:
+                yield from Gazetteer._parse(file)
+
+    @staticmethod
+    def _parse(lines: Iterator[str]) -> Iterator[tuple[float, float, GazetteerEntry]]:
+        """
+        Разбор строк файла GeoNames.
+
+        :param lines: Строки файла.
+        :return: Координаты и данные населенных пунктов.
+        """
+
+        for line in lines:
+            fields = line.rstrip("\n").split("\t")
+            if len(fields) < 15:
+                continue
+
+            yield float(fields[4]), float(fields[5]), GazetteerEntry(
+                name=fields[1],
+                country=fields[8],
+                population=int(fields[14] or 0),
+            )
+
+    def find(self, latitude: float, longitude: float) -> LocalityDTO:
+        """
+        Поиск ближайшего населенного пункта и города.
+        Если населенный пункт дальше GEOCODER__MAX_DISTANCE, данные не заполняются.
+
+        :param latitude: Широта
+        :param longitude: Долгота
+        :return:
+        """
+
+        point = to_point(latitude, longitude)
+        max_distance = settings.geocoder.max_distance
+
+        index, chord = self.locality_tree.nearest(point)
+        if index < 0 or chord_to_distance(chord) > max_distance:
+            return LocalityDTO()
+
+        locality = self.localities[index]
+        index, chord = self.city_tree.nearest(point)
+        city = (
+            self.cities[index]
+            if index >= 0 and chord_to_distance(chord) <= max_distance
+            else locality
+        )
+
+        return LocalityDTO(
+            city=_fit(city.name, 50),
+            alpha2code=_fit(locality.country, 2),
+            locality=_fit(locality.name, 255),
+        )
+
+
+def _fit(value: str, max_length: int) -> Optional[str]:
+    """
+    Приведение значения к ограничениям длины LocalityDTO.
+
+    :param value: Значение.
+    :param max_length: Максимальная длина.
+    :return: Значение или None, если оно короче двух символов.
+    """
+
+    return value[:max_length] if len(value) >= 2 else None
+
+
+# справочник населенных пунктов (загружается при запуске приложения)
+_gazetteer: Optional[Gazetteer] = None
+
+
+def get_gazetteer() -> Gazetteer:
+    """
+    Получение справочника населенных пунктов (загружается при первом обращении).
+
+    :return:
+    """
+
+    global _gazetteer  # pylint: disable=global-statement,invalid-name
+    if _gazetteer is None:
+        if not settings.geocoder.gazetteer_path:
+            raise RuntimeError("GEOCODER__GAZETTEER_PATH is not configured")
+
+        _gazetteer = Gazetteer.load(Path(settings.geocoder.gazetteer_path))
+
+    return _gazetteer
+
+
+async def load_gazetteer() -> None:
+    """
+    Загрузка справочника населенных пунктов при запуске приложения
+    (в отдельном потоке, чтобы не блокировать цикл событий).
+
+    :return:
+    """
+
+    await asyncio.to_thread(get_gazetteer)
+
+
+class OfflineLocationClient(BaseClient):
+    """
+    Получение данных о местонахождении по локальному справочнику городов.
+    Запросы к внешним сервисам не выполняются.
+    """
+
+    @property
+    def base_url(self) -> str:
+        return Path(settings.geocoder.gazetteer_path or "").resolve().as_uri()
+
+    async def _request(self, url: str) -> Optional[dict]:
+        # pylint: disable=unused-argument
+        # данные справочника находятся в памяти процесса
+        return None
+
+    async def get_location(
+        self, latitude: float, longitude: float
+    ) -> Optional[LocalityDTO]:
+        """
+        Получение данных о местонахождении по переданным координатам.
+
+        :param latitude: Широта
+        :param longitude: Долгота
+        :return:
+        """
+
+        return get_gazetteer().find(latitude, longitude)
@@ -0,0 +1,109 @@
+"""
+Загрузка любимых мест из файла в формате NDJSON или CSV.
+
+.. code-block:: shell
+
+    python -m commands.import_places places.ndjson
+    python -m commands.import_places places.csv --format csv --enrich
+"""
+import argparse
+import asyncio
+import logging.config
+from pathlib import Path
+from typing import AsyncIterator, Literal, cast
+
+from clients.base.base import close_http_client
+from integrations.db.session import async_session
+from services.enrichment_service import pending_enrichment
+from services.import_service import ImportService, ImportStats
+from utils.importing import iter_lines
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+#: размер части файла, читаемой за один раз (в байтах)
+READ_SIZE = 1024 * 1024
+
+
+async def read_file(path: Path) -> AsyncIterator[bytes]:
+    """
+    Постепенное чтение файла.
+
+    :param path: Путь к файлу.
+    :return: Части файла.
+    """
+
+    with path.open("rb") as file:
+        while chunk := file.read(READ_SIZE):
+            yield chunk
+
+
+def report_progress(stats: ImportStats) -> None:
+    """
+    Отображение хода загрузки.
+
+    :param stats: Счетчики загрузки.
+    :return:
+    """
+
+    logger.info(
+        "Processed %s rows: %s imported, %s invalid (%.0f rows/s).",
+        stats.total,
+        stats.imported,
+        stats.invalid,
+        stats.rows_per_second,
+    )
+
+
+async def main(
+    path: Path, import_format: Literal["ndjson", "csv"], enrich: bool
+) -> None:
+    """
+    Загрузка любимых мест из файла.
+
+    :param path: Путь к файлу.
+    :param import_format: Формат данных.
+    :param enrich: Обогащение объектов данными о местонахождении.
+    :return:
+    """
+
+    async with async_session() as session:
+        stats = await ImportService(session).import_places(
+            iter_lines(read_file(path)),
+            import_format,
+            enrich=enrich,
+            on_progress=report_progress,
+        )
+
+    for error in stats.errors:
+        logger.warning("Row %s: %s", error["row"], error["errors"])
+
+    if enrich:
+        # обогащение отмеченных объектов (если провайдер данных недоступен,
+        # оставшиеся объекты обрабатываются фоновым процессом приложения
+        # при включенной ENRICHMENT__PENDING_RELAY)
+        await pending_enrichment.drain()
+        await close_http_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Загрузка любимых мест из файла.")
+    parser.add_argument("path", type=Path, help="Путь к файлу")
+    parser.add_argument(
+        "--format",
+        choices=["ndjson", "csv"],
+        help="Формат данных (по умолчанию – по расширению файла)",
+    )
+    parser.add_argument(
+        "--enrich",
+        action="store_true",
+        help="Обогащение объектов данными о местонахождении",
+    )
+    args = parser.parse_args()
+
+    # значение ограничено вариантами choices
+    file_format = cast(
+        Literal["ndjson", "csv"],
+        args.format or ("csv" if args.path.suffix == ".csv" else "ndjson"),
+    )
+    asyncio.run(main(args.path, file_format, args.enrich))
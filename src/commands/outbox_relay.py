@@ -0,0 +1,36 @@
+"""
+Запуск публикации исходящих событий отдельным процессом.
+
+.. code-block:: shell
+
+    python -m commands.outbox_relay
+"""
+import asyncio
+import logging.config
+
+from integrations.events.producer import event_producer
+from services.outbox_service import outbox_relay
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+
+async def main() -> None:
+    """
+    Публикация исходящих событий до остановки процесса.
+
+    :return:
+    """
+
+    await event_producer.connect()
+    try:
+        await outbox_relay.run()
+    finally:
+        await event_producer.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Outbox relay stopped.")
@@ -38,6 +38,14 @@ class ObjectNotFoundException(ApiHTTPException):
     detail = "Объект не найден."
 
 
+class InvalidCursorException(ApiHTTPException):
+    """Некорректный курсор постраничной выборки."""
+
+    status_code = status.HTTP_400_BAD_REQUEST
+    code = "invalid_cursor"
+    detail = "Некорректный курсор постраничной выборки."
+
+
 class ForbiddenException(ApiHTTPException):
     """Доступ запрещен."""
 
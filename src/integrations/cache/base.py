@@ -0,0 +1,41 @@
+"""
+Интерфейс общего кэша (разделяемого между процессами приложения).
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class BaseCache(ABC):
+    """
+    Базовый абстрактный класс общего кэша.
+    Значения хранятся в виде строк, сериализация выполняется на стороне приложения.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Получение значения по ключу.
+
+        :param key: Ключ записи.
+        :return: Значение или None, если запись отсутствует или устарела.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """
+        Сохранение значения.
+
+        :param key: Ключ записи.
+        :param value: Значение.
+        :param ttl: Время жизни записи (в секундах).
+        :return:
+        """
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """
+        Удаление значений по ключам.
+
+        :param keys: Ключи записей.
+        :return:
+        """
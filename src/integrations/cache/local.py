@@ -0,0 +1,34 @@
+"""
+Реализация общего кэша в памяти процесса.
+Используется в тестах и при запуске одного процесса приложения
+вместо внешнего хранилища.
+"""
+from typing import Optional
+
+from integrations.cache.base import BaseCache
+from integrations.cache.memory import MemoryCache
+
+
+class LocalCache(BaseCache):
+    """
+    Общий кэш в памяти процесса.
+    """
+
+    def __init__(self, max_size: int = 10000) -> None:
+        """
+        Инициализация кэша.
+
+        :param max_size: Максимальное количество записей.
+        """
+
+        self.cache = MemoryCache(max_size=max_size, ttl=0)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        self.cache.set(key, value, ttl=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.cache.delete(key)
@@ -0,0 +1,108 @@
+"""
+Кэш в памяти процесса с вытеснением по LRU и временем жизни записей.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class CacheStats:
+    """
+    Счетчики обращений к кэшу.
+    """
+
+    def __init__(self) -> None:
+        #: количество попаданий
+        self.hits = 0
+        #: количество промахов
+        self.misses = 0
+        #: количество записей, вытесненных из-за ограничения размера
+        self.evictions = 0
+        #: количество записей, удаленных по истечении времени жизни
+        self.expirations = 0
+
+
+class MemoryCache:
+    """
+    Кэш в памяти процесса.
+    При превышении максимального размера вытесняются давно неиспользуемые записи.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """
+        Инициализация кэша.
+
+        :param max_size: Максимальное количество записей.
+        :param ttl: Время жизни записи по умолчанию (в секундах).
+        """
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Получение значения по ключу.
+
+        :param key: Ключ записи.
+        :return: Значение или None, если запись отсутствует или устарела.
+        """
+
+        item = self._data.get(key)
+        if item is None:
+            self.stats.misses += 1
+
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+
+            return None
+
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Сохранение значения.
+
+        :param key: Ключ записи.
+        :param value: Значение.
+        :param ttl: Время жизни записи (в секундах), по умолчанию – время жизни кэша.
+        :return:
+        """
+
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Удаление значения по ключу.
+
+        :param key: Ключ записи.
+        :return:
+        """
+
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Очистка кэша.
+
+        :return:
+        """
+
+        self._data.clear()
@@ -1,20 +1,125 @@
-from typing import AsyncGenerator
+import time
+from typing import Any, AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from settings import settings
 
-engine = create_async_engine(settings.database_url, echo=True, future=True)
+
+class PoolStats:
+    """
+    Статистика ожидания соединений из пула
+    (без учета времени установки новых соединений).
+    """
+
+    def __init__(self) -> None:
+        #: количество выданных соединений
+        self.checkouts = 0
+        #: суммарное время ожидания соединений (в секундах)
+        self.total_wait = 0.0
+        #: максимальное время ожидания соединения (в секундах)
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        """
+        Учет времени ожидания выданного соединения.
+
+        :param wait: Время ожидания (в секундах).
+        :return:
+        """
+
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+# статистика ожидания соединений для запросов API (общая для процесса)
+pool_stats = PoolStats()
+
+
+engine = create_async_engine(
+    settings.database_url,
+    echo=settings.database.echo,
+    future=True,
+    pool_size=settings.database.pool_size,
+    max_overflow=settings.database.max_overflow,
+    pool_timeout=settings.database.pool_timeout,
+    pool_recycle=settings.database.pool_recycle,
+    pool_pre_ping=settings.database.pool_pre_ping,
+    connect_args={
+        "prepared_statement_cache_size": settings.database.statement_cache_size
+    },
+)
+
+# фабрика сессий (общая для процесса)
+async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@event.listens_for(engine.sync_engine, "do_connect")
+def mark_connect_start(_dialect: Any, connection_record: Any, *_args: Any) -> None:
+    """
+    Запоминание времени начала установки нового соединения.
+
+    :param connection_record: Запись пула соединений.
+    :return:
+    """
+
+    connection_record.info["connect_started_at"] = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine.pool, "connect")
+def record_connect_time(_dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    Учет времени установки нового соединения
+    (вычитается из времени ожидания соединения из пула).
+
+    :param connection_record: Запись пула соединений.
+    :return:
+    """
+
+    started_at = connection_record.info.pop("connect_started_at", None)
+    if started_at is not None:
+        connection_record.info["connect_time"] = (
+            connection_record.info.get("connect_time", 0.0)
+            + time.perf_counter()
+            - started_at
+        )
+
+
+def get_pool_stats() -> dict:
+    """
+    Получение текущего состояния пула соединений и статистики ожидания.
+
+    :return:
+    """
+
+    pool = engine.sync_engine.pool
+
+    return {
+        "size": pool.size(),  # type: ignore
+        "checked_in": pool.checkedin(),  # type: ignore
+        "checked_out": pool.checkedout(),  # type: ignore
+        "overflow": pool.overflow(),  # type: ignore
+        "checkouts": pool_stats.checkouts,
+        "total_wait": pool_stats.total_wait,
+        "max_wait": pool_stats.max_wait,
+    }
 
 
 async def get_session() -> AsyncGenerator:
     """
     Получение объекта сессии для асинхронного подключения к БД.
+    Соединение выдается из пула сразу с учетом времени ожидания.
 
     :return:
     """
 
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with async_session() as session:
-        yield session
+    started_at = time.perf_counter()
+    async with engine.connect() as connection:
+        wait = time.perf_counter() - started_at
+        pool_stats.record(max(wait - connection.info.pop("connect_time", 0.0), 0.0))
+
+        async with async_session(bind=connection) as session:
+            yield session
@@ -0,0 +1,110 @@
+import logging.config
+from typing import Hashable, Iterable
+
+from integrations.events.producer import EventProducer, event_producer
+from settings import settings
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+
+class BatchStats:
+    """
+    Счетчики пакетной публикации сообщений.
+    """
+
+    def __init__(self) -> None:
+        #: количество отправленных пакетов
+        self.flushes = 0
+        #: количество неуспешных отправок пакетов
+        self.failed_flushes = 0
+        #: количество отправленных сообщений
+        self.messages = 0
+        #: объем отправленных сообщений (в байтах)
+        self.bytes = 0
+        #: количество сообщений, отброшенных как дубликаты
+        self.collapsed = 0
+        #: максимальный размер отправленного пакета
+        self.max_batch_size = 0
+
+
+class EventBatcher:
+    """
+    Публикация сообщений пакетами.
+    Пакеты ограничиваются по количеству сообщений и объему,
+    сообщения с одинаковым ключом публикуются один раз.
+    """
+
+    def __init__(
+        self,
+        queue_name: str,
+        producer: EventProducer = event_producer,
+        max_messages: int = settings.rabbitmq.batch.max_messages,
+        max_bytes: int = settings.rabbitmq.batch.max_bytes,
+    ) -> None:
+        """
+        Инициализация пакетной публикации.
+
+        :param queue_name: Название очереди.
+        :param producer: Продюсер событий.
+        :param max_messages: Максимальное количество сообщений в пакете.
+        :param max_bytes: Максимальный объем пакета (в байтах).
+        """
+
+        self.queue_name = queue_name
+        self.producer = producer
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.stats = BatchStats()
+
+    async def send(self, items: Iterable[tuple[Hashable, str]]) -> bool:
+        """
+        Немедленная отправка сообщений пакетами с подтверждением.
+        Сообщения с одинаковым ключом отправляются один раз,
+        пакеты ограничиваются по количеству сообщений и объему.
+
+        :param items: Пары из ключа для устранения дубликатов и данных сообщения.
+        :return: Признак успешной отправки всех сообщений.
+        """
+
+        unique: dict[Hashable, str] = {}
+        for key, body in items:
+            if key in unique:
+                self.stats.collapsed += 1
+            else:
+                unique[key] = body
+
+        batch: list[str] = []
+        size = 0
+        for body in unique.values():
+            if batch and (
+                len(batch) >= self.max_messages or size + len(body) > self.max_bytes
+            ):
+                if not await self._send(batch):
+                    return False
+                batch, size = [], 0
+
+            batch.append(body)
+            size += len(body)
+
+        return await self._send(batch) if batch else True
+
+    async def _send(self, bodies: list[str]) -> bool:
+        """
+        Публикация пакета сообщений и учет статистики.
+
+        :param bodies: Данные сообщений.
+        :return: Признак успешной отправки.
+        """
+
+        if not await self.producer.publish_many(self.queue_name, bodies):
+            self.stats.failed_flushes += 1
+
+            return False
+
+        self.stats.flushes += 1
+        self.stats.messages += len(bodies)
+        self.stats.bytes += sum(len(body) for body in bodies)
+        self.stats.max_batch_size = max(self.stats.max_batch_size, len(bodies))
+
+        return True
@@ -1,10 +1,16 @@
+import asyncio
 import logging.config
+import time
 from socket import error, gaierror
-from typing import Optional, Union
+from typing import Optional, Sequence, Union
 
-import pika
-from pika.adapters.blocking_connection import BlockingChannel
+import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.exceptions import AMQPError
+from aio_pika.pool import Pool
+from aiormq.exceptions import ChannelInvalidStateError
 
+from integrations.metrics import observe_publish
 from settings import settings
 
 logging.config.fileConfig("logging.conf")
@@ -14,31 +20,88 @@ logger = logging.getLogger()
 class EventProducer:
     """
     Функции публикации сообщений для коммуникации между микросервисами.
+    Использует одно постоянное подключение к RabbitMQ на процесс и пул каналов.
+    При разрыве подключение восстанавливается автоматически.
     """
 
-    def __init__(self, url: str = settings.rabbitmq.uri):
+    def __init__(
+        self,
+        url: str = settings.rabbitmq.uri,
+        channel_pool_size: int = settings.rabbitmq.channel_pool_size,
+    ):
         """
         Конструктор продюсера событий.
 
         :param url: Строка подключения к RabbitMQ.
+        :param channel_pool_size: Максимальное количество каналов в пуле.
         :return:
         """
 
-        self.channel: Optional[BlockingChannel] = None
-        params = pika.URLParameters(url)
-        try:
-            connection = pika.BlockingConnection(params)
-            self.channel = connection.channel()
-        except (error, gaierror):
-            logger.error("Error during connection establishing.", exc_info=True)
+        self.url = url
+        self.channel_pool_size = channel_pool_size
+        self.connection: Optional[AbstractRobustConnection] = None
+        self.channel_pool: Optional[Pool] = None
+        self._lock = asyncio.Lock()
+
+    async def connect(self) -> None:
+        """
+        Установка подключения к RabbitMQ.
+
+        :return:
+        """
+
+        async with self._lock:
+            if self.channel_pool is not None:
+                return
+
+            try:
+                self.connection = await aio_pika.connect_robust(
+                    self.url, timeout=settings.rabbitmq.connection_timeout
+                )
+            except (error, gaierror, asyncio.TimeoutError, AMQPError):
+                logger.error("Error during connection establishing.", exc_info=True)
+
+                return
+
+            self.channel_pool = Pool(
+                self._create_channel, max_size=self.channel_pool_size
+            )
+
+    async def close(self) -> None:
+        """
+        Закрытие пула каналов и подключения к RabbitMQ.
+
+        :return:
+        """
+
+        async with self._lock:
+            if self.channel_pool is not None:
+                await self.channel_pool.close()
+                self.channel_pool = None
+
+            if self.connection is not None:
+                await self.connection.close()
+                self.connection = None
+
+    async def _create_channel(self) -> AbstractChannel:
+        """
+        Создание канала для пула.
+
+        :return:
+        """
+
+        return await self.connection.channel(  # type: ignore
+            publisher_confirms=settings.rabbitmq.publisher_confirms
+        )
 
-    def publish(
+    async def publish(
         self,
         queue_name: str,
         body: Union[bytes, str],
     ) -> None:
         """
         Публикация сообщения в канал.
+        При включенном подтверждении публикации ожидается подтверждение от брокера.
 
         :param queue_name: Название очереди.
         :param body: Данные сообщения.
@@ -46,14 +109,88 @@ class EventProducer:
         """
 
         logger.info("Received data to publish (queue: '%s').", queue_name)
-        if not self.channel:
+        if await self._publish(queue_name, [body]):
+            logger.info("Successfully published event data: %s", body)
+
+    async def publish_many(
+        self,
+        queue_name: str,
+        bodies: Sequence[Union[bytes, str]],
+    ) -> bool:
+        """
+        Публикация пакета сообщений через один канал.
+        Подтверждения от брокера ожидаются для всего пакета одновременно.
+
+        :param queue_name: Название очереди.
+        :param bodies: Данные сообщений.
+        :return: Признак успешной публикации.
+        """
+
+        logger.info(
+            "Received %s messages to publish (queue: '%s').", len(bodies), queue_name
+        )
+        if published := await self._publish(queue_name, bodies):
+            logger.info("Successfully published %s messages.", len(bodies))
+
+        return published
+
+    async def _publish(
+        self, queue_name: str, bodies: Sequence[Union[bytes, str]]
+    ) -> bool:
+        """
+        Публикация сообщений в канал из пула.
+
+        :param queue_name: Название очереди.
+        :param bodies: Данные сообщений.
+        :return: Признак успешной публикации.
+        """
+
+        if self.channel_pool is None:
+            await self.connect()
+
+        if self.channel_pool is None:
             logger.warning("Channel is not created.")
 
-            return
+            return False
 
+        messages = [
+            aio_pika.Message(
+                body=body.encode() if isinstance(body, str) else body,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            )
+            for body in bodies
+        ]
+        started = time.perf_counter()
         try:
-            self.channel.basic_publish(exchange="", routing_key=queue_name, body=body)
-        except (error, gaierror, TypeError):
+            async with self.channel_pool.acquire() as channel:
+                # канал, закрытый после ошибки, остается в пуле и открывается повторно
+                if channel.is_closed:
+                    await channel.reopen()
+                await asyncio.gather(
+                    *(
+                        channel.default_exchange.publish(
+                            message, routing_key=queue_name
+                        )
+                        for message in messages
+                    )
+                )
+        except (
+            error,
+            gaierror,
+            asyncio.TimeoutError,
+            AMQPError,
+            ChannelInvalidStateError,
+            TypeError,
+        ):
             logger.error("Error during data publishing.", exc_info=True)
+            observe_publish(queue_name, "error", len(messages), started)
+
+            return False
+
+        observe_publish(queue_name, "success", len(messages), started)
+
+        return True
+
 
-        logger.info("Successfully published event data: %s", body)
+# продюсер событий (общий для процесса)
+event_producer = EventProducer()
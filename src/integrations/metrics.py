@@ -0,0 +1,232 @@
+"""
+Метрики приложения в формате Prometheus.
+
+Значения гистограмм и счетчиков обновляются в памяти процесса,
+данные формируются только при обращении к /metrics.
+"""
+import time
+from typing import Any, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+#: время обработки HTTP-запросов
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запросов.",
+    ["method", "route", "status"],
+)
+#: количество обрабатываемых HTTP-запросов
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress",
+    "Количество обрабатываемых HTTP-запросов.",
+    ["method"],
+)
+#: время выполнения запросов к БД (количество запросов – в счетчике гистограммы)
+db_statement_duration = Histogram(
+    "db_statement_duration_seconds",
+    "Время выполнения запросов к БД.",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+#: время запросов к внешним сервисам данных о местонахождении
+geocode_request_duration = Histogram(
+    "geocode_request_duration_seconds",
+    "Время запросов к внешним сервисам данных о местонахождении.",
+    ["provider", "outcome"],
+)
+#: время публикации сообщений в RabbitMQ
+publish_duration = Histogram(
+    "rabbitmq_publish_duration_seconds",
+    "Время публикации пакетов сообщений в RabbitMQ (с ожиданием подтверждения).",
+    ["queue", "outcome"],
+)
+#: количество опубликованных сообщений
+published_messages = Counter(
+    "rabbitmq_published_messages_total",
+    "Количество сообщений, опубликованных в RabbitMQ.",
+    ["queue", "outcome"],
+)
+
+#: операции запросов к БД, для остальных используется значение "other"
+DB_OPERATIONS = frozenset(
+    {"select", "insert", "update", "delete", "with", "begin", "commit", "rollback"}
+)
+
+
+class MetricsMiddleware:
+    """
+    Учет количества и времени обработки HTTP-запросов по шаблонам маршрутов.
+    Для запросов, не соответствующих маршрутам, используется шаблон "unmatched",
+    чтобы количество значений меток не зависело от переданных адресов.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Инициализация middleware.
+
+        :param app: Приложение ASGI.
+        """
+
+        self.app = app
+        #: шаблоны маршрутов по обработчикам (заполняются при первом обращении)
+        self._routes: Optional[dict[Any, str]] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = http_requests_in_progress.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            http_request_duration.labels(
+                method, self._route(scope), str(status)
+            ).observe(time.perf_counter() - started)
+
+    def _route(self, scope: Scope) -> str:
+        """
+        Получение шаблона маршрута по обработчику, выбранному маршрутизатором.
+
+        :param scope: Данные запроса ASGI.
+        :return:
+        """
+
+        if self._routes is None:
+            self._routes = {
+                getattr(route, "endpoint", None): getattr(route, "path", "")
+                for route in scope["app"].routes
+            }
+
+        return self._routes.get(scope.get("endpoint"), "unmatched")
+
+
+def observe_geocode(
+    provider: str, outcome: str, started: Optional[float] = None
+) -> None:
+    """
+    Учет запроса к внешнему сервису данных о местонахождении.
+
+    :param provider: Базовый адрес внешнего сервиса.
+    :param outcome: Результат запроса (success, error, cancelled, rejected).
+    :param started: Время начала запроса (по time.perf_counter),
+        для невыполненных запросов учитывается нулевая длительность.
+    :return:
+    """
+
+    geocode_request_duration.labels(provider, outcome).observe(
+        time.perf_counter() - started if started is not None else 0
+    )
+
+
+def observe_publish(queue: str, outcome: str, count: int, started: float) -> None:
+    """
+    Учет публикации пакета сообщений в RabbitMQ.
+
+    :param queue: Название очереди.
+    :param outcome: Результат публикации (success, error).
+    :param count: Количество сообщений в пакете.
+    :param started: Время начала публикации (по time.perf_counter).
+    :return:
+    """
+
+    publish_duration.labels(queue, outcome).observe(time.perf_counter() - started)
+    published_messages.labels(queue, outcome).inc(count)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Учет количества и времени выполнения запросов к БД через события SQLAlchemy.
+
+    :param engine: Подключение к БД.
+    :return:
+    """
+
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def _before_cursor_execute(conn: Connection, *_args: Any) -> None:
+    """
+    Запоминание времени начала выполнения запроса.
+
+    :param conn: Соединение с БД.
+    :return:
+    """
+
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection, _cursor: Any, statement: str, *_args: Any
+) -> None:
+    """
+    Учет времени выполнения запроса по виду операции.
+
+    :param conn: Соединение с БД.
+    :param statement: Текст запроса.
+    :return:
+    """
+
+    started = conn.info["query_started"].pop()
+    operation = statement.lstrip()[:8].split(None, 1)[0].lower() if statement else ""
+    db_statement_duration.labels(
+        operation if operation in DB_OPERATIONS else "other"
+    ).observe(time.perf_counter() - started)
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    """
+    Удаление времени начала запроса, завершившегося ошибкой
+    (событие after_cursor_execute для такого запроса не вызывается).
+
+    :param context: Контекст ошибки.
+    :return:
+    """
+
+    # контекст выполнения создается непосредственно перед событием before_cursor_execute
+    if context.connection is not None and context.execution_context is not None:
+        if started := context.connection.info.get("query_started"):
+            started.pop()
+
+
+async def metrics(request: Request) -> Response:  # pylint: disable=unused-argument
+    """
+    Получение метрик в текстовом формате Prometheus.
+
+    :param request: Объект запроса.
+    :return:
+    """
+
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,134 @@
+"""
+Профилирование обработки отдельных HTTP-запросов.
+"""
+import asyncio
+import cProfile
+import io
+import logging.config
+import pstats
+import random
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from settings import ProfilingConfig, settings
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+
+class ProfilingMiddleware:
+    """
+    Профилирование случайной доли запросов и запросов с отладочным заголовком.
+    Одновременно профилируется не более одного запроса, так как профилировщик
+    учитывает все вызовы в потоке, включая обработку других запросов
+    в том же цикле событий.
+    Результаты сохраняются в каталог в формате pstats (подходит для snakeviz,
+    flameprof, gprof2dot) вместе с текстовой сводкой наиболее затратных функций.
+    """
+
+    def __init__(
+        self, app: ASGIApp, config: ProfilingConfig = settings.profiling
+    ) -> None:
+        """
+        Инициализация middleware.
+
+        :param app: Приложение ASGI.
+        :param config: Конфигурация профилирования.
+        """
+
+        self.app = app
+        self.config = config
+        self.header = config.header.lower().encode()
+        self._active = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._active or not self._is_sampled(scope):
+            await self.app(scope, receive, send)
+
+            return
+
+        self._active = True
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            profiler.enable()
+        except ValueError:
+            # профилировщик уже запущен другим инструментом
+            self._active = False
+            await self.app(scope, receive, send)
+
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            self._active = False
+            elapsed = time.perf_counter() - started
+            try:
+                await asyncio.to_thread(self._dump, profiler, scope, elapsed)
+            except OSError:
+                logger.error("Error during profile saving.", exc_info=True)
+
+    def _is_sampled(self, scope: Scope) -> bool:
+        """
+        Проверка необходимости профилирования запроса.
+
+        :param scope: Данные запроса ASGI.
+        :return:
+        """
+
+        for name, value in scope["headers"]:
+            if name == self.header:
+                token = self.config.header_token
+
+                return token is None or value.decode() == token
+
+        return random.random() < self.config.sample_rate
+
+    def _dump(self, profiler: cProfile.Profile, scope: Scope, elapsed: float) -> Path:
+        """
+        Сохранение результатов профилирования и сводки наиболее затратных функций.
+
+        :param profiler: Профилировщик с результатами.
+        :param scope: Данные запроса ASGI.
+        :param elapsed: Время обработки запроса (в секундах).
+        :return: Путь к файлу с результатами профилирования.
+        """
+
+        directory = Path(self.config.output_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / (
+            f"{datetime.utcnow():%Y%m%dT%H%M%S%f}-{scope['method']}"
+            f"-{self._route_name(scope)}-{elapsed * 1000:.0f}ms.prof"
+        )
+        profiler.dump_stats(path)
+
+        summary = io.StringIO()
+        summary.write(f"{scope['method']} {scope['path']} {elapsed * 1000:.1f} ms\n\n")
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.config.top)
+        path.with_suffix(".txt").write_text(summary.getvalue(), encoding="utf-8")
+        logger.info("Request profile saved: %s", path)
+
+        return path
+
+    @staticmethod
+    def _route_name(scope: Scope) -> str:
+        """
+        Получение названия обработчика запроса для имени файла.
+
+        :param scope: Данные запроса ASGI.
+        :return:
+        """
+
+        endpoint: Optional[object] = scope.get("endpoint")
+        if endpoint is not None:
+            return getattr(endpoint, "__name__", "endpoint")
+
+        return re.sub(r"[^\w]+", "_", scope["path"]).strip("_") or "root"
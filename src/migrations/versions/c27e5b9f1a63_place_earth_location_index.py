@@ -0,0 +1,34 @@
+"""place earth location index
+
+Revision ID: c27e5b9f1a63
+Revises: a84d1e6c0f52
+Create Date: 2026-10-17 15:02:47.118530
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c27e5b9f1a63"
+down_revision = "a84d1e6c0f52"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # расширения для вычисления расстояний на поверхности Земли
+    op.execute("CREATE EXTENSION IF NOT EXISTS cube")
+    op.execute("CREATE EXTENSION IF NOT EXISTS earthdistance")
+    op.create_index(
+        "ix_place_earth_location",
+        "place",
+        [sa.text("ll_to_earth(latitude, longitude)")],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_place_earth_location", table_name="place")
+    op.execute("DROP EXTENSION IF EXISTS earthdistance")
+    op.execute("DROP EXTENSION IF EXISTS cube")
@@ -1 +1,4 @@
+from .enrichment import PendingEnrichment  # noqa: F401
+from .locations import LocationCache  # noqa: F401
+from .outbox import OutboxEvent  # noqa: F401
 from .places import Place  # noqa: F401
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, ForeignKey, Integer
+from sqlmodel import Field, SQLModel
+
+from models.mixins import TimeStampMixin
+
+
+class PendingEnrichment(SQLModel, TimeStampMixin, table=True):
+    """
+    Модель отметки о необходимости обогащения данных о любимом месте.
+    Записывается в одной транзакции с загрузкой мест,
+    обрабатывается и удаляется процессом фонового обогащения.
+    """
+
+    __tablename__ = "pending_enrichment"
+
+    place_id: int = Field(
+        title="Идентификатор места",
+        sa_column=Column(
+            Integer, ForeignKey("place.id", ondelete="CASCADE"), primary_key=True
+        ),
+    )
+    attempts: int = Field(title="Количество неуспешных попыток", default=0)
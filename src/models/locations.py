@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import Column, DateTime, Field, SQLModel
+
+from models.mixins import TimeStampMixin
+
+
+class LocationCache(SQLModel, TimeStampMixin, table=True):
+    """
+    Модель для хранения результатов определения местонахождения по координатам.
+    Координаты округляются до точности, заданной в настройках кэша.
+    Запись без страны и города означает, что провайдер не вернул данных.
+    """
+
+    __tablename__ = "location_cache"
+
+    latitude: float = Field(title="Широта", primary_key=True)
+    longitude: float = Field(title="Долгота", primary_key=True)
+    country: Optional[str] = Field(
+        title="ISO Alpha2-код страны", min_length=2, max_length=2
+    )
+    city: Optional[str] = Field(title="Название города", min_length=2, max_length=50)
+    locality: Optional[str] = Field(
+        title="Местонахождение", min_length=2, max_length=255
+    )
+    expires_at: datetime = Field(
+        title="Дата и время устаревания записи",
+        sa_column=Column(DateTime, nullable=False, index=True),
+    )
@@ -0,0 +1,19 @@
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+from models.mixins import TimeStampMixin
+
+
+class OutboxEvent(SQLModel, TimeStampMixin, table=True):
+    """
+    Модель события, ожидающего публикации в брокер сообщений.
+    Записывается в одной транзакции с изменением данных,
+    публикуется и удаляется отдельным процессом.
+    """
+
+    __tablename__ = "outbox_event"
+
+    id: Optional[int] = Field(title="Идентификатор", default=None, primary_key=True)
+    queue: str = Field(title="Название очереди", max_length=255)
+    payload: str = Field(title="Данные сообщения")
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
 from models.mixins import TimeStampMixin
@@ -10,6 +11,17 @@ class Place(SQLModel, TimeStampMixin, table=True):
     Модель для описания места.
     """
 
+    __table_args__ = (
+        # пространственный индекс для поиска ближайших мест (расширение earthdistance)
+        Index(
+            "ix_place_earth_location",
+            text("ll_to_earth(latitude, longitude)"),
+            postgresql_using="gist",
+        ),
+        # индекс для постраничной выборки в порядке создания
+        Index("ix_place_created_at_id", "created_at", "id"),
+    )
+
     id: Optional[int] = Field(title="Идентификатор", default=None, primary_key=True)
     latitude: float = Field(title="Широта")
     longitude: float = Field(title="Долгота")
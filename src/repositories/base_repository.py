@@ -1,16 +1,63 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Type, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from pydantic.main import BaseModel
-from sqlalchemy import Column, insert, update
+from sqlalchemy import (
+    Column,
+    Integer,
+    Table,
+    bindparam,
+    column,
+    delete,
+    insert,
+    literal,
+    table,
+    text,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.engine import CursorResult, Result, Row
-from sqlalchemy.exc import NoResultFound
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql import Executable
+from sqlalchemy.sql.dml import Insert, Update
+from sqlalchemy.sql.elements import ColumnElement
 from sqlmodel import SQLModel, select
 from sqlmodel.sql.expression import SelectOfScalar
 
+from repositories.pagination import (
+    Cursor,
+    InvalidCursorError,
+    Page,
+    decode_cursor,
+    encode_cursor,
+)
 
-class BaseRepository(ABC):
+#: максимальное количество параметров в одном запросе (ограничение протокола PostgreSQL)
+MAX_QUERY_PARAMETERS = 32767
+
+# шаблоны запросов с параметрами по моделям, видам запросов и наборам условий
+# (общие для процесса; количество ограничено вариантами вызовов в коде)
+_statements: dict[tuple, Executable] = {}
+
+#: модель таблицы репозитория
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+class BaseRepository(ABC, Generic[ModelT]):
     """
     Базовый абстрактный класс репозитория.
     """
@@ -26,11 +73,21 @@ class BaseRepository(ABC):
 
     @property
     @abstractmethod
-    def model(self) -> Type[SQLModel]:
+    def model(self) -> Type[ModelT]:
         """
         Модель таблицы.
         """
 
+    @property
+    def table(self) -> Table:
+        """
+        Таблица модели.
+
+        :return:
+        """
+
+        return self.model.__table__  # type: ignore
+
     def get_attr(self, attr: str) -> Column:
         """
         Получение атрибута модели по наименованию.
@@ -41,29 +98,148 @@ class BaseRepository(ABC):
 
         return getattr(self.model, attr)
 
-    def _select(self, **kwargs: Any) -> SelectOfScalar:
+    def _where(self, **kwargs: Any) -> Optional[ColumnElement]:
         """
-        Формирование выборки с условиями.
+        Формирование условия выборки.
+        Для списков значений формируется условие вхождения (IN).
 
         :param kwargs: Аргументы для формирования условий выборки.
-        :return:
+        :return: Условие или None, если аргументы не переданы.
         """
 
-        query = select(self.model)
         condition = None
         for attr, value in kwargs.items():
-            expression = self.get_attr(attr) == value
+            expression = (
+                self.get_attr(attr).in_(value)
+                if isinstance(value, (list, tuple, set))
+                else self.get_attr(attr) == value
+            )
             if condition is not None:
                 condition &= expression
             else:
                 condition = expression
 
+        return condition
+
+    @staticmethod
+    def _signature(kwargs: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+        """
+        Получение набора условий выборки без значений.
+        Для значения None формируется условие IS NULL, для списков – условие вхождения.
+
+        :param kwargs: Аргументы для формирования условий выборки.
+        :return: Пары из названия атрибута и вида условия (eq, in, null).
+        """
+
+        return tuple(
+            sorted(
+                (
+                    attr,
+                    "null"
+                    if value is None
+                    else "in"
+                    if isinstance(value, (list, tuple, set))
+                    else "eq",
+                )
+                for attr, value in kwargs.items()
+            )
+        )
+
+    @staticmethod
+    def _params(kwargs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Получение значений параметров шаблона запроса.
+
+        :param kwargs: Аргументы для формирования условий выборки.
+        :return:
+        """
+
+        return {
+            f"where_{attr}": list(value) if isinstance(value, (set, tuple)) else value
+            for attr, value in kwargs.items()
+            if value is not None
+        }
+
+    def _where_template(
+        self, signature: tuple[tuple[str, str], ...]
+    ) -> Optional[ColumnElement]:
+        """
+        Формирование условия выборки с параметрами вместо значений.
+
+        :param signature: Набор условий выборки.
+        :return: Условие или None, если условия не переданы.
+        """
+
+        condition: Optional[ColumnElement] = None
+        for attr, kind in signature:
+            field = self.get_attr(attr)
+            if kind == "null":
+                expression = field.is_(None)
+            elif kind == "in":
+                expression = field.in_(bindparam(f"where_{attr}", expanding=True))
+            else:
+                expression = field == bindparam(f"where_{attr}")
+            condition = expression if condition is None else condition & expression
+
+        return condition
+
+    def _template(
+        self,
+        kind: str,
+        kwargs: dict[str, Any],
+        build: Callable[[Optional[ColumnElement]], Executable],
+        *key: Any,
+    ) -> tuple[Executable, dict[str, Any]]:
+        """
+        Получение шаблона запроса для набора условий (создается при первом обращении).
+        Повторно используемый запрос не строится заново, а ключ кэша
+        скомпилированных запросов SQLAlchemy вычисляется для него один раз.
+
+        :param kind: Вид запроса.
+        :param kwargs: Аргументы для формирования условий выборки.
+        :param build: Функция построения запроса по условию с параметрами.
+        :param key: Дополнительные значения, определяющие запрос.
+        :return: Запрос и значения его параметров.
+        """
+
+        signature = self._signature(kwargs)
+        cache_key = (self.model, kind, signature, *key)
+        if (statement := _statements.get(cache_key)) is None:
+            statement = _statements[cache_key] = build(self._where_template(signature))
+
+        return statement, self._params(kwargs)
+
+    def _select_template(self, **kwargs: Any) -> tuple[Executable, dict[str, Any]]:
+        """
+        Получение шаблона выборки с условиями.
+
+        :param kwargs: Аргументы для формирования условий выборки.
+        :return: Запрос и значения его параметров.
+        """
+
+        def build(condition: Optional[ColumnElement]) -> Executable:
+            query = select(self.model)
+
+            return query.where(condition) if condition is not None else query
+
+        return self._template("select", kwargs, build)
+
+    def _select(self, **kwargs: Any) -> SelectOfScalar:
+        """
+        Формирование выборки с условиями.
+
+        :param kwargs: Аргументы для формирования условий выборки.
+        :return:
+        """
+
+        query = select(self.model)
+        condition = self._where(**kwargs)
         if condition is not None:
             query = query.where(condition)
 
         return query
 
-    async def find(self, primary_key: int) -> Optional[Row]:
+    async def find(self, primary_key: int) -> Optional[ModelT]:
         """
         Поиск объекта по его идентификатору.
 
@@ -71,7 +247,7 @@ class BaseRepository(ABC):
         :return:
         """
 
-        cursor = await self.session.execute(self._select(id=primary_key))
+        cursor = await self.session.execute(*self._select_template(id=primary_key))
         return cursor.scalar()
 
     async def find_all_by(
@@ -92,67 +268,458 @@ class BaseRepository(ABC):
         :return:
         """
 
-        order_by = order_by or self.get_attr("id")
-        query = self._select(**kwargs).order_by(order_by).limit(limit).offset(offset)
-        cursor = await self.session.execute(query)
+        order_by = order_by if order_by is not None else self.get_attr("id")
+        if not isinstance(order_by, (InstrumentedAttribute, Column)):
+            # шаблоны создаются только для сортировки по атрибутам модели,
+            # т.к. выражения сортировки создаются заново при каждом вызове
+            query = self._select(**kwargs).order_by(order_by).limit(limit)
+            cursor = await self.session.execute(query.offset(offset))
+
+            return cursor.scalars().all()
+
+        def build(condition: Optional[ColumnElement]) -> Executable:
+            query = select(self.model)
+            if condition is not None:
+                query = query.where(condition)
+
+            return (
+                query.order_by(order_by)
+                .limit(bindparam("limit", type_=Integer))
+                .offset(bindparam("offset", type_=Integer))
+            )
+
+        statement, params = self._template("find_all_by", kwargs, build, order_by)
+        cursor = await self.session.execute(
+            statement, {**params, "limit": limit, "offset": offset or 0}
+        )
 
         return cursor.scalars().all()
 
+    async def stream_by(
+        self,
+        *,
+        chunk_size: int,
+        order_by: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[list]:
+        """
+        Потоковый поиск объектов по заданным параметрам.
+        Строки читаются через курсор на стороне сервера частями,
+        поэтому потребление памяти не зависит от размера выборки.
+
+        :param chunk_size: Количество объектов в одной части
+        :param order_by: Сортировка (по умолчанию - ID)
+        :param kwargs: Условия для выборки
+        :return: Части выборки в порядке сортировки.
+        """
+
+        query = (
+            self._select(**kwargs)
+            .order_by(order_by if order_by is not None else self.get_attr("id"))
+            .execution_options(yield_per=chunk_size)
+        )
+        result: AsyncResult = await self.session.stream(query)
+        # в заглушках типов SQLAlchemy partitions() описан как корутина,
+        # но возвращает асинхронный генератор
+        partitions = cast(AsyncIterator[list], result.scalars().partitions(chunk_size))
+        async for partition in partitions:
+            yield partition
+
+    async def find_page_by(  # pylint: disable=too-many-locals
+        self,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        order_by: Sequence[str] = ("id",),
+        descending: bool = False,
+        **kwargs: Any,
+    ) -> Page:
+        """
+        Постраничный поиск объектов по ключу сортировки (keyset pagination).
+        Вместо смещения выборка продолжается с граничного элемента предыдущей страницы,
+        поэтому время получения страницы не зависит от ее номера.
+
+        :param limit: Лимит на количество элементов на странице
+        :param cursor: Курсор страницы (по умолчанию - первая страница)
+        :param order_by: Атрибуты сортировки (ID добавляется для уникальности ключа)
+        :param descending: Сортировка по убыванию
+        :param kwargs: Условия для выборки
+        :return:
+        """
+
+        keys = [*order_by, "id"] if "id" not in order_by else list(order_by)
+        columns = [self.get_attr(key) for key in keys]
+
+        direction = "next"
+        query = self._select(**kwargs)
+        if cursor is not None:
+            position = decode_cursor(
+                cursor, [column.type.python_type for column in columns]
+            )
+            if position.order_by != keys or position.descending != descending:
+                raise InvalidCursorError(cursor)
+
+            direction = position.direction
+            # для предыдущей страницы выборка идет в обратном порядке
+            forward = descending == (direction == "prev")
+            boundary: ColumnElement = tuple_(*columns)
+            query = query.where(
+                boundary > tuple_(*position.values)
+                if forward
+                else boundary < tuple_(*position.values)
+            )
+
+        reverse = descending != (direction == "prev")
+        query = query.order_by(
+            *(column.desc() if reverse else column.asc() for column in columns)
+        ).limit(limit + 1)
+        items = (await self.session.execute(query)).scalars().all()
+
+        has_more = len(items) > limit
+        items = items[:limit]
+        if direction == "prev":
+            items.reverse()
+
+        has_next = has_more if direction == "next" else cursor is not None
+        has_prev = has_more if direction == "prev" else cursor is not None
+
+        return Page(
+            items=items,
+            next_cursor=encode_cursor(
+                Cursor(
+                    [getattr(items[-1], key) for key in keys], "next", keys, descending
+                )
+            )
+            if items and has_next
+            else None,
+            prev_cursor=encode_cursor(
+                Cursor(
+                    [getattr(items[0], key) for key in keys], "prev", keys, descending
+                )
+            )
+            if items and has_prev
+            else None,
+        )
+
     async def create_model(self, model: Union[Dict, BaseModel]) -> Optional[int]:
         """
         Создание записи.
 
+        :param model: Данные модели для создания.
+        :return: Идентификатор созданной записи.
+        """
+
+        cursor: Result = await self.session.execute(
+            self._insert_statement(model).returning(self.get_attr("id"))
+        )
+
+        result = cursor.fetchone()
+
+        return result.id if result else None
+
+    async def create_model_returning(
+        self, model: Union[Dict, BaseModel]
+    ) -> Optional[ModelT]:
+        """
+        Создание записи с возвратом созданной записи целиком (RETURNING *).
+
+        :param model: Данные модели для создания.
+        :return: Объект созданной записи.
+        """
+
+        return await self._fetch_model(self._insert_statement(model))
+
+    def _insert_statement(self, model: Union[Dict, BaseModel]) -> Insert:
+        """
+        Формирование запроса на создание записи.
+
         :param model: Данные модели для создания.
         :return:
         """
 
-        values = (
+        data = (
             model
             if isinstance(model, dict)
             else model.dict(exclude={"id"}, exclude_none=True)
         )
+
+        return insert(self.model).values(**data)
+
+    async def create_many(self, models: Sequence[Union[Dict, BaseModel]]) -> list[int]:
+        """
+        Создание записей многострочными запросами INSERT ... VALUES ... RETURNING.
+        Записи с одинаковым набором атрибутов создаются одним запросом
+        (с разбиением на части по ограничению количества параметров запроса).
+
+        :param models: Данные моделей для создания.
+        :return: Идентификаторы созданных записей в порядке переданных данных.
+        """
+
+        rows = [
+            model
+            if isinstance(model, dict)
+            else model.dict(exclude={"id"}, exclude_none=True)
+            for model in models
+        ]
+        # группировка по набору атрибутов, т.к. строки одного запроса
+        # должны содержать одинаковые атрибуты
+        groups: dict[tuple, list[int]] = {}
+        for index, row in enumerate(rows):
+            groups.setdefault(tuple(row), []).append(index)
+
+        # значения по умолчанию также передаются параметрами запроса
+        chunk_size = MAX_QUERY_PARAMETERS // len(self.table.columns)
+        primary_keys: list[int] = [0] * len(rows)
+        for indexes in groups.values():
+            for start in range(0, len(indexes), chunk_size):
+                end = start + chunk_size
+                chunk = indexes[start:end]
+                cursor: Result = await self.session.execute(
+                    insert(self.model)
+                    .values([rows[index] for index in chunk])
+                    .returning(self.get_attr("id"))
+                )
+                # PostgreSQL возвращает строки в порядке перечисления в VALUES
+                for index, result in zip(chunk, cursor.fetchall()):
+                    primary_keys[index] = result.id
+
+        return primary_keys
+
+    async def copy_many(
+        self,
+        models: Sequence[Union[Dict, BaseModel]],
+        returning: Sequence[str] = ("id",),
+    ) -> list[Row]:
+        """
+        Создание записей через протокол COPY.
+        Данные загружаются во временную таблицу (без индексов и ограничений),
+        после чего переносятся в основную таблицу одним запросом INSERT ... SELECT.
+        Значения по умолчанию, вычисляемые на стороне приложения, заполняются при загрузке.
+
+        :param models: Данные моделей для создания.
+        :param returning: Атрибуты созданных записей для возврата.
+        :return: Созданные записи в порядке переданных данных.
+        """
+
+        model_table = self.table
+        columns = [item for item in model_table.columns if not item.primary_key]
+        names = [item.name for item in columns]
+        records = []
+        for model in models:
+            data = model if isinstance(model, dict) else model.dict()
+            records.append(
+                tuple(
+                    self._default_value(item)
+                    if data.get(item.name) is None
+                    else data[item.name]
+                    for item in columns
+                )
+            )
+
+        staging = f"{model_table.name}_staging"
+        # временная таблица удаляется и при откате транзакции
+        await self.session.execute(
+            text(
+                f"CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS "
+                f"SELECT {', '.join(names)} FROM {model_table.name} WITH NO DATA"
+            )
+        )
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            staging, records=records, columns=names
+        )
+
         cursor: Result = await self.session.execute(
-            insert(self.model).values(**values).returning(self.get_attr("id"))
+            insert(self.model)
+            .from_select(
+                names, select(table(staging, *(column(name) for name in names)))
+            )
+            .returning(*(self.get_attr(name) for name in returning))
         )
+        rows = cursor.fetchall()
+        await self.session.execute(text(f"DROP TABLE {staging}"))
 
-        result = cursor.fetchone()
+        return rows
 
-        return result.id if result else None
+    @staticmethod
+    def _default_value(model_column: Column) -> Any:
+        """
+        Получение значения по умолчанию для колонки, вычисляемого на стороне приложения.
+
+        :param model_column: Колонка таблицы.
+        :return:
+        """
+
+        default = model_column.default
+        if default is None:
+            return None
+
+        return default.arg(None) if default.is_callable else default.arg
 
     async def update_model(self, primary_key: int, **kwargs: Any) -> Optional[int]:
         """
         Обновление записи.
 
+        :param primary_key: Первичный ключ
+        :param kwargs: Атрибуты и их значения
+        :return: Количество обновленных строк.
+        """
+
+        result = cast(
+            CursorResult,
+            await self.session.execute(self._update_statement(primary_key, **kwargs)),
+        )
+
+        return result.rowcount if result else None
+
+    async def update_model_returning(
+        self, primary_key: int, **kwargs: Any
+    ) -> Optional[ModelT]:
+        """
+        Обновление записи с возвратом обновленной записи целиком (RETURNING *).
+
+        :param primary_key: Первичный ключ
+        :param kwargs: Атрибуты и их значения
+        :return: Объект обновленной записи или None, если запись не найдена.
+        """
+
+        return await self._fetch_model(self._update_statement(primary_key, **kwargs))
+
+    def _update_statement(self, primary_key: int, **kwargs: Any) -> Update:
+        """
+        Формирование запроса на обновление записи.
+
         :param primary_key: Первичный ключ
         :param kwargs: Атрибуты и их значения
         :return:
         """
 
-        statement = (
+        return (
             update(self.model)
             .where(self.get_attr("id") == primary_key)
             .values(**kwargs)
         )
 
-        result: CursorResult = await self.session.execute(statement)  # type: ignore
+    async def update_many(  # pylint: disable=too-many-locals
+        self,
+        items: Sequence[Dict[str, Any]],
+        previous: Sequence[str] = (),
+        match: Sequence[str] = (),
+    ) -> list[tuple[ModelT, Dict[str, Any]]]:
+        """
+        Обновление записей запросами UPDATE ... FROM (VALUES ...) RETURNING.
+        Записи с одинаковым набором изменяемых атрибутов обновляются одним запросом
+        (с разбиением на части по ограничению количества параметров запроса).
+
+        :param items: Значения атрибутов записей (обязательно с идентификатором "id").
+        :param previous: Атрибуты, значения которых до обновления требуется вернуть.
+        :param match: Атрибуты, значения которых в записи должны совпадать
+            с переданными (не изменяются; иначе запись не обновляется).
+        :return: Обновленные записи и значения атрибутов до обновления
+            (записи, которые не найдены, не возвращаются).
+        """
 
-        return result.rowcount if result else None
+        model_table = self.table
+        previous_table = model_table.alias("previous")
+        groups: dict[tuple, list[Dict[str, Any]]] = {}
+        for item in items:
+            attrs = tuple(attr for attr in item if attr != "id" and attr not in match)
+            if attrs:
+                groups.setdefault(attrs, []).append(item)
+
+        results = []
+        for attrs, group in groups.items():
+            names = ["id", *match, *attrs]
+            # в каждой строке VALUES значения приводятся к типам колонок,
+            # иначе PostgreSQL определит их как текст
+            types = [model_table.c[name].type for name in names]
+            chunk_size = (MAX_QUERY_PARAMETERS - 1) // len(names)
+            for start in range(0, len(group), chunk_size):
+                end = start + chunk_size
+                data = values(
+                    *(column(name, type_) for name, type_ in zip(names, types)),
+                    name="data",
+                ).data(
+                    [
+                        tuple(
+                            literal(item[name], type_).cast(type_)
+                            for name, type_ in zip(names, types)
+                        )
+                        for item in group[start:end]
+                    ]
+                )
+                statement = (
+                    update(model_table)
+                    .where(model_table.c.id == data.c.id)
+                    .where(*(model_table.c[attr] == data.c[attr] for attr in match))
+                    .values({attr: data.c[attr] for attr in attrs})
+                )
+                if previous:
+                    # соединение с самой таблицей возвращает значения до обновления
+                    statement = statement.where(previous_table.c.id == model_table.c.id)
+                statement = statement.returning(
+                    *model_table.columns,
+                    *(
+                        previous_table.c[attr].label(f"previous_{attr}")
+                        for attr in previous
+                    ),
+                )
+
+                cursor: Result = await self.session.execute(statement)
+                for mapping in cursor.mappings().fetchall():
+                    results.append(
+                        (
+                            self.model(
+                                **{
+                                    item.name: mapping[item]
+                                    for item in model_table.columns
+                                }
+                            ),
+                            {attr: mapping[f"previous_{attr}"] for attr in previous},
+                        )
+                    )
+
+        return results
+
+    async def _fetch_model(self, statement: Union[Insert, Update]) -> Optional[ModelT]:
+        """
+        Выполнение запроса на изменение с возвратом записи (RETURNING *)
+        и создание объекта модели из полученных данных без повторной выборки.
 
-    async def delete_by(self, **kwargs: Any) -> None:
+        :param statement: Запрос на создание или обновление записи.
+        :return: Объект записи или None, если запись не найдена.
         """
-        Удаление записи по переданному условию.
 
-        :param kwargs: Значения атрибутов
-        :return:
+        cursor: Result = await self.session.execute(
+            statement.returning(*self.table.columns)
+        )
+        row = cursor.mappings().fetchone()
+
+        return self.model.parse_obj(row) if row else None
+
+    async def delete_by(self, **kwargs: Any) -> list[int]:
+        """
+        Удаление записей по переданному условию одним запросом (DELETE ... RETURNING).
+        Объекты сессии не синхронизируются, удаленные записи не должны использоваться далее.
+
+        :param kwargs: Значения атрибутов (для списков значений – условие вхождения)
+        :return: Идентификаторы удаленных записей.
         """
 
-        statement = self._select(**kwargs)
-        result = await self.session.execute(statement)
-        try:
-            row = result.scalar_one()
-            await self.session.delete(row)
+        if not kwargs:
+            raise ValueError("Deletion without condition is not allowed")
 
-            return row.id
-        except NoResultFound:
+        def build(condition: Optional[ColumnElement]) -> Executable:
+            return (
+                delete(self.model)
+                .where(condition)
+                .returning(self.get_attr("id"))
+                .execution_options(synchronize_session=False)
+            )
 
-            return None
+        cursor: Result = await self.session.execute(
+            *self._template("delete_by", kwargs, build)
+        )
+
+        return [row.id for row in cursor.fetchall()]
@@ -0,0 +1,92 @@
+from typing import Type
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+
+from models import PendingEnrichment, Place
+from repositories.base_repository import BaseRepository
+
+
+class PendingEnrichmentRepository(BaseRepository[PendingEnrichment]):
+    """
+    Репозиторий для отметок о необходимости обогащения данных о любимых местах.
+    """
+
+    @property
+    def model(self) -> Type[PendingEnrichment]:
+        return PendingEnrichment
+
+    async def add_many(self, place_ids: list[int]) -> None:
+        """
+        Отметка мест для обогащения данных (повторные отметки игнорируются).
+
+        :param place_ids: Идентификаторы мест.
+        :return:
+        """
+
+        if not place_ids:
+            return
+
+        await self.session.execute(
+            insert(self.model).on_conflict_do_nothing(),
+            [{"place_id": place_id} for place_id in place_ids],
+        )
+
+    async def lock_pending(self, limit: int) -> list[Row]:
+        """
+        Получение и блокировка самых ранних отметок вместе с координатами мест.
+        Записи, заблокированные другими процессами, пропускаются,
+        поэтому несколько процессов могут обрабатывать отметки параллельно.
+
+        :param limit: Ограничение на количество отметок.
+        :return: Строки с идентификатором места, координатами и количеством попыток.
+        """
+
+        query = (
+            select(
+                self.get_attr("place_id"),
+                self.get_attr("attempts"),
+                Place.latitude,
+                Place.longitude,
+            )
+            .join(Place, Place.id == self.get_attr("place_id"))
+            .order_by(self.get_attr("place_id"))
+            .limit(limit)
+            .with_for_update(of=self.table, skip_locked=True)
+        )
+        cursor = await self.session.execute(query)
+
+        return cursor.all()
+
+    async def retry_many(self, place_ids: list[int]) -> None:
+        """
+        Учет неуспешной попытки обогащения данных.
+
+        :param place_ids: Идентификаторы мест.
+        :return:
+        """
+
+        if not place_ids:
+            return
+
+        await self.session.execute(
+            update(self.table)
+            .where(self.table.c.place_id.in_(place_ids))
+            .values(attempts=self.table.c.attempts + 1)
+        )
+
+    async def delete_many(self, place_ids: list[int]) -> None:
+        """
+        Удаление отметок по идентификаторам мест.
+
+        :param place_ids: Идентификаторы мест.
+        :return:
+        """
+
+        if not place_ids:
+            return
+
+        await self.session.execute(
+            delete(self.table).where(self.table.c.place_id.in_(place_ids))
+        )
@@ -0,0 +1,102 @@
+from datetime import datetime
+from typing import Optional, Sequence, Type, cast
+
+from sqlalchemy import delete, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import CursorResult
+
+from models import LocationCache
+from repositories.base_repository import MAX_QUERY_PARAMETERS, BaseRepository
+
+
+class LocationCacheRepository(BaseRepository[LocationCache]):
+    """
+    Репозиторий для кэша данных о местонахождении.
+    """
+
+    @property
+    def model(self) -> Type[LocationCache]:
+        return LocationCache
+
+    async def find_actual(
+        self, latitude: float, longitude: float
+    ) -> Optional[LocationCache]:
+        """
+        Поиск неустаревшей записи по округленным координатам.
+
+        :param latitude: Широта
+        :param longitude: Долгота
+        :return:
+        """
+
+        query = self._select(latitude=latitude, longitude=longitude).where(
+            self.get_attr("expires_at") > datetime.utcnow()
+        )
+        cursor = await self.session.execute(query)
+
+        return cursor.scalar()
+
+    async def find_actual_many(
+        self, coordinates: Sequence[tuple[float, float]]
+    ) -> list[LocationCache]:
+        """
+        Поиск неустаревших записей по списку округленных координат.
+
+        :param coordinates: Пары широты и долготы
+        :return:
+        """
+
+        result = []
+        chunk_size = MAX_QUERY_PARAMETERS // 2 - 1
+        for start in range(0, len(coordinates), chunk_size):
+            end = start + chunk_size
+            query = self._select().where(
+                tuple_(self.get_attr("latitude"), self.get_attr("longitude")).in_(
+                    coordinates[start:end]
+                ),
+                self.get_attr("expires_at") > datetime.utcnow(),
+            )
+            cursor = await self.session.execute(query)
+            result.extend(cursor.scalars().all())
+
+        return result
+
+    async def upsert_many(self, rows: Sequence[dict]) -> None:
+        """
+        Создание записей или обновление существующих записей с теми же координатами.
+        Все записи должны содержать одинаковый набор атрибутов и различные координаты.
+
+        :param rows: Атрибуты и их значения
+        :return:
+        """
+
+        chunk_size = MAX_QUERY_PARAMETERS // (len(self.table.columns) + 1)
+        for start in range(0, len(rows), chunk_size):
+            end = start + chunk_size
+            statement = insert(self.model).values(list(rows[start:end]))
+            statement = statement.on_conflict_do_update(
+                index_elements=[self.get_attr("latitude"), self.get_attr("longitude")],
+                set_={
+                    **{key: statement.excluded[key] for key in rows[0]},
+                    "updated_at": datetime.utcnow(),
+                },
+            )
+            await self.session.execute(statement)
+
+    async def delete_expired(self) -> int:
+        """
+        Удаление устаревших записей.
+
+        :return: Количество удаленных записей.
+        """
+
+        cursor = cast(
+            CursorResult,
+            await self.session.execute(
+                delete(self.model).where(
+                    self.get_attr("expires_at") <= datetime.utcnow()
+                )
+            ),
+        )
+
+        return cursor.rowcount
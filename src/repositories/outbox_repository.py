@@ -0,0 +1,48 @@
+from typing import Type
+
+from sqlalchemy import delete
+
+from models import OutboxEvent
+from repositories.base_repository import BaseRepository
+
+
+class OutboxRepository(BaseRepository[OutboxEvent]):
+    """
+    Репозиторий для событий, ожидающих публикации.
+    """
+
+    @property
+    def model(self) -> Type[OutboxEvent]:
+        return OutboxEvent
+
+    async def lock_pending(self, limit: int) -> list[OutboxEvent]:
+        """
+        Получение и блокировка самых ранних событий.
+        Записи, заблокированные другими процессами, пропускаются,
+        поэтому несколько процессов могут обрабатывать события параллельно.
+
+        :param limit: Ограничение на количество событий.
+        :return:
+        """
+
+        query = (
+            self._select()
+            .order_by(self.get_attr("id"))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        cursor = await self.session.execute(query)
+
+        return cursor.scalars().all()
+
+    async def delete_many(self, primary_keys: list[int]) -> None:
+        """
+        Удаление событий по их идентификаторам.
+
+        :param primary_keys: Идентификаторы событий.
+        :return:
+        """
+
+        await self.session.execute(
+            delete(self.table).where(self.table.c.id.in_(primary_keys))
+        )
@@ -0,0 +1,119 @@
+"""
+Функции для постраничной выборки по ключу (keyset pagination).
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, NamedTuple, Optional, Sequence
+
+
+class InvalidCursorError(ValueError):
+    """
+    Некорректный курсор постраничной выборки.
+    """
+
+
+class Page(NamedTuple):
+    """
+    Страница выборки.
+    """
+
+    #: элементы страницы
+    items: list
+    #: курсор следующей страницы
+    next_cursor: Optional[str]
+    #: курсор предыдущей страницы
+    prev_cursor: Optional[str]
+
+
+class Cursor(NamedTuple):
+    """
+    Содержимое курсора постраничной выборки.
+    """
+
+    #: значения ключа сортировки граничного элемента
+    values: list
+    #: направление перехода (next – следующая страница, prev – предыдущая)
+    direction: str
+    #: атрибуты сортировки
+    order_by: list[str]
+    #: признак сортировки по убыванию
+    descending: bool
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """
+    Формирование непрозрачной строки курсора.
+
+    :param cursor: Содержимое курсора.
+    :return:
+    """
+
+    data = json.dumps(
+        [
+            [_encode_value(value) for value in cursor.values],
+            cursor.direction,
+            cursor.order_by,
+            cursor.descending,
+        ],
+        separators=(",", ":"),
+    )
+
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Cursor:
+    """
+    Разбор строки курсора.
+
+    :param cursor: Строка курсора.
+    :param types: Типы значений ключа сортировки.
+    :return:
+    """
+
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values, direction, order_by, descending = json.loads(data)
+        if direction not in ("next", "prev") or len(values) != len(types):
+            raise InvalidCursorError(cursor)
+
+        return Cursor(
+            values=[
+                _decode_value(value, value_type)
+                for value, value_type in zip(values, types)
+            ],
+            direction=direction,
+            order_by=order_by,
+            descending=descending,
+        )
+    except (TypeError, ValueError) as exc:
+        raise InvalidCursorError(cursor) from exc
+
+
+def _encode_value(value: Any) -> Any:
+    """
+    Преобразование значения ключа для сериализации в JSON.
+
+    :param value: Значение.
+    :return:
+    """
+
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _decode_value(value: Any, value_type: type) -> Any:
+    """
+    Восстановление значения ключа после разбора JSON.
+
+    :param value: Значение.
+    :param value_type: Тип значения.
+    :return:
+    """
+
+    if issubclass(value_type, datetime):
+        return datetime.fromisoformat(value)
+
+    if not isinstance(value, value_type):
+        raise InvalidCursorError(value)
+
+    return value
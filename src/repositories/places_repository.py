@@ -1,10 +1,12 @@
 from typing import Type
 
+from sqlalchemy import func
+
 from models import Place
 from repositories.base_repository import BaseRepository
 
 
-class PlacesRepository(BaseRepository):
+class PlacesRepository(BaseRepository[Place]):
     """
     Репозиторий для списка любимых мест.
     """
@@ -12,3 +14,34 @@ class PlacesRepository(BaseRepository):
     @property
     def model(self) -> Type[Place]:
         return Place
+
+    async def find_nearby(
+        self, latitude: float, longitude: float, radius: float, limit: int
+    ) -> list[Place]:
+        """
+        Поиск ближайших мест в заданном радиусе (в порядке увеличения расстояния).
+        Использует пространственный индекс ix_place_earth_location.
+
+        :param latitude: Широта точки поиска
+        :param longitude: Долгота точки поиска
+        :param radius: Радиус поиска (в метрах)
+        :param limit: Лимит на количество элементов в выборке
+        :return:
+        """
+
+        point = func.ll_to_earth(latitude, longitude)
+        location = func.ll_to_earth(
+            self.get_attr("latitude"), self.get_attr("longitude")
+        )
+        query = (
+            self._select()
+            # предварительный отбор по индексу (куб, описанный вокруг окружности поиска)
+            .where(func.earth_box(point, radius).op("@>")(location))
+            .where(func.earth_distance(point, location) <= radius)
+            # сортировка по расстоянию с использованием индекса (KNN)
+            .order_by(location.op("<->")(point))
+            .limit(limit)
+        )
+        cursor = await self.session.execute(query)
+
+        return cursor.scalars().all()
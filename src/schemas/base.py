@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import Optional
+
+from pydantic import BaseModel, Field
 
 
 class ListResponse(BaseModel):
@@ -7,3 +9,12 @@ class ListResponse(BaseModel):
     """
 
     data: list
+
+
+class PaginatedListResponse(ListResponse):
+    """
+    Схема для представления данных в виде постраничного списка.
+    """
+
+    next_cursor: Optional[str] = Field(None, title="Курсор следующей страницы")
+    prev_cursor: Optional[str] = Field(None, title="Курсор предыдущей страницы")
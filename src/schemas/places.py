@@ -1,9 +1,10 @@
-from typing import Optional
+from typing import Any, Mapping, Optional, Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
 
 from models import Place
-from schemas.base import ListResponse
+from schemas.base import ListResponse, PaginatedListResponse
+from settings import settings
 
 
 class PlaceUpdate(BaseModel):
@@ -15,6 +16,29 @@ class PlaceUpdate(BaseModel):
     longitude: Optional[float] = None
     description: Optional[str] = Field(None, min_length=3, max_length=255)
 
+    @validator("latitude", "longitude", "description", pre=True)
+    def check_not_null(cls, value: Any) -> Any:  # pylint: disable=no-self-argument
+        """
+        Проверка отсутствия явного значения null
+        (атрибуты обязательны, их можно изменить, но нельзя очистить).
+
+        :param value: Переданное значение атрибута.
+        :return:
+        """
+
+        if value is None:
+            raise ValueError("none is not an allowed value")
+
+        return value
+
+
+class PlaceBulkUpdate(PlaceUpdate):
+    """
+    Схема данных для обновления любимого места в пакетном запросе.
+    """
+
+    id: int = Field(title="Идентификатор")
+
 
 class PlaceResponse(BaseModel):
     """
@@ -24,9 +48,79 @@ class PlaceResponse(BaseModel):
     data: Place
 
 
-class PlacesListResponse(ListResponse):
+class PlacesListResponse(PaginatedListResponse):
     """
     Схема для представления данных о списке любимых мест.
     """
 
     data: list[Place]
+
+
+class PlacesBulkCreateRequest(BaseModel):
+    """
+    Схема данных для пакетного создания любимых мест.
+    Каждый объект проверяется отдельно, ошибки возвращаются по каждому объекту.
+    """
+
+    data: list[dict[str, Any]] = Field(
+        ..., min_items=1, max_items=settings.bulk.max_items
+    )
+
+
+class PlaceBulkResult(BaseModel):
+    """
+    Схема результата обработки объекта в пакетном запросе.
+    """
+
+    index: int = Field(title="Порядковый номер объекта в запросе")
+    id: Optional[int] = Field(None, title="Идентификатор созданного объекта")
+    errors: Optional[Sequence[Mapping[str, Any]]] = Field(
+        None, title="Ошибки валидации"
+    )
+
+
+class PlacesBulkResponse(ListResponse):
+    """
+    Схема для представления результатов пакетной обработки любимых мест.
+    """
+
+    data: list[PlaceBulkResult]
+
+
+class PlacesBulkUpdateRequest(BaseModel):
+    """
+    Схема данных для пакетного обновления любимых мест.
+    """
+
+    data: list[PlaceBulkUpdate] = Field(
+        ..., min_items=1, max_items=settings.bulk.max_items
+    )
+
+
+class PlacesBulkUpdateResponse(ListResponse):
+    """
+    Схема для представления результатов пакетного обновления любимых мест.
+    """
+
+    data: list[Place] = Field(title="Обновленные объекты")
+
+
+class PlacesBulkDeleteResponse(ListResponse):
+    """
+    Схема для представления результатов пакетного удаления любимых мест.
+    """
+
+    data: list[int] = Field(title="Идентификаторы удаленных объектов")
+
+
+class PlacesImportResponse(BaseModel):
+    """
+    Схема для представления итогов загрузки любимых мест.
+    """
+
+    total: int = Field(title="Количество обработанных строк")
+    imported: int = Field(title="Количество загруженных объектов")
+    invalid: int = Field(title="Количество строк с ошибками")
+    errors: list[dict[str, Any]] = Field(title="Ошибки по номерам строк")
+    elapsed: float = Field(title="Продолжительность загрузки (в секундах)")
+    rows_per_second: float = Field(title="Скорость обработки строк")
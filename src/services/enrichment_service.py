@@ -0,0 +1,414 @@
+import asyncio
+import logging.config
+from typing import Awaitable, Callable, Optional
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from integrations.db.session import async_session
+from repositories.enrichment_repository import PendingEnrichmentRepository
+from repositories.places_repository import PlacesRepository
+from services.events_service import EventsService
+from services.locations_service import LocationsService
+from services.places_cache import places_cache
+from settings import settings
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+
+class EnrichmentTask(BaseModel):
+    """
+    Задача на обогащение данных о любимом месте.
+    """
+
+    place_id: int
+    latitude: float
+    longitude: float
+    #: номер попытки выполнения
+    attempt: int = 0
+
+
+class EnrichmentStats:
+    """
+    Счетчики фонового обогащения данных.
+    """
+
+    def __init__(self) -> None:
+        #: количество поставленных в очередь задач
+        self.submitted = 0
+        #: количество задач, отброшенных из-за переполнения очереди
+        self.dropped = 0
+        #: количество успешно обработанных задач
+        self.succeeded = 0
+        #: количество повторных попыток
+        self.retried = 0
+        #: количество задач, не обработанных после всех попыток
+        self.failed = 0
+
+
+class EnrichmentWorker:
+    """
+    Фоновое обогащение данных о любимых местах.
+    Задачи обрабатываются в очереди в рамках процесса приложения,
+    неуспешные попытки повторяются с экспоненциально растущей задержкой.
+    """
+
+    def __init__(self, handler: Callable[[EnrichmentTask], Awaitable[bool]]) -> None:
+        """
+        Инициализация обработчика.
+
+        :param handler: Функция обработки задачи, возвращающая признак успеха.
+        """
+
+        self.handler = handler
+        self.config = settings.enrichment
+        self.queue: Optional[asyncio.Queue] = None
+        self.stats = EnrichmentStats()
+        self._workers: list[asyncio.Task] = []
+        self._retries: set[asyncio.Task] = set()
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Признак запущенной обработки задач.
+
+        :return:
+        """
+
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """
+        Запуск обработки задач.
+
+        :return:
+        """
+
+        if self.is_running:
+            return
+
+        self.queue = asyncio.Queue(maxsize=self.config.queue_size)
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self.config.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        """
+        Остановка обработки задач.
+        Перед остановкой ожидается обработка уже поставленных задач (в пределах таймаута).
+
+        :return:
+        """
+
+        if not self.is_running or self.queue is None:
+            return
+
+        try:
+            await asyncio.wait_for(
+                self.queue.join(), timeout=self.config.shutdown_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Enrichment stopped with %s unprocessed tasks.", self.queue.qsize()
+            )
+
+        for task in [*self._workers, *self._retries]:
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._retries, return_exceptions=True)
+        self._workers = []
+        self._retries = set()
+
+    async def submit(self, task: EnrichmentTask) -> None:
+        """
+        Постановка задачи в очередь.
+
+        :param task: Задача на обогащение данных.
+        :return:
+        """
+
+        await self.start()
+        try:
+            self.queue.put_nowait(task)  # type: ignore
+        except asyncio.QueueFull:
+            self.stats.dropped += 1
+            logger.warning(
+                "Enrichment queue is full, place %s is left as is.", task.place_id
+            )
+        else:
+            self.stats.submitted += 1
+
+    async def _work(self) -> None:
+        """
+        Цикл обработки задач из очереди.
+
+        :return:
+        """
+
+        while True:
+            task = await self.queue.get()  # type: ignore
+            try:
+                succeeded = await self.handler(task)
+            except Exception:  # pylint: disable=broad-except
+                logger.error("Error during place enrichment.", exc_info=True)
+                succeeded = False
+            finally:
+                self.queue.task_done()  # type: ignore
+
+            if succeeded:
+                self.stats.succeeded += 1
+            else:
+                self._schedule_retry(task)
+
+    def _schedule_retry(self, task: EnrichmentTask) -> None:
+        """
+        Планирование повторной попытки с экспоненциальной задержкой.
+
+        :param task: Задача на обогащение данных.
+        :return:
+        """
+
+        if task.attempt >= self.config.max_retries:
+            self.stats.failed += 1
+            logger.warning(
+                "Place %s enrichment failed after %s attempts.",
+                task.place_id,
+                task.attempt + 1,
+            )
+
+            return
+
+        delay = min(
+            self.config.retry_delay * 2**task.attempt, self.config.max_retry_delay
+        )
+        self.stats.retried += 1
+        retry = asyncio.create_task(
+            self._retry_later(task.copy(update={"attempt": task.attempt + 1}), delay)
+        )
+        self._retries.add(retry)
+        retry.add_done_callback(self._retries.discard)
+
+    async def _retry_later(self, task: EnrichmentTask, delay: float) -> None:
+        """
+        Повторная постановка задачи в очередь после задержки.
+
+        :param task: Задача на обогащение данных.
+        :param delay: Задержка (в секундах).
+        :return:
+        """
+
+        await asyncio.sleep(delay)
+        await self.submit(task)
+
+
+async def enrich_place(task: EnrichmentTask) -> bool:
+    """
+    Обогащение данных о любимом месте и публикация события после успешного обогащения.
+    Данные сохраняются, только если координаты места не изменились после постановки
+    задачи (при перемещении места обогащение выполняется по новой задаче).
+
+    :param task: Задача на обогащение данных.
+    :return: Признак успешного получения данных о местонахождении.
+    """
+
+    return (await enrich_places([task]))[0]
+
+
+async def enrich_places(tasks: list[EnrichmentTask]) -> list[bool]:
+    """
+    Обогащение данных о нескольких любимых местах в одной транзакции
+    и публикация событий для мест, у которых изменился город или страна.
+    Данные сохраняются только для мест, координаты которых не изменились.
+
+    :param tasks: Задачи на обогащение данных.
+    :return: Признаки успешного получения данных о местонахождении
+        в порядке переданных задач.
+    """
+
+    async with async_session() as session:
+        results, updated = await _enrich_places(session, tasks)
+        await session.commit()
+    if updated:
+        await places_cache.delete(updated)
+
+    return results
+
+
+async def _enrich_places(
+    session: AsyncSession, tasks: list[EnrichmentTask]
+) -> tuple[list[bool], list[int]]:
+    """
+    Обогащение данных о нескольких любимых местах в переданной сессии
+    (транзакция фиксируется вызывающей стороной).
+
+    :param session: Сессия БД.
+    :param tasks: Задачи на обогащение данных.
+    :return: Признаки успешного получения данных о местонахождении
+        в порядке переданных задач и идентификаторы обновленных мест.
+    """
+
+    locations = await LocationsService(session).get_locations(
+        [(task.latitude, task.longitude) for task in tasks]
+    )
+    updated = await PlacesRepository(session).update_many(
+        [
+            {
+                "id": task.place_id,
+                "latitude": task.latitude,
+                "longitude": task.longitude,
+                "country": location.alpha2code,
+                "city": location.city,
+                "locality": location.locality,
+            }
+            for task, location in zip(tasks, locations)
+            if location is not None
+        ],
+        previous=("country", "city"),
+        match=("latitude", "longitude"),
+    )
+    # публикация событий для попытки импорта информации в сервисе Countries Informer
+    # (только при изменении города или страны)
+    await EventsService(session).publish_country_city_many(
+        (place.city, place.country)
+        for place, previous in updated
+        if (previous["country"], previous["city"]) != (place.country, place.city)
+    )
+
+    return [location is not None for location in locations], [
+        place.id for place, _ in updated if place.id is not None
+    ]
+
+
+class PendingEnrichmentRelay:
+    """
+    Обогащение данных о любимых местах, отмеченных в таблице ожидающих обогащения.
+    Отметки выбираются пакетами с блокировкой (FOR UPDATE SKIP LOCKED)
+    и удаляются в той же транзакции после обработки, поэтому не теряются
+    при остановке процесса, а обработку можно запускать на нескольких репликах.
+    В приложении обработка запускается, только если включена ENRICHMENT__PENDING_RELAY.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация процесса обогащения.
+        """
+
+        self.config = settings.enrichment
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    async def process_batch(self) -> int:
+        """
+        Обогащение данных для одного пакета отмеченных мест.
+        Отметки мест, для которых данные не получены, остаются для повторной попытки
+        и удаляются после ENRICHMENT__MAX_RETRIES повторных попыток.
+
+        :return: Количество удаленных отметок.
+        """
+
+        async with async_session() as session:
+            repository = PendingEnrichmentRepository(session)
+            pending = await repository.lock_pending(self.config.batch_size)
+            if not pending:
+                return 0
+
+            # обогащение выполняется в той же транзакции, что удерживает блокировки отметок
+            results, updated = await _enrich_places(
+                session,
+                [
+                    EnrichmentTask(
+                        place_id=row.place_id,
+                        latitude=row.latitude,
+                        longitude=row.longitude,
+                        attempt=row.attempts,
+                    )
+                    for row in pending
+                ],
+            )
+            processed = []
+            retried = []
+            for row, succeeded in zip(pending, results):
+                if succeeded:
+                    processed.append(row.place_id)
+                elif row.attempts >= self.config.max_retries:
+                    logger.warning(
+                        "Place %s enrichment failed after %s attempts.",
+                        row.place_id,
+                        row.attempts + 1,
+                    )
+                    processed.append(row.place_id)
+                else:
+                    retried.append(row.place_id)
+
+            await repository.delete_many(processed)
+            await repository.retry_many(retried)
+            await session.commit()
+        if updated:
+            await places_cache.delete(updated)
+
+        return len(processed)
+
+    async def drain(self) -> None:
+        """
+        Обработка отмеченных мест, пока обработка пакетов продвигается
+        (оставшиеся отметки обрабатываются фоновым процессом приложения).
+
+        :return:
+        """
+
+        while await self.process_batch():
+            pass
+
+    async def run(self) -> None:
+        """
+        Цикл обогащения данных до остановки.
+        Пока в таблице есть отметки и обработка продвигается, пакеты обрабатываются
+        без задержки.
+
+        :return:
+        """
+
+        while not self._stopping.is_set():
+            try:
+                processed = await self.process_batch()
+            except Exception:  # pylint: disable=broad-except
+                logger.error("Error during pending enrichment.", exc_info=True)
+                processed = 0
+
+            if processed < self.config.batch_size:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self.config.poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+    async def start(self) -> None:
+        """
+        Запуск обогащения данных в фоновом режиме.
+
+        :return:
+        """
+
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """
+        Остановка обогащения данных.
+
+        :return:
+        """
+
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+
+# фоновое обогащение данных о любимых местах (общее для процесса)
+enrichment_worker = EnrichmentWorker(enrich_place)
+
+# обогащение данных о местах, отмеченных при загрузке (общее для процесса)
+pending_enrichment = PendingEnrichmentRelay()
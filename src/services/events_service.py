@@ -0,0 +1,79 @@
+import logging.config
+from typing import Iterable, Optional
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from integrations.events.schemas import CountryCityDTO
+from models import OutboxEvent
+from repositories.outbox_repository import OutboxRepository
+from settings import settings
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+
+class EventsService:
+    """
+    Сервис для публикации событий для коммуникации между микросервисами.
+    События записываются в таблицу исходящих событий в текущей транзакции
+    и публикуются в брокер сообщений отдельным процессом (OutboxRelay).
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация сервиса.
+
+        :param session: Объект сессии для взаимодействия с базой данных
+        """
+
+        self.session = session
+        self.outbox_repository = OutboxRepository(session)
+
+    async def publish_country_city(
+        self, city: Optional[str], alpha2code: Optional[str]
+    ) -> None:
+        """
+        Публикация события для попытки импорта информации о городе
+        в сервисе Countries Informer.
+        Событие будет отправлено только после фиксации текущей транзакции.
+
+        :param city: Название города.
+        :param alpha2code: ISO Alpha2-код страны.
+        :return:
+        """
+
+        await self.publish_country_city_many([(city, alpha2code)])
+
+    async def publish_country_city_many(
+        self, cities: Iterable[tuple[Optional[str], Optional[str]]]
+    ) -> None:
+        """
+        Публикация событий для списка городов одним запросом к базе данных.
+        Повторяющиеся города публикуются один раз.
+
+        :param cities: Пары из названия города и ISO Alpha2-кода страны.
+        :return:
+        """
+
+        events = []
+        for city, alpha2code in dict.fromkeys(cities):
+            try:
+                place_data = CountryCityDTO(city=city, alpha2code=alpha2code)
+            except ValidationError:
+                logger.warning(
+                    "The message was not well-formed during publishing event.",
+                    exc_info=True,
+                )
+
+                continue
+
+            events.append(
+                OutboxEvent(
+                    queue=settings.rabbitmq.queue.places_import,
+                    payload=place_data.json(),
+                )
+            )
+
+        if events:
+            await self.outbox_repository.create_many(events)
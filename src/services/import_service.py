@@ -0,0 +1,164 @@
+import logging.config
+import time
+from typing import Any, AsyncIterable, Callable, Literal, Mapping, Optional, Sequence
+
+from fastapi import Depends
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from integrations.db.session import get_session
+from models import Place
+from repositories.enrichment_repository import PendingEnrichmentRepository
+from repositories.places_repository import PlacesRepository
+from settings import settings
+from utils.importing import PARSERS
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+
+class ImportStats:
+    """
+    Счетчики загрузки любимых мест.
+    """
+
+    def __init__(self) -> None:
+        #: количество обработанных строк
+        self.total = 0
+        #: количество загруженных объектов
+        self.imported = 0
+        #: количество строк с ошибками
+        self.invalid = 0
+        #: ошибки по номерам строк (не более IMPORT__MAX_ERRORS)
+        self.errors: list[dict] = []
+        #: время начала загрузки
+        self.started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Продолжительность загрузки (в секундах).
+
+        :return:
+        """
+
+        return time.monotonic() - self.started
+
+    @property
+    def rows_per_second(self) -> float:
+        """
+        Скорость обработки строк.
+
+        :return:
+        """
+
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+
+class ImportService:
+    """
+    Сервис для загрузки большого количества любимых мест из файлов.
+    Строки разбираются постепенно и проверяются частями,
+    каждая часть загружается через протокол COPY в отдельной транзакции.
+    """
+
+    def __init__(self, session: AsyncSession = Depends(get_session)):
+        """
+        Инициализация сервиса.
+
+        :param session: Объект сессии для взаимодействия с базой данных
+        """
+
+        self.session = session
+        self.places_repository = PlacesRepository(session)
+        self.pending_enrichment_repository = PendingEnrichmentRepository(session)
+
+    async def import_places(
+        self,
+        lines: AsyncIterable[str],
+        import_format: Literal["ndjson", "csv"],
+        enrich: bool = False,
+        on_progress: Optional[Callable[[ImportStats], None]] = None,
+    ) -> ImportStats:
+        """
+        Загрузка любимых мест.
+        Строки с ошибками пропускаются и не прерывают загрузку остальных.
+
+        :param lines: Строки данных.
+        :param import_format: Формат данных.
+        :param enrich: Обогащение загруженных объектов данными о местонахождении
+            (объекты отмечаются для обогащения в транзакции загрузки,
+            обогащение выполняется в фоновом режиме).
+        :param on_progress: Функция для отображения хода загрузки
+            (вызывается после загрузки каждой части).
+        :return: Итоги загрузки.
+        """
+
+        stats = ImportStats()
+        places: list[Place] = []
+        async for row in PARSERS[import_format](lines):
+            stats.total += 1
+            if isinstance(row, ValueError):
+                self._add_error(stats, [{"msg": str(row)}])
+            else:
+                try:
+                    places.append(Place.validate(row))
+                except ValidationError as exc:
+                    self._add_error(stats, exc.errors())
+
+            if len(places) >= settings.importing.chunk_size:
+                await self._load(places, enrich, stats, on_progress)
+                places = []
+
+        if places:
+            await self._load(places, enrich, stats, on_progress)
+
+        logger.info(
+            "Imported %s of %s rows in %.1f s (%.0f rows/s).",
+            stats.imported,
+            stats.total,
+            stats.elapsed,
+            stats.rows_per_second,
+        )
+
+        return stats
+
+    @staticmethod
+    def _add_error(stats: ImportStats, errors: Sequence[Mapping[str, Any]]) -> None:
+        """
+        Учет строки с ошибками.
+
+        :param stats: Счетчики загрузки.
+        :param errors: Описание ошибок.
+        :return:
+        """
+
+        stats.invalid += 1
+        if len(stats.errors) < settings.importing.max_errors:
+            stats.errors.append({"row": stats.total, "errors": errors})
+
+    async def _load(
+        self,
+        places: list[Place],
+        enrich: bool,
+        stats: ImportStats,
+        on_progress: Optional[Callable[[ImportStats], None]],
+    ) -> None:
+        """
+        Загрузка части объектов в отдельной транзакции.
+
+        :param places: Проверенные объекты.
+        :param enrich: Обогащение загруженных объектов данными о местонахождении.
+        :param stats: Счетчики загрузки.
+        :param on_progress: Функция для отображения хода загрузки.
+        :return:
+        """
+
+        rows = await self.places_repository.copy_many(places)
+        if enrich:
+            await self.pending_enrichment_repository.add_many([row.id for row in rows])
+        await self.session.commit()
+        stats.imported += len(rows)
+
+        if on_progress is not None:
+            on_progress(stats)
@@ -0,0 +1,260 @@
+import asyncio
+import logging.config
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from clients.geo import get_location_client
+from clients.shemas import LocalityDTO
+from integrations.cache.memory import CacheStats, MemoryCache
+from integrations.db.session import async_session, get_session
+from repositories.locations_repository import LocationCacheRepository
+from settings import settings
+from utils.geo import quantize_coordinates
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+# кэш данных о местонахождении в памяти процесса (общий для всех запросов)
+memory_cache = MemoryCache(
+    max_size=settings.location_cache.max_size, ttl=settings.location_cache.ttl
+)
+# счетчики обращений к кэшу в базе данных
+durable_cache_stats = CacheStats()
+
+
+class LocationsService:
+    """
+    Сервис для получения данных о местонахождении с кэшированием.
+    Сначала проверяется кэш в памяти процесса, затем кэш в базе данных,
+    и только после этого выполняется запрос к внешнему сервису.
+    """
+
+    def __init__(self, session: AsyncSession = Depends(get_session)):
+        """
+        Инициализация сервиса.
+
+        :param session: Объект сессии для взаимодействия с базой данных
+        """
+
+        self.session = session
+        self.locations_repository = LocationCacheRepository(session)
+
+    async def get_location(
+        self, latitude: float, longitude: float
+    ) -> Optional[LocalityDTO]:
+        """
+        Получение данных о местонахождении по переданным координатам.
+        Если провайдер не нашел данных, возвращается объект с пустыми атрибутами.
+
+        :param latitude: Широта
+        :param longitude: Долгота
+        :return: Данные о местонахождении или None при ошибке получения данных.
+        """
+
+        return (await self.get_locations([(latitude, longitude)]))[0]
+
+    async def get_locations(
+        self,
+        coordinates: Sequence[tuple[float, float]],
+        concurrency: int = settings.bulk.enrichment_concurrency,
+    ) -> list[Optional[LocalityDTO]]:
+        """
+        Получение данных о местонахождении для списка координат.
+        Одинаковые (после округления) координаты запрашиваются один раз,
+        кэш в базе данных проверяется одним запросом (кроме локального справочника,
+        поиск по которому быстрее запроса к базе данных),
+        запросы к внешнему сервису выполняются параллельно.
+
+        :param coordinates: Пары широты и долготы.
+        :param concurrency: Максимальное количество одновременных запросов к внешнему сервису.
+        :return: Данные о местонахождении в порядке переданных координат.
+        """
+
+        keys = [
+            quantize_coordinates(latitude, longitude, settings.location_cache.precision)
+            for latitude, longitude in coordinates
+        ]
+        locations: dict[tuple[float, float], Optional[LocalityDTO]] = {}
+        # исходные координаты для запроса к внешнему сервису (первые для каждого ключа)
+        missing: dict[tuple[float, float], tuple[float, float]] = {}
+        for key, point in zip(keys, coordinates):
+            if key in locations or key in missing:
+                continue
+
+            if (location := memory_cache.get(key)) is not None:
+                locations[key] = location
+            else:
+                missing[key] = point
+
+        durable = settings.geocoder.provider != "offline"
+        if missing and durable:
+            for cached in await self.locations_repository.find_actual_many(
+                list(missing)
+            ):
+                key = (cached.latitude, cached.longitude)
+                location = LocalityDTO(
+                    city=cached.city,
+                    alpha2code=cached.country,
+                    locality=cached.locality,
+                )
+                ttl = (cached.expires_at - datetime.utcnow()).total_seconds()
+                memory_cache.set(key, location, ttl=max(ttl, 0))
+                locations[key] = location
+                del missing[key]
+                durable_cache_stats.hits += 1
+
+        if missing:
+            if durable:
+                durable_cache_stats.misses += len(missing)
+            semaphore = asyncio.Semaphore(concurrency)
+            fetched = await asyncio.gather(
+                *(self._request(point, semaphore) for point in missing.values())
+            )
+            locations.update(zip(missing, fetched))
+            # ошибки получения данных не кэшируются
+            await self._store(
+                {
+                    key: location
+                    for key, location in zip(missing, fetched)
+                    if location is not None
+                },
+                durable=durable,
+            )
+
+        return [locations[key] for key in keys]
+
+    @staticmethod
+    async def _request(
+        point: tuple[float, float], semaphore: asyncio.Semaphore
+    ) -> Optional[LocalityDTO]:
+        """
+        Запрос данных о местонахождении у внешнего сервиса.
+
+        :param point: Пара широты и долготы.
+        :param semaphore: Ограничение количества одновременных запросов.
+        :return:
+        """
+
+        async with semaphore:
+            return await get_location_client().get_location(
+                latitude=point[0], longitude=point[1]
+            )
+
+    async def _store(
+        self, locations: dict[tuple[float, float], LocalityDTO], durable: bool = True
+    ) -> None:
+        """
+        Сохранение данных о местонахождении в кэш.
+
+        :param locations: Данные о местонахождении по округленным координатам.
+        :param durable: Сохранение в кэш в базе данных (кроме кэша в памяти процесса).
+        :return:
+        """
+
+        if not locations:
+            return
+
+        rows = []
+        for key, location in locations.items():
+            ttl = (
+                settings.location_cache.ttl
+                if location.city or location.alpha2code
+                else settings.location_cache.negative_ttl
+            )
+            memory_cache.set(key, location, ttl=ttl)
+            rows.append(
+                {
+                    "latitude": key[0],
+                    "longitude": key[1],
+                    "country": location.alpha2code,
+                    "city": location.city,
+                    "locality": location.locality,
+                    "expires_at": datetime.utcnow() + timedelta(seconds=ttl),
+                }
+            )
+
+        if durable:
+            await self.locations_repository.upsert_many(rows)
+
+
+class LocationCacheEviction:
+    """
+    Периодическое удаление устаревших записей кэша данных о местонахождении в БД.
+    Выполняется в фоновом режиме, а не при обработке запросов,
+    чтобы одновременные запросы не ожидали блокировок одних и тех же записей.
+    """
+
+    def __init__(
+        self, interval: float = settings.location_cache.eviction_interval
+    ) -> None:
+        """
+        Инициализация удаления устаревших записей.
+
+        :param interval: Интервал удаления (в секундах).
+        """
+
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    async def evict(self) -> int:
+        """
+        Удаление устаревших записей.
+
+        :return: Количество удаленных записей.
+        """
+
+        async with async_session() as session:
+            deleted = await LocationCacheRepository(session).delete_expired()
+            await session.commit()
+
+        return deleted
+
+    async def run(self) -> None:
+        """
+        Цикл удаления устаревших записей до остановки.
+
+        :return:
+        """
+
+        while not self._stopping.is_set():
+            try:
+                if deleted := await self.evict():
+                    logger.info("Evicted %s expired location cache rows.", deleted)
+            except Exception:  # pylint: disable=broad-except
+                logger.error("Error during location cache eviction.", exc_info=True)
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def start(self) -> None:
+        """
+        Запуск удаления устаревших записей в фоновом режиме.
+
+        :return:
+        """
+
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """
+        Остановка удаления устаревших записей.
+
+        :return:
+        """
+
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+
+# удаление устаревших записей кэша в БД (общее для процесса)
+location_cache_eviction = LocationCacheEviction()
@@ -0,0 +1,223 @@
+"""
+Метрики состояния компонентов приложения, формируемые при обращении к /metrics.
+"""
+from typing import Iterator
+
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from clients.base import base
+from clients.geo import location_flights
+from integrations.db.session import get_pool_stats
+from services.enrichment_service import enrichment_worker
+from services.locations_service import durable_cache_stats, memory_cache
+from services.outbox_service import outbox_relay
+from services.places_cache import places_cache
+
+#: состояния автоматического выключателя
+BREAKER_STATES = ("closed", "open", "half_open")
+
+
+class StatsCollector(Collector):
+    """
+    Перевод счетчиков компонентов приложения в метрики Prometheus.
+    Счетчики читаются только при обращении к /metrics,
+    поэтому на обработку запросов сбор метрик не влияет.
+    """
+
+    def collect(self) -> Iterator:
+        yield from self._collect_caches()
+        yield from self._collect_clients()
+        yield from self._collect_pool()
+        yield from self._collect_events()
+
+    @staticmethod
+    def _collect_caches() -> Iterator:
+        """
+        Метрики кэшей.
+
+        :return:
+        """
+
+        caches = {
+            "location_memory": memory_cache.stats,
+            "location_durable": durable_cache_stats,
+            "place_memory": places_cache.memory.stats,
+        }
+        for name, description in (
+            ("hits", "Количество попаданий в кэш."),
+            ("misses", "Количество промахов кэша."),
+            ("evictions", "Количество вытесненных записей кэша."),
+            ("expirations", "Количество записей кэша с истекшим временем жизни."),
+        ):
+            metric = CounterMetricFamily(f"cache_{name}", description, labels=["cache"])
+            for cache, stats in caches.items():
+                metric.add_metric([cache], getattr(stats, name))
+            yield metric
+
+        size = GaugeMetricFamily(
+            "cache_size", "Количество записей в кэше.", labels=["cache"]
+        )
+        size.add_metric(["location_memory"], len(memory_cache))
+        size.add_metric(["place_memory"], len(places_cache.memory))
+        yield size
+
+    @staticmethod
+    def _collect_clients() -> Iterator:
+        """
+        Метрики клиентов внешних сервисов.
+
+        :return:
+        """
+
+        yield CounterMetricFamily(
+            "geocode_singleflight_calls",
+            "Количество выполненных запросов данных о местонахождении.",
+            value=location_flights.stats.calls,
+        )
+        yield CounterMetricFamily(
+            "geocode_singleflight_coalesced",
+            "Количество запросов, объединенных с уже выполняющимися.",
+            value=location_flights.stats.coalesced,
+        )
+        yield GaugeMetricFamily(
+            "geocode_singleflight_in_progress",
+            "Количество выполняющихся запросов данных о местонахождении.",
+            value=len(location_flights),
+        )
+
+        state = GaugeMetricFamily(
+            "circuit_breaker_state",
+            "Состояние автоматического выключателя (1 – текущее).",
+            labels=["service", "state"],
+        )
+        calls = CounterMetricFamily(
+            "circuit_breaker_calls",
+            "Количество вызовов через автоматический выключатель.",
+            labels=["service", "outcome"],
+        )
+        opened = CounterMetricFamily(
+            "circuit_breaker_opened",
+            "Количество размыканий автоматического выключателя.",
+            labels=["service"],
+        )
+        breakers = base._breakers  # pylint: disable=protected-access
+        for service, breaker in breakers.items():
+            for name in BREAKER_STATES:
+                state.add_metric([service, name], float(breaker.state == name))
+            calls.add_metric([service, "success"], breaker.stats.successes)
+            calls.add_metric([service, "failure"], breaker.stats.failures)
+            calls.add_metric([service, "rejected"], breaker.stats.rejected)
+            opened.add_metric([service], breaker.stats.opened)
+        yield from (state, calls, opened)
+
+    @staticmethod
+    def _collect_pool() -> Iterator:
+        """
+        Метрики пула соединений с БД.
+
+        :return:
+        """
+
+        stats = get_pool_stats()
+        connections = GaugeMetricFamily(
+            "db_pool_connections",
+            "Количество соединений в пуле по состояниям.",
+            labels=["state"],
+        )
+        for name in ("checked_in", "checked_out", "overflow"):
+            connections.add_metric([name], stats[name])
+        yield connections
+        yield GaugeMetricFamily(
+            "db_pool_size", "Размер пула соединений.", value=stats["size"]
+        )
+        yield CounterMetricFamily(
+            "db_pool_checkouts",
+            "Количество соединений, выданных запросам API.",
+            value=stats["checkouts"],
+        )
+        yield CounterMetricFamily(
+            "db_pool_wait_seconds",
+            "Суммарное время ожидания соединений запросами API.",
+            value=stats["total_wait"],
+        )
+
+    @staticmethod
+    def _collect_events() -> Iterator:
+        """
+        Метрики публикации событий и очереди обогащения данных.
+
+        :return:
+        """
+
+        flushes = CounterMetricFamily(
+            "event_batch_flushes",
+            "Количество отправок пакетов событий.",
+            labels=["queue"],
+        )
+        failed = CounterMetricFamily(
+            "event_batch_failed_flushes",
+            "Количество неуспешных отправок пакетов событий.",
+            labels=["queue"],
+        )
+        collapsed = CounterMetricFamily(
+            "event_batch_collapsed",
+            "Количество событий, отброшенных как дубликаты.",
+            labels=["queue"],
+        )
+        messages = CounterMetricFamily(
+            "event_batch_messages",
+            "Количество событий в отправленных пакетах.",
+            labels=["queue"],
+        )
+        size = CounterMetricFamily(
+            "event_batch_bytes",
+            "Объем событий в отправленных пакетах (в байтах).",
+            labels=["queue"],
+        )
+        max_size = GaugeMetricFamily(
+            "event_batch_max_size",
+            "Максимальное количество событий в отправленном пакете.",
+            labels=["queue"],
+        )
+        for queue, batcher in outbox_relay.batchers.items():
+            flushes.add_metric([queue], batcher.stats.flushes)
+            failed.add_metric([queue], batcher.stats.failed_flushes)
+            collapsed.add_metric([queue], batcher.stats.collapsed)
+            messages.add_metric([queue], batcher.stats.messages)
+            size.add_metric([queue], batcher.stats.bytes)
+            max_size.add_metric([queue], batcher.stats.max_batch_size)
+        yield from (flushes, failed, collapsed, messages, size, max_size)
+
+        enrichment_queue = enrichment_worker.queue
+        yield GaugeMetricFamily(
+            "enrichment_queue_size",
+            "Количество задач в очереди обогащения данных.",
+            value=enrichment_queue.qsize() if enrichment_queue is not None else 0,
+        )
+        tasks = CounterMetricFamily(
+            "enrichment_tasks",
+            "Количество задач обогащения данных по результатам.",
+            labels=["outcome"],
+        )
+        stats = enrichment_worker.stats
+        for outcome in ("submitted", "dropped", "succeeded", "retried", "failed"):
+            tasks.add_metric([outcome], getattr(stats, outcome))
+        yield tasks
+
+
+# сборщик метрик состояния компонентов (общий для процесса)
+stats_collector = StatsCollector()
+
+
+def register_collector() -> None:
+    """
+    Регистрация сборщика метрик состояния компонентов (однократно для процесса).
+
+    :return:
+    """
+
+    registered = REGISTRY._collector_to_names  # pylint: disable=protected-access
+    if stats_collector not in registered:
+        REGISTRY.register(stats_collector)
@@ -0,0 +1,143 @@
+import asyncio
+import logging.config
+from collections import defaultdict
+from typing import Optional
+
+from integrations.db.session import async_session
+from integrations.events.batcher import EventBatcher
+from integrations.events.producer import EventProducer, event_producer
+from repositories.outbox_repository import OutboxRepository
+from settings import settings
+
+logging.config.fileConfig("logging.conf")
+logger = logging.getLogger()
+
+
+class OutboxRelay:
+    """
+    Публикация событий из таблицы исходящих событий в брокер сообщений.
+    События выбираются пакетами с блокировкой (FOR UPDATE SKIP LOCKED),
+    поэтому процессы публикации можно запускать на нескольких репликах одновременно.
+    Пакет отправляется при накоплении OUTBOX__BATCH_SIZE событий или по истечении
+    OUTBOX__POLL_INTERVAL, оставшиеся события отправляются при остановке.
+    """
+
+    def __init__(self, producer: EventProducer = event_producer) -> None:
+        """
+        Инициализация процесса публикации.
+
+        :param producer: Продюсер событий.
+        """
+
+        self.producer = producer
+        self.config = settings.outbox
+        #: пакетная публикация по названиям очередей
+        self.batchers: dict[str, EventBatcher] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    async def relay_batch(self) -> int:
+        """
+        Публикация одного пакета событий.
+        События удаляются только после подтверждения публикации брокером,
+        при ошибке блокировка снимается, и события будут опубликованы повторно.
+
+        :return: Количество опубликованных событий.
+        """
+
+        async with async_session() as session:
+            outbox_repository = OutboxRepository(session)
+            events = await outbox_repository.lock_pending(self.config.batch_size)
+            if not events:
+                return 0
+
+            events_by_queue = defaultdict(list)
+            for event in events:
+                events_by_queue[event.queue].append(event)
+
+            for queue, queue_events in events_by_queue.items():
+                batcher = self.batchers.setdefault(
+                    queue, EventBatcher(queue, producer=self.producer)
+                )
+                # одинаковые сообщения в пакете публикуются один раз
+                if not await batcher.send(
+                    (event.payload, event.payload) for event in queue_events
+                ):
+                    await session.rollback()
+
+                    return 0
+
+            await outbox_repository.delete_many(
+                [event.id for event in events if event.id is not None]
+            )
+            await session.commit()
+
+        return len(events)
+
+    async def run(self) -> None:
+        """
+        Цикл публикации событий до остановки.
+        Пока в таблице есть события, пакеты публикуются без задержки.
+        При остановке (в том числе при отмене) публикуются оставшиеся события.
+
+        :return:
+        """
+
+        try:
+            while not self._stopping.is_set():
+                try:
+                    relayed = await self.relay_batch()
+                except Exception:  # pylint: disable=broad-except
+                    logger.error("Error during outbox relaying.", exc_info=True)
+                    relayed = 0
+
+                if relayed < self.config.batch_size:
+                    try:
+                        await asyncio.wait_for(
+                            self._stopping.wait(), timeout=self.config.poll_interval
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Публикация всех ожидающих событий без задержки
+        (до первого неполного пакета или ошибки).
+
+        :return:
+        """
+
+        try:
+            while await self.relay_batch() >= self.config.batch_size:
+                pass
+        except Exception:  # pylint: disable=broad-except
+            logger.error("Error during outbox flushing.", exc_info=True)
+
+    async def start(self) -> None:
+        """
+        Запуск публикации событий в фоновом режиме.
+
+        :return:
+        """
+
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """
+        Остановка публикации событий.
+
+        :return:
+        """
+
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+
+# публикация событий из таблицы исходящих событий (общая для процесса)
+outbox_relay = OutboxRelay()
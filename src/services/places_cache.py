@@ -0,0 +1,113 @@
+import json
+from typing import Iterable, Optional
+
+from integrations.cache.base import BaseCache
+from integrations.cache.memory import MemoryCache
+from models import Place
+from settings import settings
+
+
+class PlacesCache:
+    """
+    Кэш объектов любимых мест по идентификаторам.
+    Состоит из кэша в памяти процесса и необязательного общего кэша.
+    Записи в памяти процесса других реплик при изменении объекта не удаляются,
+    поэтому время их жизни должно быть небольшим.
+    """
+
+    def __init__(
+        self,
+        memory: MemoryCache,
+        shared: Optional[BaseCache] = None,
+        shared_ttl: float = settings.place_cache.shared_ttl,
+    ) -> None:
+        """
+        Инициализация кэша.
+
+        :param memory: Кэш в памяти процесса.
+        :param shared: Общий кэш (если не задан – используется только кэш в памяти).
+        :param shared_ttl: Время жизни записей общего кэша (в секундах).
+        """
+
+        self.memory = memory
+        self.shared = shared
+        self.shared_ttl = shared_ttl
+
+    @staticmethod
+    def _key(primary_key: int) -> str:
+        """
+        Формирование ключа записи.
+
+        :param primary_key: Идентификатор объекта.
+        :return:
+        """
+
+        return f"place:{primary_key}"
+
+    async def get(self, primary_key: int) -> Optional[Place]:
+        """
+        Получение объекта по идентификатору.
+
+        :param primary_key: Идентификатор объекта.
+        :return: Объект или None, если он отсутствует в кэше.
+        """
+
+        key = self._key(primary_key)
+        if (place := self.memory.get(key)) is not None:
+            return place
+
+        if self.shared is None or (value := await self.shared.get(key)) is None:
+            return None
+
+        place = Place.validate(json.loads(value))
+        self.memory.set(key, place)
+
+        return place
+
+    async def set(self, place: Place) -> None:
+        """
+        Сохранение объекта.
+        В кэше хранится копия, не связанная с сессией БД.
+        Объект, не сохраненный в БД (без идентификатора), не кэшируется.
+
+        :param place: Объект любимого места.
+        :return:
+        """
+
+        if place.id is None:
+            return
+
+        key = self._key(place.id)
+        copy = Place.validate(place.dict())
+        self.memory.set(key, copy)
+        if self.shared is not None:
+            await self.shared.set(key, copy.json(), ttl=self.shared_ttl)
+
+    async def delete(self, primary_keys: Iterable[int]) -> None:
+        """
+        Удаление объектов по идентификаторам.
+
+        :param primary_keys: Идентификаторы объектов.
+        :return:
+        """
+
+        keys = [self._key(primary_key) for primary_key in primary_keys]
+        for key in keys:
+            self.memory.delete(key)
+        if self.shared is not None and keys:
+            await self.shared.delete(*keys)
+
+    def clear(self) -> None:
+        """
+        Очистка кэша в памяти процесса.
+
+        :return:
+        """
+
+        self.memory.clear()
+
+
+# кэш объектов любимых мест (общий для процесса)
+places_cache = PlacesCache(
+    MemoryCache(max_size=settings.place_cache.max_size, ttl=settings.place_cache.ttl)
+)
@@ -1,21 +1,20 @@
-import logging.config
-from typing import Optional
+from typing import AsyncIterator, Literal, Optional
 
 from fastapi import Depends
-from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from clients.geo import LocationClient
 from integrations.db.session import get_session
-from integrations.events.producer import EventProducer
-from integrations.events.schemas import CountryCityDTO
 from models import Place
+from repositories.pagination import Page
 from repositories.places_repository import PlacesRepository
-from schemas.places import PlaceUpdate
+from schemas.places import PlaceBulkUpdate, PlaceUpdate
+from services.enrichment_service import EnrichmentTask, enrichment_worker
+from services.events_service import EventsService
+from services.locations_service import LocationsService
+from services.places_cache import places_cache
 from settings import settings
-
-logging.config.fileConfig("logging.conf")
-logger = logging.getLogger()
+from utils.export import to_csv, to_ndjson
+from utils.geo import haversine_distance
 
 
 class PlacesService:
@@ -32,96 +31,320 @@ class PlacesService:
 
         self.session = session
         self.places_repository = PlacesRepository(session)
+        self.locations_service = LocationsService(session)
+        self.events_service = EventsService(session)
+
+    async def get_places_list(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> Page:
+        """
+        Получение страницы списка любимых мест.
+
+        :param limit: Ограничение на количество элементов в выборке.
+        :param cursor: Курсор страницы (по умолчанию - первая страница).
+        :param order_by: Атрибут сортировки.
+        :param descending: Сортировка по убыванию.
+        :return:
+        """
+
+        return await self.places_repository.find_page_by(
+            limit=limit, cursor=cursor, order_by=(order_by,), descending=descending
+        )
 
-    async def get_places_list(self, limit: int) -> list[Place]:
+    async def get_nearby_places(
+        self, latitude: float, longitude: float, radius: float, limit: int
+    ) -> list[Place]:
         """
-        Получение списка любимых мест.
+        Получение списка ближайших любимых мест в порядке увеличения расстояния.
 
+        :param latitude: Широта точки поиска.
+        :param longitude: Долгота точки поиска.
+        :param radius: Радиус поиска (в метрах).
         :param limit: Ограничение на количество элементов в выборке.
         :return:
         """
 
-        return await self.places_repository.find_all_by(limit=limit)
+        return await self.places_repository.find_nearby(
+            latitude=latitude, longitude=longitude, radius=radius, limit=limit
+        )
+
+    async def export_places(
+        self, export_format: Literal["ndjson", "csv"]
+    ) -> AsyncIterator[str]:
+        """
+        Потоковая выгрузка всех любимых мест.
+        Данные формируются частями по мере чтения из БД.
+
+        :param export_format: Формат выгрузки.
+        :return: Части выгрузки в заданном формате.
+        """
+
+        fields = list(Place.__fields__)
+        if export_format == "csv":
+            yield to_csv([fields])
+
+        async for places in self.places_repository.stream_by(
+            chunk_size=settings.export.chunk_size
+        ):
+            if export_format == "csv":
+                yield to_csv(
+                    [getattr(place, field) for field in fields] for place in places
+                )
+            else:
+                yield to_ndjson(places)
 
     async def get_place(self, primary_key: int) -> Optional[Place]:
         """
         Получение объекта любимого места по его идентификатору.
+        Объекты кэшируются, при изменении и удалении записи в кэше удаляются.
 
         :param primary_key: Идентификатор объекта.
         :return:
         """
 
-        return await self.places_repository.find(primary_key)
+        if place := await places_cache.get(primary_key):
+            return place
 
-    async def create_place(self, place: Place) -> Optional[int]:
+        if place := await self.places_repository.find(primary_key):
+            await places_cache.set(place)
+
+        return place
+
+    async def create_place(self, place: Place) -> Optional[Place]:
         """
         Создание нового объекта любимого места по переданным данным.
+        В фоновом режиме обогащения объект создается сразу,
+        а данные о местонахождении заполняются позже.
 
         :param place: Данные создаваемого объекта.
-        :return: Идентификатор созданного объекта.
+        :return: Созданный объект (в том виде, в котором он сохранен в БД).
         """
 
-        # обогащение данных путем получения дополнительной информации от API
-        if location := await LocationClient().get_location(
+        if settings.enrichment.mode == "background":
+            created = await self.places_repository.create_model_returning(place)
+            await self.session.commit()
+            if created:
+                await places_cache.set(created)
+                await enrichment_worker.submit(
+                    EnrichmentTask(
+                        place_id=created.id,
+                        latitude=created.latitude,
+                        longitude=created.longitude,
+                    )
+                )
+
+            return created
+
+        # обогащение данных путем получения дополнительной информации от API (с кэшированием)
+        if location := await self.locations_service.get_location(
             latitude=place.latitude, longitude=place.longitude
         ):
             place.country = location.alpha2code
             place.city = location.city
             place.locality = location.locality
 
-        primary_key = await self.places_repository.create_model(place)
-        await self.session.commit()
-
+        created = await self.places_repository.create_model_returning(place)
         # публикация события о создании нового объекта любимого места
         # для попытки импорта информации по нему в сервисе Countries Informer
-        try:
-            place_data = CountryCityDTO(
-                city=place.city,
-                alpha2code=place.country,
-            )
-            EventProducer().publish(
-                queue_name=settings.rabbitmq.queue.places_import, body=place_data.json()
+        # (событие фиксируется в одной транзакции с созданием объекта)
+        await self.events_service.publish_country_city(
+            city=place.city, alpha2code=place.country
+        )
+        await self.session.commit()
+        if created:
+            await places_cache.set(created)
+
+        return created
+
+    async def create_places(self, places: list[Place]) -> list[int]:
+        """
+        Пакетное создание объектов любимых мест.
+        Данные о местонахождении для одинаковых координат запрашиваются один раз,
+        объекты и события создаются многострочными запросами в одной транзакции.
+
+        :param places: Данные создаваемых объектов.
+        :return: Идентификаторы созданных объектов в порядке переданных данных.
+        """
+
+        background = settings.enrichment.mode == "background"
+        if not background:
+            # обогащение данных путем получения дополнительной информации от API (с кэшированием)
+            locations = await self.locations_service.get_locations(
+                [(place.latitude, place.longitude) for place in places]
             )
-        except ValidationError:
-            logger.warning(
-                "The message was not well-formed during publishing event.",
-                exc_info=True,
+            for place, location in zip(places, locations):
+                if location:
+                    place.country = location.alpha2code
+                    place.city = location.city
+                    place.locality = location.locality
+
+        primary_keys = await self.places_repository.create_many(
+            [place.dict(exclude={"id", "created_at", "updated_at"}) for place in places]
+        )
+        if not background:
+            await self.events_service.publish_country_city_many(
+                (place.city, place.country) for place in places
             )
+        await self.session.commit()
+
+        if background:
+            for primary_key, place in zip(primary_keys, places):
+                await enrichment_worker.submit(
+                    EnrichmentTask(
+                        place_id=primary_key,
+                        latitude=place.latitude,
+                        longitude=place.longitude,
+                    )
+                )
 
-        return primary_key
+        return primary_keys
 
-    async def update_place(self, primary_key: int, place: PlaceUpdate) -> Optional[int]:
+    async def update_place(
+        self, primary_key: int, place: PlaceUpdate
+    ) -> Optional[Place]:
         """
         Обновление объекта любимого места по переданным данным.
 
         :param primary_key: Идентификатор объекта.
         :param place: Данные для обновления объекта.
-        :return:
+        :return: Обновленный объект или None, если объект не найден.
         """
 
-        # при изменении координат – обогащение данных путем получения дополнительной информации от API
-        # todo
+        changes = place.dict(exclude_unset=True)
+        if not changes:
+            return await self.get_place(primary_key)
 
-        matched_rows = await self.places_repository.update_model(
-            primary_key, **place.dict(exclude_unset=True)
-        )
+        updated = await self.update_places([PlaceBulkUpdate(id=primary_key, **changes)])
+
+        return updated[0] if updated else None
+
+    async def update_places(self, places: list[PlaceBulkUpdate]) -> list[Place]:
+        """
+        Пакетное обновление объектов любимых мест в одной транзакции.
+        Объекты с одинаковым набором изменяемых атрибутов обновляются одним запросом.
+        Данные о местонахождении обновляются только для объектов,
+        перемещенных на расстояние не менее ENRICHMENT__RELOCATION_THRESHOLD.
+
+        :param places: Данные для обновления объектов
+            (при повторении идентификатора применяются все изменения по порядку).
+        :return: Обновленные объекты в порядке первого упоминания в запросе
+            (отсутствующие объекты не возвращаются).
+        """
+
+        changes: dict[int, dict] = {}
+        for item in places:
+            changes.setdefault(item.id, {}).update(item.dict(exclude_unset=True))
+
+        updated: dict[Optional[int], Place] = {}
+        moved: list[Place] = []
+        for place, previous in await self.places_repository.update_many(
+            list(changes.values()), previous=("latitude", "longitude")
+        ):
+            updated[place.id] = place
+            if self._is_relocated(place, previous):
+                moved.append(place)
+
+        background = settings.enrichment.mode == "background"
+        if moved and not background:
+            # обогащение данных путем получения дополнительной информации от API (с кэшированием)
+            locations = await self.locations_service.get_locations(
+                [(place.latitude, place.longitude) for place in moved]
+            )
+            enriched = []
+            cities = []
+            for place, location in zip(moved, locations):
+                if not location or (place.country, place.city, place.locality) == (
+                    location.alpha2code,
+                    location.city,
+                    location.locality,
+                ):
+                    continue
+
+                enriched.append(
+                    {
+                        "id": place.id,
+                        "country": location.alpha2code,
+                        "city": location.city,
+                        "locality": location.locality,
+                    }
+                )
+                if (place.country, place.city) != (location.alpha2code, location.city):
+                    cities.append((location.city, location.alpha2code))
+
+            for place, _ in await self.places_repository.update_many(enriched):
+                updated[place.id] = place
+            # публикация событий для попытки импорта информации в сервисе Countries Informer
+            # (только при изменении города или страны)
+            await self.events_service.publish_country_city_many(cities)
         await self.session.commit()
 
-        # публикация события для попытки импорта информации
-        # по обновленному объекту любимого места в сервисе Countries Informer
-        # todo
+        for place in updated.values():
+            await places_cache.set(place)
+        if background:
+            for place in moved:
+                await enrichment_worker.submit(
+                    EnrichmentTask(
+                        place_id=place.id,
+                        latitude=place.latitude,
+                        longitude=place.longitude,
+                    )
+                )
 
-        return matched_rows
+        return [
+            updated[primary_key] for primary_key in changes if primary_key in updated
+        ]
 
-    async def delete_place(self, primary_key: int) -> Optional[int]:
+    @staticmethod
+    def _is_relocated(place: Place, previous: dict) -> bool:
+        """
+        Проверка перемещения объекта на расстояние, требующее повторного обогащения.
+        Изменение описания или незначительное перемещение не требует запроса к API.
+
+        :param place: Обновленный объект.
+        :param previous: Координаты объекта до обновления.
+        :return:
+        """
+
+        if (place.latitude, place.longitude) == (
+            previous["latitude"],
+            previous["longitude"],
+        ):
+            return False
+
+        return (
+            haversine_distance(
+                previous["latitude"],
+                previous["longitude"],
+                place.latitude,
+                place.longitude,
+            )
+            >= settings.enrichment.relocation_threshold
+        )
+
+    async def delete_place(self, primary_key: int) -> bool:
         """
         Удаление объекта любимого места по его идентификатору.
 
         :param primary_key: Идентификатор объекта.
-        :return:
+        :return: Признак удаления объекта.
+        """
+
+        return bool(await self.delete_places([primary_key]))
+
+    async def delete_places(self, primary_keys: list[int]) -> list[int]:
+        """
+        Удаление объектов любимых мест по идентификаторам одним запросом.
+
+        :param primary_keys: Идентификаторы объектов.
+        :return: Идентификаторы удаленных объектов.
         """
 
-        matched_rows = await self.places_repository.delete_by(id=primary_key)
+        deleted = await self.places_repository.delete_by(id=primary_keys)
         await self.session.commit()
+        await places_cache.delete(deleted)
 
-        return matched_rows
+        return deleted
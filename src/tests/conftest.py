@@ -5,6 +5,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from integrations.db.session import get_session
 from main import app
+from services.locations_service import memory_cache
+from services.places_cache import places_cache
 from settings import settings
 
 
@@ -60,7 +62,7 @@ async def non_mocked_hosts():
 @pytest_asyncio.fixture
 async def event_producer_publish(mocker: MockerFixture):
     """
-    Создание "заглушки" для метода EventProducer.publish().
+    Создание "заглушки" для методов EventProducer.publish() и EventProducer.publish_many().
 
     :param mocker: MockerFixture
     :return:
@@ -69,3 +71,45 @@ async def event_producer_publish(mocker: MockerFixture):
     mocker.patch(
         "integrations.events.producer.EventProducer.publish", return_value=None
     )
+    mocker.patch(
+        "integrations.events.producer.EventProducer.publish_many", return_value=True
+    )
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def location_cache():
+    """
+    Очистка кэша данных о местонахождении в памяти процесса между тестами.
+
+    :return:
+    """
+
+    memory_cache.clear()
+    yield memory_cache
+    memory_cache.clear()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def place_cache():
+    """
+    Очистка кэша объектов любимых мест в памяти процесса между тестами.
+
+    :return:
+    """
+
+    places_cache.clear()
+    yield places_cache
+    places_cache.clear()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def client_resilience(mocker: MockerFixture):
+    """
+    Сброс состояния выключателей и учета времени ответа внешних сервисов между тестами.
+
+    :param mocker: MockerFixture
+    :return:
+    """
+
+    mocker.patch.dict("clients.base.base._breakers", clear=True)
+    mocker.patch.dict("clients.base.base._latencies", clear=True)
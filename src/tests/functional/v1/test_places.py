@@ -1,7 +1,9 @@
 import pytest
 from starlette import status
 
+from integrations.events.schemas import CountryCityDTO
 from models import Place
+from repositories.outbox_repository import OutboxRepository
 from repositories.places_repository import PlacesRepository
 
 
@@ -84,3 +86,473 @@ class TestPlacesCreateMethod:
         assert created_data[0].country == mock_response["countryCode"]
         assert created_data[0].city == mock_response["city"]
         assert created_data[0].locality == mock_response["locality"]
+
+        # проверка записи события для Countries Informer в таблицу исходящих событий
+        events = await OutboxRepository(session).find_all_by(limit=100)
+        assert len(events) == 1
+        assert CountryCityDTO.parse_raw(events[0].payload) == CountryCityDTO(
+            city=mock_response["city"], alpha2code=mock_response["countryCode"]
+        )
+
+
+@pytest.mark.usefixtures("session")
+class TestPlacesNearbyMethod:
+    """
+    Тестирование метода получения списка ближайших любимых мест.
+    """
+
+    @staticmethod
+    async def get_endpoint() -> str:
+        """
+        Получение адреса метода API.
+
+        :return:
+        """
+
+        return "/api/v1/places/nearby"
+
+    @pytest.mark.asyncio
+    async def test_method_success(self, client, session):
+        """
+        Тестирование успешного сценария.
+
+        :param client: Фикстура клиента для запросов.
+        :param session: Фикстура сессии для работы с БД.
+        :return:
+        """
+
+        repository = PlacesRepository(session)
+        # места на расстоянии около 110 и 1100 метров и около 111 километров от точки поиска
+        near = await repository.create_model(
+            Place(latitude=55.001, longitude=37.0, description="Рядом")
+        )
+        farther = await repository.create_model(
+            Place(latitude=55.01, longitude=37.0, description="Дальше")
+        )
+        await repository.create_model(
+            Place(latitude=56.0, longitude=37.0, description="Далеко")
+        )
+
+        response = await client.get(
+            await self.get_endpoint(),
+            params={"lat": 55.0, "lon": 37.0, "radius": 5000},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["data"]] == [near, farther]
+
+
+@pytest.mark.usefixtures("session")
+class TestPlacesListMethod:
+    """
+    Тестирование метода получения списка любимых мест.
+    """
+
+    @staticmethod
+    async def get_endpoint() -> str:
+        """
+        Получение адреса метода API.
+
+        :return:
+        """
+
+        return "/api/v1/places"
+
+    @pytest.mark.asyncio
+    async def test_pagination(self, client, session):
+        """
+        Тестирование постраничной выборки по курсорам.
+
+        :param client: Фикстура клиента для запросов.
+        :param session: Фикстура сессии для работы с БД.
+        :return:
+        """
+
+        repository = PlacesRepository(session)
+        primary_keys = [
+            await repository.create_model(
+                Place(latitude=10.0, longitude=20.0, description=f"Место {index}")
+            )
+            for index in range(5)
+        ]
+
+        first = (
+            await client.get(
+                await self.get_endpoint(), params={"limit": 2, "descending": True}
+            )
+        ).json()
+        second = (
+            await client.get(
+                await self.get_endpoint(),
+                params={"limit": 2, "descending": True, "cursor": first["next_cursor"]},
+            )
+        ).json()
+        previous = (
+            await client.get(
+                await self.get_endpoint(),
+                params={
+                    "limit": 2,
+                    "descending": True,
+                    "cursor": second["prev_cursor"],
+                },
+            )
+        ).json()
+
+        assert [item["id"] for item in first["data"]] == primary_keys[:-3:-1]
+        assert first["prev_cursor"] is None
+        assert [item["id"] for item in second["data"]] == primary_keys[-3:-5:-1]
+        assert previous["data"] == first["data"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, client):
+        """
+        Тестирование передачи некорректного курсора.
+
+        :param client: Фикстура клиента для запросов.
+        :return:
+        """
+
+        response = await client.get(
+            await self.get_endpoint(), params={"cursor": "invalid"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["error"]["code"] == "invalid_cursor"
+
+
+@pytest.mark.usefixtures("session")
+class TestPlacesExportMethod:
+    """
+    Тестирование метода выгрузки любимых мест.
+    """
+
+    @staticmethod
+    async def get_endpoint() -> str:
+        """
+        Получение адреса метода API.
+
+        :return:
+        """
+
+        return "/api/v1/places/export"
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self, client, session):
+        """
+        Тестирование выгрузки в формате NDJSON.
+
+        :param client: Фикстура клиента для запросов.
+        :param session: Фикстура сессии для работы с БД.
+        :return:
+        """
+
+        repository = PlacesRepository(session)
+        primary_keys = [
+            await repository.create_model(
+                Place(latitude=10.0, longitude=20.0, description=f"Место {index}")
+            )
+            for index in range(3)
+        ]
+
+        response = await client.get(
+            await self.get_endpoint(), params={"format": "ndjson"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        places = [Place.parse_raw(line) for line in response.text.splitlines()]
+        assert [place.id for place in places] == primary_keys
+
+    @pytest.mark.asyncio
+    async def test_csv(self, client, session):
+        """
+        Тестирование выгрузки в формате CSV.
+
+        :param client: Фикстура клиента для запросов.
+        :param session: Фикстура сессии для работы с БД.
+        :return:
+        """
+
+        primary_key = await PlacesRepository(session).create_model(
+            Place(latitude=10.0, longitude=20.0, description="Место")
+        )
+
+        response = await client.get(await self.get_endpoint(), params={"format": "csv"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+        header, row = response.text.splitlines()
+        assert header.split(",") == list(Place.__fields__)
+        assert row.split(",")[header.split(",").index("id")] == str(primary_key)
+
+
+@pytest.mark.usefixtures("session")
+class TestPlacesBulkCreateMethod:
+    """
+    Тестирование метода пакетного создания любимых мест.
+    """
+
+    @staticmethod
+    async def get_endpoint() -> str:
+        """
+        Получение адреса метода API.
+
+        :return:
+        """
+
+        return "/api/v1/places/bulk"
+
+    @pytest.mark.asyncio
+    async def test_method_success(self, client, session, httpx_mock):
+        """
+        Тестирование успешного сценария с ошибкой валидации одного из объектов.
+
+        :param client: Фикстура клиента для запросов.
+        :param session: Фикстура сессии для работы с БД.
+        :param httpx_mock: Фикстура запроса на внешние API.
+        :return:
+        """
+
+        mock_response = {
+            "city": "City",
+            "countryCode": "AA",
+            "locality": "Location",
+        }
+        httpx_mock.add_response(json=mock_response)
+
+        request_body = {
+            "data": [
+                {"latitude": 34.5678, "longitude": 45.6789, "description": "Первое"},
+                {"latitude": 34.5678, "longitude": 45.6789, "description": "Второе"},
+                {"latitude": "invalid", "longitude": 45.6789, "description": "Третье"},
+            ]
+        }
+        response = await client.post(await self.get_endpoint(), json=request_body)
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json()["data"]
+        assert [result["index"] for result in results] == [0, 1, 2]
+        assert isinstance(results[0]["id"], int)
+        assert isinstance(results[1]["id"], int)
+        assert results[2]["id"] is None
+        assert results[2]["errors"][0]["loc"] == ["latitude"]
+
+        # одинаковые координаты запрашиваются у внешнего сервиса один раз
+        assert len(httpx_mock.get_requests()) == 1
+
+        repository = PlacesRepository(session)
+        for result, item in zip(results[:2], request_body["data"]):
+            created = await repository.find(result["id"])
+            assert created.description == item["description"]
+            assert created.city == mock_response["city"]
+
+        # событие для одного и того же города записывается один раз
+        events = await OutboxRepository(session).find_all_by(limit=100)
+        assert len(events) == 1
+
+
+@pytest.mark.usefixtures("session")
+class TestPlacesImportMethod:
+    """
+    Тестирование метода загрузки любимых мест из файла.
+    """
+
+    @staticmethod
+    async def get_endpoint() -> str:
+        """
+        Получение адреса метода API.
+
+        :return:
+        """
+
+        return "/api/v1/places/import"
+
+    @pytest.mark.asyncio
+    async def test_csv(self, client, session):
+        """
+        Тестирование загрузки файла в формате CSV.
+
+        :param client: Фикстура клиента для запросов.
+        :param session: Фикстура сессии для работы с БД.
+        :return:
+        """
+
+        content = (
+            "latitude,longitude,description\n"
+            "10.0,20.0,Первое\n"
+            "invalid,20.0,Второе\n"
+            "30.0,40.0,Третье\n"
+        )
+        response = await client.post(
+            await self.get_endpoint(),
+            params={"format": "csv"},
+            content=content.encode(),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        assert result["total"] == 3
+        assert result["imported"] == 2
+        assert result["invalid"] == 1
+        assert result["errors"][0]["row"] == 2
+
+        places = await PlacesRepository(session).find_all_by(limit=10)
+        assert [place.description for place in places] == ["Первое", "Третье"]
+        assert all(place.created_at for place in places)
+
+
+@pytest.mark.usefixtures("session")
+class TestPlacesCacheInvalidation:
+    """
+    Тестирование кэширования объектов любимых мест при изменении.
+    """
+
+    @pytest.mark.asyncio
+    async def test_update_delete(self, client, session, place_cache):
+        """
+        Тестирование удаления объекта из кэша при изменении и удалении.
+
+        :param client: Фикстура клиента для запросов.
+        :param session: Фикстура сессии для работы с БД.
+        :param place_cache: Фикстура кэша объектов любимых мест.
+        :return:
+        """
+
+        primary_key = await PlacesRepository(session).create_model(
+            Place(latitude=10.0, longitude=20.0, description="Место")
+        )
+        endpoint = f"/api/v1/places/{primary_key}"
+
+        response = await client.get(endpoint)
+        assert response.json()["data"]["description"] == "Место"
+        assert await place_cache.get(primary_key) is not None
+
+        await client.patch(endpoint, json={"description": "Новое место"})
+        response = await client.get(endpoint)
+        assert response.json()["data"]["description"] == "Новое место"
+
+        await client.delete(endpoint)
+        assert await place_cache.get(primary_key) is None
+        response = await client.get(endpoint)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.usefixtures("session")
+class TestPlacesBulkUpdateMethod:
+    """
+    Тестирование метода пакетного обновления любимых мест.
+    """
+
+    @staticmethod
+    async def get_endpoint() -> str:
+        """
+        Получение адреса метода API.
+
+        :return:
+        """
+
+        return "/api/v1/places"
+
+    @pytest.mark.asyncio
+    async def test_method_success(self, client, session):
+        """
+        Тестирование обновления существующих объектов с пропуском отсутствующих.
+
+        :param client: Фикстура клиента для запросов.
+        :param session: Фикстура сессии для работы с БД.
+        :return:
+        """
+
+        repository = PlacesRepository(session)
+        primary_keys = [
+            await repository.create_model(
+                Place(latitude=10.0, longitude=20.0, description=f"Место {index}")
+            )
+            for index in range(2)
+        ]
+
+        response = await client.patch(
+            await self.get_endpoint(),
+            json={
+                "data": [
+                    {"id": primary_keys[1], "description": "Второе место"},
+                    {"id": -1, "description": "Отсутствует"},
+                    {"id": primary_keys[0], "description": "Первое место"},
+                ]
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()["data"]
+        # отсутствующие объекты не возвращаются, порядок соответствует запросу
+        assert [place["id"] for place in data] == [primary_keys[1], primary_keys[0]]
+        assert [place["description"] for place in data] == [
+            "Второе место",
+            "Первое место",
+        ]
+        assert data[0]["latitude"] == 10.0
+
+    @pytest.mark.asyncio
+    async def test_null_value(self, client, session):
+        """
+        Тестирование отклонения явного значения null для обязательного атрибута.
+
+        :param client: Фикстура клиента для запросов.
+        :param session: Фикстура сессии для работы с БД.
+        :return:
+        """
+
+        primary_key = await PlacesRepository(session).create_model(
+            Place(latitude=10.0, longitude=20.0, description="Место")
+        )
+
+        response = await client.patch(
+            await self.get_endpoint(),
+            json={"data": [{"id": primary_key, "latitude": None}]},
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.usefixtures("session")
+class TestPlacesBulkDeleteMethod:
+    """
+    Тестирование метода пакетного удаления любимых мест.
+    """
+
+    @staticmethod
+    async def get_endpoint() -> str:
+        """
+        Получение адреса метода API.
+
+        :return:
+        """
+
+        return "/api/v1/places"
+
+    @pytest.mark.asyncio
+    async def test_method_success(self, client, session):
+        """
+        Тестирование удаления нескольких объектов.
+
+        :param client: Фикстура клиента для запросов.
+        :param session: Фикстура сессии для работы с БД.
+        :return:
+        """
+
+        repository = PlacesRepository(session)
+        primary_keys = [
+            await repository.create_model(
+                Place(latitude=10.0, longitude=20.0, description=f"Место {index}")
+            )
+            for index in range(3)
+        ]
+
+        response = await client.delete(
+            await self.get_endpoint(), params={"ids": [*primary_keys[:2], -1]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(response.json()["data"]) == primary_keys[:2]
+        assert await repository.find(primary_keys[0]) is None
+        assert await repository.find(primary_keys[2]) is not None
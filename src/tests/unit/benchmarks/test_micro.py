@@ -0,0 +1,51 @@
+import inspect
+
+import pytest
+
+from benchmarks.micro import BENCHMARKS, Context, measure
+from benchmarks.stubs import stub_services
+
+
+class TestMicroBenchmarks:
+    """
+    Тестирование измерения производительности отдельных операций.
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "item",
+        [item for item in BENCHMARKS if not item.needs_db],
+        ids=lambda item: item.name,
+    )
+    async def test_operations(self, item):
+        """
+        Тестирование выполнения операций, не требующих базы данных.
+
+        :param item: Измеряемая операция.
+        :return:
+        """
+
+        with stub_services():
+            result = item.function(Context())
+            if inspect.isawaitable(result):
+                result = await result
+
+        assert result is not None
+
+    @pytest.mark.asyncio
+    async def test_measure(self):
+        """
+        Тестирование измерения скорости и выделения памяти.
+
+        :return:
+        """
+
+        result = await measure(
+            lambda context: [0] * 1000, Context(), duration=0.1, repeat=2
+        )
+
+        assert result["ops_per_sec"] > 0
+        assert result["us_per_op"] > 0
+        # список из 1000 элементов занимает не менее 8000 байт
+        assert result["peak_bytes"] >= 8000
+        assert result["retained_bytes_per_op"] < 1000
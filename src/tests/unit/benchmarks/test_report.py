@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from benchmarks.load import measure
+from benchmarks.report import compare, percentile, summarize
+
+
+class TestReport:
+    """
+    Тестирование формирования отчетов об измерении производительности.
+    """
+
+    def test_percentile(self):
+        """
+        Тестирование расчета перцентилей методом ближайшего ранга.
+
+        :return:
+        """
+
+        samples = [float(value) for value in range(1, 101)]
+
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 95) == 95
+        assert percentile(samples, 99.5) == 100
+        assert percentile([], 50) == 0
+
+    def test_summarize(self):
+        """
+        Тестирование расчета пропускной способности и времени ответа.
+
+        :return:
+        """
+
+        result = summarize([0.003, 0.001, 0.002, 0.004], elapsed=0.5, errors=1)
+
+        assert result["requests"] == 4
+        assert result["errors"] == 1
+        assert result["throughput"] == 8
+        assert result["latency_ms"]["p50"] == 2
+        assert result["latency_ms"]["max"] == 4
+
+    def test_compare(self):
+        """
+        Тестирование сравнения результатов двух отчетов.
+
+        :return:
+        """
+
+        baseline = {
+            "results": [
+                {"scenario": "get", "throughput": 100, "latency_ms": {"p95": 10}},
+                {"scenario": "list", "throughput": 50, "latency_ms": {"p95": 20}},
+            ]
+        }
+        current = {
+            "results": [
+                {"scenario": "get", "throughput": 150, "latency_ms": {"p95": 8}},
+                {"scenario": "create", "throughput": 10, "latency_ms": {"p95": 90}},
+            ]
+        }
+
+        rows = compare(
+            baseline,
+            current,
+            keys=("scenario",),
+            metrics=("throughput", "latency_ms.p95"),
+        )
+
+        assert len(rows) == 1
+        row = rows[0]
+
+        assert row["scenario"] == "get"
+        assert row["throughput"] == {"baseline": 100, "current": 150, "change": 50.0}
+        assert row["latency_ms.p95"]["change"] == -20.0
+
+    @pytest.mark.asyncio
+    async def test_measure(self):
+        """
+        Тестирование выполнения операции с заданной конкурентностью.
+
+        :return:
+        """
+
+        active = 0
+        max_active = 0
+        calls = 0
+
+        async def operation(_client) -> bool:
+            nonlocal active, max_active, calls
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            calls += 1
+
+            return calls % 5 != 0
+
+        result = await measure(None, operation, requests=20, concurrency=4)
+
+        assert calls == result["requests"] == 20
+        assert result["errors"] == 4
+        assert max_active == 4
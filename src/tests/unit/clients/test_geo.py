@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from clients.base.base import close_http_client
+from clients.geo import LocationClient, SingleFlight, location_flights
+from clients.shemas import LocalityDTO
+
+
+class TestLocationClient:
+    """
+    Тестирование клиента для получения данных о местонахождении.
+    """
+
+    @pytest.mark.asyncio
+    async def test_get_location(self, httpx_mock):
+        """
+        Тестирование получения данных о местонахождении.
+
+        :param httpx_mock: Фикстура запроса на внешние API.
+        :return:
+        """
+
+        httpx_mock.add_response(
+            json={"city": "City", "countryCode": "AA", "locality": "Location"}
+        )
+
+        location = await LocationClient().get_location(latitude=1.23, longitude=4.56)
+
+        assert location == LocalityDTO(
+            city="City", alpha2code="AA", locality="Location"
+        )
+
+    @pytest.mark.asyncio
+    async def test_shared_http_client(self):
+        """
+        Тестирование использования общего HTTP-клиента всеми экземплярами клиентов.
+
+        :return:
+        """
+
+        http_client = LocationClient().http_client
+        assert LocationClient().http_client is http_client
+
+        # после закрытия при следующем обращении создается новый HTTP-клиент
+        await close_http_client()
+        assert http_client.is_closed
+        assert LocationClient().http_client is not http_client
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self, httpx_mock):
+        """
+        Тестирование объединения одновременных запросов для одинаковых координат.
+
+        :param httpx_mock: Фикстура запроса на внешние API.
+        :return:
+        """
+
+        httpx_mock.add_response(
+            json={"city": "City", "countryCode": "AA", "locality": "Location"}
+        )
+        coalesced = location_flights.stats.coalesced
+
+        locations = await asyncio.gather(
+            *(
+                LocationClient().get_location(latitude=1.23, longitude=4.56)
+                for _ in range(5)
+            ),
+            LocationClient().get_location(latitude=1.230001, longitude=4.56),
+        )
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert all(location.city == "City" for location in locations)
+        assert location_flights.stats.coalesced - coalesced == 5
+        assert len(location_flights) == 0
+
+
+class TestSingleFlight:
+    """
+    Тестирование объединения одновременных вызовов.
+    """
+
+    @pytest.mark.asyncio
+    async def test_error(self):
+        """
+        Тестирование передачи ошибки вызова всем ожидающим.
+
+        :return:
+        """
+
+        single_flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("Provider is unavailable")
+
+        results = await asyncio.gather(
+            single_flight.do("key", fail),
+            single_flight.do("key", fail),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert single_flight.stats.calls == 1
+        assert single_flight.stats.coalesced == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_waiter(self):
+        """
+        Тестирование отмены одного из ожидающих без отмены общего вызова.
+
+        :return:
+        """
+
+        single_flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+
+            return "result"
+
+        first = asyncio.create_task(single_flight.do("key", call))
+        second = asyncio.create_task(single_flight.do("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "result"
+        assert first.cancelled()
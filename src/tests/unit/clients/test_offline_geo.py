@@ -0,0 +1,134 @@
+import math
+import random
+import zipfile
+
+import pytest
+
+from clients.offline_geo import Gazetteer, KDTree, OfflineLocationClient, to_point
+from clients.shemas import LocalityDTO
+
+#: фрагмент справочника GeoNames (geonameid, name, ..., latitude, longitude, ..., population)
+CITIES = [
+    ("Moscow", 55.75222, 37.61556, "RU", 10381222),
+    ("Khimki", 55.89704, 37.42969, "RU", 232066),
+    ("Zelenograd", 55.9825, 37.18139, "RU", 0),
+    ("Suva", -18.14161, 178.44149, "FJ", 77366),
+    ("Apia", -13.83333, -171.76666, "WS", 40407),
+]
+
+
+def geonames_line(index: int, city: tuple[str, float, float, str, int]) -> str:
+    """
+    Формирование строки файла GeoNames.
+
+    :param index: Идентификатор записи.
+    :param city: Название, широта, долгота, код страны и население.
+    :return:
+    """
+
+    name, latitude, longitude, country, population = city
+    fields = [str(index), name, name, "", str(latitude), str(longitude), "P", "PPL"]
+    fields += [country, "", "", "", "", "", str(population), "", "", "", "2022-01-01"]
+
+    return "\t".join(fields)
+
+
+class TestKDTree:
+    """
+    Тестирование поиска ближайшей точки.
+    """
+
+    def test_nearest(self):
+        """
+        Тестирование соответствия результата полному перебору.
+
+        :return:
+        """
+
+        generator = random.Random(42)
+        points = [
+            to_point(generator.uniform(-90, 90), generator.uniform(-180, 180))
+            for _ in range(2000)
+        ]
+        tree = KDTree(points)
+
+        for _ in range(200):
+            point = to_point(generator.uniform(-90, 90), generator.uniform(-180, 180))
+            index, distance = tree.nearest(point)
+            distances = [math.dist(item, point) for item in points]
+            expected = distances.index(min(distances))
+
+            assert index == expected
+            assert distance == pytest.approx(math.dist(points[expected], point))
+
+        assert KDTree([]).nearest(points[0]) == (-1, math.inf)
+
+
+class TestOfflineLocationClient:
+    """
+    Тестирование получения данных о местонахождении по локальному справочнику.
+    """
+
+    @pytest.fixture
+    def gazetteer_file(self, tmp_path):
+        """
+        Фикстура файла справочника в архиве zip.
+
+        :param tmp_path: Фикстура временного каталога.
+        :return:
+        """
+
+        path = tmp_path / "cities.zip"
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr(
+                "cities.txt",
+                "\n".join(
+                    geonames_line(index, city) for index, city in enumerate(CITIES)
+                ),
+            )
+
+        return path
+
+    def test_archive_without_data(self, tmp_path):
+        """
+        Тестирование ошибки загрузки архива без файла справочника.
+
+        :param tmp_path: Фикстура временного каталога.
+        :return:
+        """
+
+        path = tmp_path / "cities.zip"
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("readme.md", "")
+
+        with pytest.raises(ValueError, match="No .txt file"):
+            Gazetteer.load(path)
+
+    @pytest.mark.asyncio
+    async def test_get_location(self, mocker, gazetteer_file):
+        """
+        Тестирование поиска населенного пункта и города.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :param gazetteer_file: Фикстура файла справочника.
+        :return:
+        """
+
+        mocker.patch("settings.settings.geocoder.city_population", 15000)
+        mocker.patch("settings.settings.geocoder.max_distance", 50000)
+        mocker.patch(
+            "clients.offline_geo.get_gazetteer",
+            return_value=Gazetteer.load(gazetteer_file),
+        )
+        client = OfflineLocationClient()
+
+        # ближайший населенный пункт – Зеленоград, ближайший город – Химки
+        assert await client.get_location(55.99, 37.2) == LocalityDTO(
+            city="Khimki", alpha2code="RU", locality="Zelenograd"
+        )
+        # вдали от населенных пунктов данные не заполняются
+        assert await client.get_location(0.0, 0.0) == LocalityDTO()
+
+        # поиск через 180-й меридиан (около 175 км до Сувы, около 1000 км до Апии)
+        mocker.patch("settings.settings.geocoder.max_distance", 500000)
+        assert (await client.get_location(-18.0, -179.9)).locality == "Suva"
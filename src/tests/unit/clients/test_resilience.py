@@ -0,0 +1,219 @@
+import asyncio
+from typing import Optional, Union
+
+import pytest
+
+from clients.base.base import BaseClient
+from clients.base.resilience import CircuitBreaker, LatencyTracker
+
+
+class SlowClient(BaseClient):
+    """
+    Клиент с заданным временем ответа для каждого запроса.
+    """
+
+    def __init__(
+        self, delays: list[float], result: Optional[Union[dict, Exception]] = None
+    ) -> None:
+        self.delays = delays
+        self.result = result
+        self.calls = 0
+
+    @property
+    def base_url(self) -> str:
+        return "https://slow.example.com/"
+
+    async def _request(self, url: str) -> Optional[dict]:
+        # pylint: disable=unused-argument
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+        await asyncio.sleep(delay)
+        if isinstance(self.result, Exception):
+            raise self.result
+
+        return self.result
+
+
+class TestCircuitBreaker:
+    """
+    Тестирование автоматического выключателя.
+    """
+
+    def test_transitions(self, mocker):
+        """
+        Тестирование размыкания, пробных вызовов и замыкания.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        monotonic = mocker.patch("clients.base.resilience.time.monotonic")
+        monotonic.return_value = 100.0
+        breaker = CircuitBreaker(
+            failure_rate_threshold=0.5,
+            minimum_calls=4,
+            window_size=10,
+            open_duration=30,
+            half_open_calls=2,
+        )
+
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+        assert breaker.stats.rejected == 1
+
+        # по истечении времени размыкания пропускаются только пробные вызовы
+        monotonic.return_value = 130.0
+        assert breaker.allow() and breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.stats.opened == 2
+
+        monotonic.return_value = 160.0
+        assert breaker.allow() and breaker.allow()
+        breaker.record_success()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestLatencyTracker:
+    """
+    Тестирование учета времени ответа.
+    """
+
+    def test_percentile(self):
+        """
+        Тестирование расчета перцентилей.
+
+        :return:
+        """
+
+        tracker = LatencyTracker(window_size=100, minimum_samples=10)
+        for value in range(1, 10):
+            tracker.record(value / 100)
+        assert tracker.percentile(50) is None
+
+        tracker.record(0.1)
+        assert tracker.percentile(50) == 0.05
+        assert tracker.percentile(90) == 0.09
+        assert tracker.percentile(100) == 0.1
+
+
+class TestBaseClient:
+    """
+    Тестирование защиты запросов к внешним сервисам.
+    """
+
+    @pytest.mark.asyncio
+    async def test_open_breaker(self):
+        """
+        Тестирование пропуска запросов при разомкнутом выключателе.
+
+        :return:
+        """
+
+        client = SlowClient([0])
+        client.breaker._open()  # pylint: disable=protected-access
+
+        assert await client.fetch("https://slow.example.com/") is None
+        assert client.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_adaptive_timeout(self, mocker):
+        """
+        Тестирование таймаута по перцентилю времени предыдущих ответов.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        mocker.patch("settings.settings.resilience.hedging", False)
+        mocker.patch("settings.settings.resilience.min_timeout", 0.01)
+        client = SlowClient([0.5], result={"city": "City"})
+        for _ in range(20):
+            client.latency.record(0.01)
+
+        assert await client.fetch("https://slow.example.com/") is None
+        assert client.breaker.stats.failures == 1
+
+    @pytest.mark.asyncio
+    async def test_hedged_request(self, mocker):
+        """
+        Тестирование дублирующего запроса при долгом ожидании ответа.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        mocker.patch("settings.settings.resilience.min_timeout", 1.0)
+        client = SlowClient([0.5, 0.01], result={"city": "City"})
+        for _ in range(20):
+            client.latency.record(0.02)
+
+        started = asyncio.get_running_loop().time()
+        assert await client.fetch("https://slow.example.com/") == {"city": "City"}
+
+        assert client.calls == 2
+        assert asyncio.get_running_loop().time() - started < 0.3
+        assert client.breaker.stats.successes == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_growth(self, mocker):
+        """
+        Тестирование увеличения таймаута при росте времени ответа сервиса.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        mocker.patch("settings.settings.resilience.hedging", False)
+        mocker.patch("settings.settings.resilience.min_timeout", 0.01)
+        client = SlowClient([0.1], result={"city": "City"})
+        for _ in range(20):
+            client.latency.record(0.01)
+
+        results = [await client.fetch("https://slow.example.com/") for _ in range(5)]
+
+        # запросы по таймауту учитываются со временем ответа, равным таймауту,
+        # поэтому таймаут удваивается до превышения нового времени ответа
+        assert results[0] is None
+        assert results[-1] == {"city": "City"}
+        assert client.latency.percentile(99) >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_probe_release(self, mocker):
+        """
+        Тестирование учета пробных вызовов при ошибке разбора ответа и отмене.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        mocker.patch("settings.settings.resilience.half_open_calls", 1)
+        mocker.patch("settings.settings.resilience.open_duration", 0.05)
+        client = SlowClient([0], result=ValueError("Invalid JSON"))
+        client.breaker._open()  # pylint: disable=protected-access
+        await asyncio.sleep(0.05)
+
+        # ошибка разбора ответа учитывается как неуспешный пробный вызов
+        assert await client.fetch("https://slow.example.com/") is None
+        assert client.breaker.state == CircuitBreaker.OPEN
+
+        # отмена пробного вызова освобождает его для следующего запроса
+        await asyncio.sleep(0.05)
+        client.delays = [1.0]
+        task = asyncio.ensure_future(client.fetch("https://slow.example.com/"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert client.breaker.state == CircuitBreaker.HALF_OPEN
+        assert client.breaker.allow()
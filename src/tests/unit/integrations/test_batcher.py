@@ -0,0 +1,70 @@
+import pytest
+
+from integrations.events.batcher import EventBatcher
+
+
+class TestEventBatcher:
+    """
+    Тестирование пакетной публикации сообщений.
+    """
+
+    @pytest.fixture
+    def producer(self, mocker):
+        """
+        Фикстура продюсера событий.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        producer = mocker.MagicMock()
+        producer.publish_many = mocker.AsyncMock(return_value=True)
+
+        return producer
+
+    @pytest.mark.asyncio
+    async def test_send_by_bytes(self, producer):
+        """
+        Тестирование разбиения сообщений на пакеты по максимальному объему.
+
+        :param producer: Фикстура продюсера событий.
+        :return:
+        """
+
+        batcher = EventBatcher("queue", producer=producer, max_bytes=10)
+        items = [("a", "x" * 6), ("b", "y" * 4), ("c", "z" * 2)]
+
+        assert await batcher.send(items)
+        assert producer.publish_many.await_args_list[0].args == (
+            "queue",
+            ["x" * 6, "y" * 4],
+        )
+        assert producer.publish_many.await_args_list[1].args == ("queue", ["z" * 2])
+        assert batcher.stats.flushes == 2
+        assert batcher.stats.bytes == 12
+        assert batcher.stats.max_batch_size == 2
+
+    @pytest.mark.asyncio
+    async def test_send(self, producer):
+        """
+        Тестирование немедленной отправки сообщений пакетами.
+
+        :param producer: Фикстура продюсера событий.
+        :return:
+        """
+
+        batcher = EventBatcher("queue", producer=producer, max_messages=2)
+        items = [("a", "first"), ("b", "second"), ("a", "first"), ("c", "third")]
+
+        assert await batcher.send(items)
+        assert producer.publish_many.await_args_list[0].args == (
+            "queue",
+            ["first", "second"],
+        )
+        assert producer.publish_many.await_args_list[1].args == ("queue", ["third"])
+        assert batcher.stats.collapsed == 1
+
+        # при ошибке публикации отправка прекращается
+        producer.publish_many.return_value = False
+        assert not await batcher.send(items)
+        assert batcher.stats.failed_flushes == 1
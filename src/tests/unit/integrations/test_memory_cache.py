@@ -0,0 +1,61 @@
+import time
+
+from integrations.cache.memory import MemoryCache
+
+
+class TestMemoryCache:
+    """
+    Тестирование кэша в памяти процесса.
+    """
+
+    def test_get_set(self):
+        """
+        Тестирование сохранения и получения значений.
+
+        :return:
+        """
+
+        cache = MemoryCache(max_size=10, ttl=60)
+        assert cache.get("key") is None
+
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_ttl(self, mocker):
+        """
+        Тестирование устаревания записей.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        cache = MemoryCache(max_size=10, ttl=60)
+        cache.set("key", "value")
+        cache.set("short", "value", ttl=1)
+
+        mocker.patch.object(time, "monotonic", return_value=time.monotonic() + 30)
+        assert cache.get("key") == "value"
+        assert cache.get("short") is None
+        assert cache.stats.expirations == 1
+        assert len(cache) == 1
+
+    def test_eviction(self):
+        """
+        Тестирование вытеснения давно неиспользуемых записей.
+
+        :return:
+        """
+
+        cache = MemoryCache(max_size=2, ttl=60)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        # обращение к первой записи делает вторую самой давно неиспользуемой
+        cache.get("first")
+        cache.set("third", 3)
+
+        assert cache.get("second") is None
+        assert cache.get("first") == 1
+        assert cache.get("third") == 3
+        assert cache.stats.evictions == 1
@@ -0,0 +1,125 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from integrations.metrics import (
+    MetricsMiddleware,
+    instrument_engine,
+    metrics,
+    observe_publish,
+)
+from services.metrics_service import register_collector
+
+
+class TestMetrics:
+    """
+    Тестирование сбора метрик приложения.
+    """
+
+    @pytest.fixture
+    def app(self):
+        """
+        Фикстура приложения с учетом метрик.
+
+        :return:
+        """
+
+        app = FastAPI()
+
+        @app.get("/places/{primary_key}")
+        async def get_place(primary_key: int):
+            return {"id": primary_key}
+
+        app.add_route("/metrics", metrics, include_in_schema=False)
+        app.add_middleware(MetricsMiddleware)
+
+        return app
+
+    @staticmethod
+    def count(route: str, status: str) -> float:
+        """
+        Количество учтенных запросов по шаблону маршрута и статусу ответа.
+
+        :param route: Шаблон маршрута.
+        :param status: Статус ответа.
+        :return:
+        """
+
+        return (
+            REGISTRY.get_sample_value(
+                "http_request_duration_seconds_count",
+                {"method": "GET", "route": route, "status": status},
+            )
+            or 0
+        )
+
+    @pytest.mark.asyncio
+    async def test_route_template(self, app):
+        """
+        Тестирование учета запросов по шаблону маршрута, а не по адресу.
+
+        :param app: Фикстура приложения с учетом метрик.
+        :return:
+        """
+
+        before = self.count("/places/{primary_key}", "200")
+        unmatched = self.count("unmatched", "404")
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            await client.get("/places/1")
+            await client.get("/places/2")
+            await client.get("/unknown/3")
+
+        assert self.count("/places/{primary_key}", "200") == before + 2
+        assert self.count("unmatched", "404") == unmatched + 1
+        assert (
+            REGISTRY.get_sample_value("http_requests_in_progress", {"method": "GET"})
+            == 0
+        )
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint(self, app):
+        """
+        Тестирование получения метрик, включая метрики состояния компонентов.
+
+        :param app: Фикстура приложения с учетом метрик.
+        :return:
+        """
+
+        register_collector()
+        # повторная регистрация не приводит к ошибке
+        register_collector()
+        observe_publish("queue", "success", 3, time.perf_counter())
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'rabbitmq_published_messages_total{outcome="success",queue="queue"}' in (
+            response.text
+        )
+        assert 'cache_hits_total{cache="place_memory"}' in response.text
+        assert "db_pool_connections" in response.text
+
+    def test_failed_statement(self):
+        """
+        Тестирование учета времени запросов после запроса, завершившегося ошибкой.
+
+        :return:
+        """
+
+        engine = create_engine("sqlite://")
+        instrument_engine(SimpleNamespace(sync_engine=engine))
+
+        with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing"))
+            connection.execute(text("SELECT 1"))
+
+            assert connection.info["query_started"] == []
@@ -0,0 +1,85 @@
+import pytest
+from aiormq.exceptions import ChannelInvalidStateError
+
+from integrations.events.producer import EventProducer
+
+
+class TestEventProducer:
+    """
+    Тестирование продюсера событий.
+    """
+
+    @pytest.mark.asyncio
+    async def test_publish_without_connection(self, mocker):
+        """
+        Тестирование публикации при недоступном брокере сообщений.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        connect = mocker.patch(
+            "aio_pika.connect_robust", side_effect=ConnectionRefusedError
+        )
+
+        producer = EventProducer()
+        await producer.publish(queue_name="queue", body="{}")
+
+        connect.assert_awaited_once()
+        assert producer.channel_pool is None
+
+    @pytest.mark.asyncio
+    async def test_publish(self, mocker):
+        """
+        Тестирование публикации сообщения через пул каналов.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        channel = mocker.MagicMock(is_closed=False)
+        channel.default_exchange.publish = mocker.AsyncMock()
+        connection = mocker.MagicMock()
+        connection.channel = mocker.AsyncMock(return_value=channel)
+        connection.close = mocker.AsyncMock()
+        mocker.patch("aio_pika.connect_robust", return_value=connection)
+
+        producer = EventProducer()
+        await producer.connect()
+        await producer.publish(queue_name="queue", body="first")
+        await producer.publish(queue_name="queue", body="second")
+        await producer.close()
+
+        # канал создается один раз и переиспользуется из пула
+        connection.channel.assert_awaited_once()
+        assert channel.default_exchange.publish.await_count == 2
+        message = channel.default_exchange.publish.await_args_list[0].args[0]
+        assert message.body == b"first"
+        connection.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_publish_closed_channel(self, mocker):
+        """
+        Тестирование повторного открытия канала, закрытого после ошибки.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        channel = mocker.MagicMock(is_closed=False)
+        channel.default_exchange.publish = mocker.AsyncMock(
+            side_effect=[ChannelInvalidStateError("Channel closed"), None]
+        )
+        channel.reopen = mocker.AsyncMock()
+        connection = mocker.MagicMock()
+        connection.channel = mocker.AsyncMock(return_value=channel)
+        mocker.patch("aio_pika.connect_robust", return_value=connection)
+
+        producer = EventProducer()
+        assert not await producer.publish_many("queue", ["first"])
+        channel.is_closed = True
+        assert await producer.publish_many("queue", ["second"])
+
+        # закрытый канал открывается повторно, а не создается новый
+        connection.channel.assert_awaited_once()
+        channel.reopen.assert_awaited_once()
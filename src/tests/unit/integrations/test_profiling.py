@@ -0,0 +1,77 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from integrations.profiling import ProfilingMiddleware
+from settings import ProfilingConfig
+
+
+class TestProfilingMiddleware:
+    """
+    Тестирование профилирования обработки запросов.
+    """
+
+    @staticmethod
+    def build_app(config: ProfilingConfig) -> FastAPI:
+        """
+        Создание приложения с профилированием запросов.
+
+        :param config: Конфигурация профилирования.
+        :return:
+        """
+
+        app = FastAPI()
+
+        @app.get("/places")
+        async def get_list():
+            return [sum(range(1000))]
+
+        app.add_middleware(ProfilingMiddleware, config=config)
+
+        return app
+
+    @pytest.mark.asyncio
+    async def test_header(self, tmp_path):
+        """
+        Тестирование профилирования запросов с отладочным заголовком.
+
+        :param tmp_path: Фикстура временного каталога.
+        :return:
+        """
+
+        config = ProfilingConfig(
+            enabled=True, header_token="secret", output_dir=str(tmp_path), top=5
+        )
+        async with AsyncClient(
+            app=self.build_app(config), base_url="http://test"
+        ) as client:
+            assert (await client.get("/places")).status_code == 200
+            await client.get("/places", headers={"X-Profile": "wrong"})
+            assert not list(tmp_path.iterdir())
+
+            response = await client.get("/places", headers={"X-Profile": "secret"})
+
+        assert response.json() == [499500]
+        (profile,) = tmp_path.glob("*.prof")
+        assert "-GET-get_list-" in profile.name
+        summary = profile.with_suffix(".txt").read_text(encoding="utf-8")
+        assert summary.startswith("GET /places")
+        assert "cumulative" in summary
+
+    @pytest.mark.asyncio
+    async def test_sample_rate(self, tmp_path):
+        """
+        Тестирование профилирования доли запросов.
+
+        :param tmp_path: Фикстура временного каталога.
+        :return:
+        """
+
+        config = ProfilingConfig(enabled=True, sample_rate=1, output_dir=str(tmp_path))
+        async with AsyncClient(
+            app=self.build_app(config), base_url="http://test"
+        ) as client:
+            await client.get("/places")
+            await client.get("/places")
+
+        assert len(list(tmp_path.glob("*.prof"))) == 2
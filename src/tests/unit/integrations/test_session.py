@@ -0,0 +1,63 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from integrations.db import session as db_session
+
+
+class TestSession:
+    """
+    Тестирование учета ожидания соединений из пула.
+    """
+
+    def test_connect_time(self):
+        """
+        Тестирование учета времени установки нового соединения.
+
+        :return:
+        """
+
+        record = SimpleNamespace(info={})
+        db_session.mark_connect_start(None, record, (), {})
+        db_session.record_connect_time(None, record)
+
+        assert "connect_started_at" not in record.info
+        assert record.info["connect_time"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_wait_without_connect_time(self, mocker):
+        """
+        Тестирование исключения времени установки соединения из времени ожидания.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        connection = SimpleNamespace(info={})
+
+        @asynccontextmanager
+        async def connect():
+            # установка нового соединения занимает почти все время выдачи
+            await asyncio.sleep(0.05)
+            connection.info["connect_time"] = 0.05
+            yield connection
+
+        @asynccontextmanager
+        async def async_session(bind):
+            yield SimpleNamespace(bind=bind)
+
+        stats = db_session.PoolStats()
+        mocker.patch.object(db_session, "pool_stats", stats)
+        mocker.patch.object(db_session, "engine", SimpleNamespace(connect=connect))
+        mocker.patch.object(db_session, "async_session", async_session)
+
+        sessions = db_session.get_session()
+        session = await anext(sessions)
+        assert session.bind is connection
+        await sessions.aclose()
+
+        assert stats.checkouts == 1
+        assert stats.max_wait < 0.04
+        assert "connect_time" not in connection.info
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pytest
+
+from repositories.pagination import (
+    Cursor,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class TestCursor:
+    """
+    Тестирование курсоров постраничной выборки.
+    """
+
+    def test_encode_decode(self):
+        """
+        Тестирование формирования и разбора курсора.
+
+        :return:
+        """
+
+        cursor = Cursor(
+            values=[datetime(2022, 10, 29, 10, 33, 54), 42],
+            direction="next",
+            order_by=["created_at", "id"],
+            descending=True,
+        )
+
+        assert decode_cursor(encode_cursor(cursor), [datetime, int]) == cursor
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "not a cursor",
+            encode_cursor(Cursor(["42"], "next", ["id"], False)),
+            encode_cursor(Cursor([42], "forward", ["id"], False)),
+            encode_cursor(Cursor([1, 2], "next", ["id"], False)),
+        ],
+    )
+    def test_invalid(self, value):
+        """
+        Тестирование разбора некорректного курсора.
+
+        :param value: Строка курсора.
+        :return:
+        """
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(value, [int])
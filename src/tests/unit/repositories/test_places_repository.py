@@ -47,3 +47,159 @@ class TestPlacesRepository(TestRepositoryBase):
 
         # тестирование полученного результата
         await self.assert_object(created_object, values)
+
+    @pytest.mark.asyncio
+    async def test_create_model_returning(self, repository, fixture_place):
+        """
+        Тестирование создания записи с возвратом созданной записи целиком.
+
+        :param repository: Фикстура объекта тестируемого репозитория.
+        :param fixture_place: Фикстура объекта любимого места.
+        :return:
+        """
+
+        values = fixture_place.dict(exclude_none=True)
+        created_object = await repository.create_model_returning(fixture_place)
+
+        await self.assert_object(created_object, values)
+        assert created_object.id is not None
+        assert created_object.created_at is not None
+
+    @pytest.mark.asyncio
+    async def test_update_model_returning(self, repository, fixture_place):
+        """
+        Тестирование обновления записи с возвратом обновленной записи целиком.
+
+        :param repository: Фикстура объекта тестируемого репозитория.
+        :param fixture_place: Фикстура объекта любимого места.
+        :return:
+        """
+
+        primary_key = await repository.create_model(fixture_place)
+
+        updated_object = await repository.update_model_returning(
+            primary_key, description="Новое описание"
+        )
+
+        assert updated_object.id == primary_key
+        assert updated_object.description == "Новое описание"
+        assert updated_object.latitude == fixture_place.latitude
+        assert await repository.update_model_returning(-1, city="City") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_by(self, repository, fixture_place):
+        """
+        Тестирование удаления нескольких записей одним запросом.
+
+        :param repository: Фикстура объекта тестируемого репозитория.
+        :param fixture_place: Фикстура объекта любимого места.
+        :return:
+        """
+
+        primary_keys = [
+            await repository.create_model(fixture_place.dict(exclude={"id"}))
+            for _ in range(3)
+        ]
+
+        deleted = await repository.delete_by(id=[*primary_keys[:2], -1])
+
+        assert sorted(deleted) == primary_keys[:2]
+        assert await repository.find(primary_keys[0]) is None
+        assert await repository.find(primary_keys[2]) is not None
+        assert await repository.delete_by(id=primary_keys[0]) == []
+
+    @pytest.mark.asyncio
+    async def test_update_many(self, repository, fixture_place):
+        """
+        Тестирование обновления нескольких записей с разными наборами атрибутов.
+
+        :param repository: Фикстура объекта тестируемого репозитория.
+        :param fixture_place: Фикстура объекта любимого места.
+        :return:
+        """
+
+        primary_keys = [
+            await repository.create_model(fixture_place.dict(exclude={"id"}))
+            for _ in range(3)
+        ]
+
+        results = await repository.update_many(
+            [
+                {"id": primary_keys[0], "latitude": 1.0},
+                {"id": primary_keys[1], "latitude": 2.0},
+                {"id": primary_keys[2], "description": "Новое описание"},
+                {"id": -1, "description": "Отсутствует"},
+            ],
+            previous=("latitude",),
+        )
+
+        updated = {place.id: (place, previous) for place, previous in results}
+        assert sorted(updated) == primary_keys
+        assert updated[primary_keys[1]][0].latitude == 2.0
+        assert updated[primary_keys[1]][1]["latitude"] == fixture_place.latitude
+        assert updated[primary_keys[2]][0].description == "Новое описание"
+        assert updated[primary_keys[2]][0].latitude == fixture_place.latitude
+
+    @pytest.mark.asyncio
+    async def test_update_many_match(self, repository, fixture_place):
+        """
+        Тестирование обновления записей при совпадении значений атрибутов.
+
+        :param repository: Фикстура объекта тестируемого репозитория.
+        :param fixture_place: Фикстура объекта любимого места.
+        :return:
+        """
+
+        primary_key = await repository.create_model(fixture_place.dict(exclude={"id"}))
+
+        results = await repository.update_many(
+            [
+                {
+                    "id": primary_key,
+                    "latitude": fixture_place.latitude + 1,
+                    "description": "Устаревшее описание",
+                }
+            ],
+            match=("latitude",),
+        )
+        assert results == []
+
+        results = await repository.update_many(
+            [
+                {
+                    "id": primary_key,
+                    "latitude": fixture_place.latitude,
+                    "description": "Новое описание",
+                }
+            ],
+            match=("latitude",),
+        )
+        assert len(results) == 1
+        assert results[0][0].description == "Новое описание"
+        assert results[0][0].latitude == fixture_place.latitude
+
+    @pytest.mark.asyncio
+    async def test_stream_by(self, repository, fixture_place):
+        """
+        Тестирование потокового поиска объектов с заданной сортировкой.
+
+        :param repository: Фикстура объекта тестируемого репозитория.
+        :param fixture_place: Фикстура объекта любимого места.
+        :return:
+        """
+
+        primary_keys = [
+            await repository.create_model(fixture_place.dict(exclude={"id"}))
+            for _ in range(3)
+        ]
+
+        partitions = [
+            partition
+            async for partition in repository.stream_by(
+                chunk_size=2, order_by=repository.get_attr("id").desc()
+            )
+        ]
+        assert [len(partition) for partition in partitions] == [2, 1]
+        assert [place.id for partition in partitions for place in partition] == sorted(
+            primary_keys, reverse=True
+        )
@@ -0,0 +1,86 @@
+# pylint: disable=protected-access
+
+from sqlalchemy.dialects import postgresql
+
+from models import Place
+from repositories.places_repository import PlacesRepository
+
+
+class TestStatementTemplates:
+    """
+    Тестирование шаблонов запросов репозитория.
+    """
+
+    @staticmethod
+    def compile(statement) -> str:
+        """
+        Компиляция запроса для PostgreSQL.
+
+        :param statement: Запрос.
+        :return:
+        """
+
+        return " ".join(
+            str(statement.compile(dialect=postgresql.asyncpg.dialect())).split()
+        )
+
+    def test_reuse(self):
+        """
+        Тестирование повторного использования шаблона для одного набора условий.
+
+        :return:
+        """
+
+        repository = PlacesRepository(None)
+        first, first_params = repository._select_template(country="AA", city="City")
+        second, second_params = repository._select_template(city="Town", country="BB")
+
+        assert first is second
+        assert first_params == {"where_country": "AA", "where_city": "City"}
+        assert second_params == {"where_country": "BB", "where_city": "Town"}
+        assert self.compile(first).endswith(
+            "WHERE place.city = %s AND place.country = %s"
+        )
+
+    def test_condition_kinds(self):
+        """
+        Тестирование условий для значения None и списков значений.
+
+        :return:
+        """
+
+        repository = PlacesRepository(None)
+        equal, _ = repository._select_template(city="City")
+        null, null_params = repository._select_template(city=None)
+        many, many_params = repository._select_template(id={1, 2})
+
+        assert equal is not null
+        assert null_params == {}
+        assert self.compile(null).endswith("WHERE place.city IS NULL")
+        assert sorted(many_params["where_id"]) == [1, 2]
+        assert self.compile(many).endswith(
+            "WHERE place.id IN (__[POSTCOMPILE_where_id])"
+        )
+        assert repository._select_template()[0] is not equal
+        assert "WHERE" not in self.compile(repository._select_template()[0])
+
+    def test_model_separation(self):
+        """
+        Тестирование разделения шаблонов по видам запросов
+        (шаблоны общие для репозиториев одной модели).
+
+        :return:
+        """
+
+        class OtherRepository(PlacesRepository):
+            @property
+            def model(self):
+                return Place
+
+        statement, _ = PlacesRepository(None)._select_template(id=1)
+
+        assert OtherRepository(None)._select_template(id=1)[0] is statement
+        assert (
+            PlacesRepository(None)._template("other", {"id": 1}, lambda c: c)[0]
+            is not statement
+        )
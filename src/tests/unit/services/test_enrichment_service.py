@@ -0,0 +1,189 @@
+import asyncio
+from collections import namedtuple
+
+import pytest
+
+from services.enrichment_service import (
+    EnrichmentTask,
+    EnrichmentWorker,
+    PendingEnrichmentRelay,
+)
+from settings import EnrichmentConfig
+
+PendingRow = namedtuple("PendingRow", ["place_id", "attempts", "latitude", "longitude"])
+
+
+class TestEnrichmentWorker:
+    """
+    Тестирование фонового обогащения данных о любимых местах.
+    """
+
+    @pytest.mark.asyncio
+    async def test_retry(self):
+        """
+        Тестирование повторных попыток обработки задачи.
+
+        :return:
+        """
+
+        attempts = []
+
+        async def handler(task: EnrichmentTask) -> bool:
+            attempts.append(task.attempt)
+            if task.attempt < 2:
+                raise RuntimeError("Provider is unavailable")
+
+            return True
+
+        worker = EnrichmentWorker(handler)
+        worker.config = EnrichmentConfig(retry_delay=0.01, max_retries=5)
+        await worker.submit(EnrichmentTask(place_id=1, latitude=1.0, longitude=2.0))
+        await asyncio.sleep(0.1)
+        await worker.stop()
+
+        assert attempts == [0, 1, 2]
+        assert not worker.is_running
+
+    @pytest.mark.asyncio
+    async def test_max_retries(self):
+        """
+        Тестирование ограничения количества повторных попыток.
+
+        :return:
+        """
+
+        attempts = []
+
+        async def handler(task: EnrichmentTask) -> bool:
+            attempts.append(task.attempt)
+
+            return False
+
+        worker = EnrichmentWorker(handler)
+        worker.config = EnrichmentConfig(retry_delay=0.01, max_retries=1)
+        await worker.submit(EnrichmentTask(place_id=1, latitude=1.0, longitude=2.0))
+        await asyncio.sleep(0.1)
+        await worker.stop()
+
+        assert attempts == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_queue_full(self):
+        """
+        Тестирование учета задач, отброшенных при переполнении очереди.
+
+        :return:
+        """
+
+        processed = []
+
+        async def handler(task: EnrichmentTask) -> bool:
+            processed.append(task.place_id)
+
+            return True
+
+        worker = EnrichmentWorker(handler)
+        worker.config = EnrichmentConfig(queue_size=1)
+        for place_id in range(3):
+            await worker.submit(
+                EnrichmentTask(place_id=place_id, latitude=1.0, longitude=2.0)
+            )
+        await asyncio.sleep(0.1)
+        await worker.stop()
+
+        assert processed == [0]
+        assert worker.stats.submitted == 1
+        assert worker.stats.dropped == 2
+        assert worker.stats.succeeded == 1
+
+
+class TestPendingEnrichmentRelay:
+    """
+    Тестирование обогащения данных о местах, отмеченных при загрузке.
+    """
+
+    @pytest.fixture
+    def repository(self, mocker):
+        """
+        Фикстура репозитория отметок о необходимости обогащения данных.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        repository = mocker.AsyncMock()
+        mocker.patch(
+            "services.enrichment_service.PendingEnrichmentRepository",
+            return_value=repository,
+        )
+        mocker.patch("services.enrichment_service.async_session")
+        mocker.patch("services.enrichment_service.places_cache", mocker.AsyncMock())
+
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_process_batch(self, mocker, repository):
+        """
+        Тестирование удаления обработанных отметок и учета неуспешных попыток.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :param repository: Фикстура репозитория отметок.
+        :return:
+        """
+
+        repository.lock_pending.return_value = [
+            PendingRow(place_id=1, attempts=0, latitude=1.0, longitude=2.0),
+            PendingRow(place_id=2, attempts=0, latitude=3.0, longitude=4.0),
+            PendingRow(place_id=3, attempts=5, latitude=5.0, longitude=6.0),
+        ]
+        enrich_places = mocker.patch(
+            "services.enrichment_service._enrich_places",
+            return_value=([True, False, False], [1]),
+        )
+        repository_class = mocker.patch(
+            "services.enrichment_service.PendingEnrichmentRepository",
+            return_value=repository,
+        )
+        places_cache = mocker.patch(
+            "services.enrichment_service.places_cache", mocker.AsyncMock()
+        )
+
+        relay = PendingEnrichmentRelay()
+        relay.config = EnrichmentConfig(max_retries=5)
+
+        assert await relay.process_batch() == 2
+        session, tasks = enrich_places.await_args.args
+        # обогащение выполняется в сессии, удерживающей блокировки отметок
+        assert repository_class.call_args.args[0] is session
+        assert [(task.place_id, task.latitude) for task in tasks] == [
+            (1, 1.0),
+            (2, 3.0),
+            (3, 5.0),
+        ]
+        # после исчерпания попыток отметка удаляется
+        repository.delete_many.assert_awaited_once_with([1, 3])
+        repository.retry_many.assert_awaited_once_with([2])
+        places_cache.delete.assert_awaited_once_with([1])
+
+    @pytest.mark.asyncio
+    async def test_drain(self, mocker, repository):
+        """
+        Тестирование обработки пакетов до прекращения продвижения.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :param repository: Фикстура репозитория отметок.
+        :return:
+        """
+
+        row = PendingRow(place_id=1, attempts=0, latitude=1.0, longitude=2.0)
+        repository.lock_pending.side_effect = [[row], [row], []]
+        mocker.patch(
+            "services.enrichment_service._enrich_places",
+            side_effect=[([True], [1]), ([False], [])],
+        )
+
+        await PendingEnrichmentRelay().drain()
+
+        # обработка прекращается на пакете без успешно обработанных отметок
+        assert repository.lock_pending.await_count == 2
+        repository.retry_many.assert_awaited_with([1])
@@ -0,0 +1,71 @@
+from collections import namedtuple
+
+import pytest
+
+from services.import_service import ImportService
+
+CreatedRow = namedtuple("CreatedRow", ["id"])
+
+
+async def iter_rows(*rows: str):
+    """
+    Поток строк данных.
+
+    :param rows: Строки данных.
+    :return:
+    """
+
+    for row in rows:
+        yield row
+
+
+class TestImportService:
+    """
+    Тестирование загрузки любимых мест из файлов.
+    """
+
+    @pytest.mark.asyncio
+    async def test_import_places(self, mocker):
+        """
+        Тестирование загрузки частями с пропуском некорректных строк.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        mocker.patch("settings.settings.importing.chunk_size", 2)
+        session = mocker.AsyncMock()
+        service = ImportService(session)
+        copy_many = mocker.patch.object(
+            service.places_repository,
+            "copy_many",
+            side_effect=lambda places: [
+                CreatedRow(index) for index, _ in enumerate(places)
+            ],
+        )
+        add_many = mocker.patch.object(
+            service.pending_enrichment_repository,
+            "add_many",
+            new_callable=mocker.AsyncMock,
+        )
+        progress = mocker.Mock()
+
+        lines = iter_rows(
+            '{"latitude": 1.0, "longitude": 2.0, "description": "First"}',
+            '{"latitude": "invalid", "longitude": 2.0, "description": "Second"}',
+            '{"latitude": 3.0, "longitude": 4.0, "description": "Third"}',
+            '{"latitude": 5.0, "longitude": 6.0, "description": "Fourth"}',
+        )
+        stats = await service.import_places(
+            lines, "ndjson", enrich=True, on_progress=progress
+        )
+
+        assert stats.total == 4
+        assert stats.imported == 3
+        assert stats.invalid == 1
+        assert stats.errors[0]["row"] == 2
+        assert [len(call.args[0]) for call in copy_many.call_args_list] == [2, 1]
+        assert session.commit.await_count == 2
+        # объекты отмечаются для обогащения в транзакции загрузки каждой части
+        assert [call.args[0] for call in add_many.await_args_list] == [[0, 1], [0]]
+        assert progress.call_count == 2
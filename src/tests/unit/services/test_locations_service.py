@@ -0,0 +1,189 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from clients.shemas import LocalityDTO
+from models import LocationCache
+from services import locations_service
+from services.locations_service import LocationCacheEviction, LocationsService
+from settings import settings
+
+
+class TestLocationsService:
+    """
+    Тестирование получения данных о местонахождении с кэшированием.
+    """
+
+    @pytest.fixture
+    def service(self, mocker):
+        """
+        Фикстура сервиса с мок-объектом репозитория кэша в БД.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        service = LocationsService(mocker.AsyncMock())
+        service.locations_repository = mocker.AsyncMock()
+        service.locations_repository.find_actual_many.return_value = []
+
+        return service
+
+    @pytest.fixture
+    def location_client(self, mocker):
+        """
+        Фикстура клиента провайдера данных о местонахождении.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        client = mocker.AsyncMock()
+        mocker.patch.object(
+            locations_service, "get_location_client", return_value=client
+        )
+
+        return client
+
+    @pytest.mark.asyncio
+    async def test_durable_hit(self, service, location_client, location_cache):
+        """
+        Тестирование получения данных из кэша в БД без запроса к провайдеру.
+
+        :param service: Фикстура сервиса.
+        :param location_client: Фикстура клиента провайдера.
+        :param location_cache: Фикстура кэша в памяти процесса.
+        :return:
+        """
+
+        service.locations_repository.find_actual_many.return_value = [
+            LocationCache(
+                latitude=10.0,
+                longitude=20.0,
+                country="AA",
+                city="City",
+                locality="Locality",
+                expires_at=datetime.utcnow() + timedelta(hours=1),
+            )
+        ]
+        hits = locations_service.durable_cache_stats.hits
+
+        location = await service.get_location(10.00001, 20.00001)
+
+        assert location == LocalityDTO(
+            city="City", alpha2code="AA", locality="Locality"
+        )
+        service.locations_repository.find_actual_many.assert_awaited_once_with(
+            [(10.0, 20.0)]
+        )
+        location_client.get_location.assert_not_awaited()
+        service.locations_repository.upsert_many.assert_not_awaited()
+        assert locations_service.durable_cache_stats.hits == hits + 1
+        # повторный запрос обслуживается кэшем в памяти процесса
+        assert location_cache.get((10.0, 20.0)) == location
+
+    @pytest.mark.asyncio
+    async def test_offline_provider(
+        self, mocker, service, location_client, location_cache
+    ):
+        """
+        Тестирование работы без кэша в БД при использовании локального справочника.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :param service: Фикстура сервиса.
+        :param location_client: Фикстура клиента провайдера.
+        :param location_cache: Фикстура кэша в памяти процесса.
+        :return:
+        """
+
+        mocker.patch("settings.settings.geocoder.provider", "offline")
+        location_client.get_location.return_value = LocalityDTO(
+            city="City", alpha2code="AA", locality="Locality"
+        )
+
+        location = await service.get_location(10.0, 20.0)
+
+        assert location == LocalityDTO(
+            city="City", alpha2code="AA", locality="Locality"
+        )
+        service.locations_repository.find_actual_many.assert_not_awaited()
+        service.locations_repository.upsert_many.assert_not_awaited()
+        assert location_cache.get((10.0, 20.0)) == location
+
+    @pytest.mark.asyncio
+    async def test_negative_ttl(self, service, location_client, location_cache):
+        """
+        Тестирование кэширования отсутствия данных на меньшее время.
+
+        :param service: Фикстура сервиса.
+        :param location_client: Фикстура клиента провайдера.
+        :param location_cache: Фикстура кэша в памяти процесса.
+        :return:
+        """
+
+        location_client.get_location.side_effect = [
+            LocalityDTO(city="City", alpha2code="AA", locality="Locality"),
+            LocalityDTO(),
+        ]
+
+        locations = await service.get_locations([(10.0, 20.0), (-50.0, -140.0)])
+
+        assert locations[1] == LocalityDTO()
+        (rows,) = service.locations_repository.upsert_many.await_args.args
+        positive, negative = (row["expires_at"] - datetime.utcnow() for row in rows)
+        assert positive.total_seconds() == pytest.approx(
+            settings.location_cache.ttl, abs=5
+        )
+        assert negative.total_seconds() == pytest.approx(
+            settings.location_cache.negative_ttl, abs=5
+        )
+        assert negative < positive
+        assert location_cache.get((-50.0, -140.0)) == LocalityDTO()
+        # устаревшие записи не удаляются при обработке запросов
+        service.locations_repository.delete_expired.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_error_not_cached(self, service, location_client, location_cache):
+        """
+        Тестирование отсутствия кэширования ошибок получения данных.
+
+        :param service: Фикстура сервиса.
+        :param location_client: Фикстура клиента провайдера.
+        :param location_cache: Фикстура кэша в памяти процесса.
+        :return:
+        """
+
+        location_client.get_location.return_value = None
+
+        assert await service.get_location(10.0, 20.0) is None
+        service.locations_repository.upsert_many.assert_not_awaited()
+        assert location_cache.get((10.0, 20.0)) is None
+
+    @pytest.mark.asyncio
+    async def test_eviction(self, mocker):
+        """
+        Тестирование удаления устаревших записей в фоновом режиме.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        session = mocker.AsyncMock()
+        mocker.patch.object(
+            locations_service, "async_session"
+        ).return_value.__aenter__.return_value = session
+        delete_expired = mocker.patch.object(
+            locations_service.LocationCacheRepository,
+            "delete_expired",
+            return_value=3,
+        )
+        eviction = LocationCacheEviction(interval=60)
+
+        await eviction.start()
+        # первое удаление выполняется сразу после запуска
+        await asyncio.sleep(0)
+        await eviction.stop()
+
+        delete_expired.assert_awaited_once()
+        session.commit.assert_awaited_once()
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from services.outbox_service import OutboxRelay
+from settings import OutboxConfig
+
+
+class TestOutboxRelay:
+    """
+    Тестирование публикации событий из таблицы исходящих событий.
+    """
+
+    @pytest.mark.asyncio
+    async def test_flush_on_stop(self, mocker):
+        """
+        Тестирование публикации оставшихся событий при остановке.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        relay = OutboxRelay(producer=mocker.MagicMock())
+        relay.config = OutboxConfig(batch_size=2, poll_interval=60)
+        relay.relay_batch = mocker.AsyncMock(side_effect=[0, 2, 2, 1])
+
+        await relay.start()
+        # цикл публикации ожидает следующей проверки после пустого пакета
+        while relay.relay_batch.await_count < 1:
+            await asyncio.sleep(0)
+        await relay.stop()
+
+        # пакеты публикуются без задержки до первого неполного пакета
+        assert relay.relay_batch.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_flush_error(self, mocker):
+        """
+        Тестирование остановки публикации оставшихся событий при ошибке.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        relay = OutboxRelay(producer=mocker.MagicMock())
+        relay.config = OutboxConfig(batch_size=2)
+        relay.relay_batch = mocker.AsyncMock(side_effect=[2, RuntimeError])
+
+        await relay.flush()
+
+        assert relay.relay_batch.await_count == 2
@@ -0,0 +1,71 @@
+import pytest
+
+from integrations.cache.local import LocalCache
+from integrations.cache.memory import MemoryCache
+from models import Place
+from services.places_cache import PlacesCache
+
+
+class TestPlacesCache:
+    """
+    Тестирование кэша объектов любимых мест.
+    """
+
+    @pytest.mark.asyncio
+    async def test_get_set(self, fixture_place):
+        """
+        Тестирование сохранения и получения объектов.
+
+        :param fixture_place: Фикстура объекта любимого места.
+        :return:
+        """
+
+        cache = PlacesCache(MemoryCache(max_size=10, ttl=60))
+        fixture_place.id = 1
+        await cache.set(fixture_place)
+        fixture_place.description = "Измененное описание"
+
+        cached = await cache.get(1)
+        assert cached.description == "Тестовое описание"
+        assert await cache.get(2) is None
+
+        await cache.delete([1])
+        assert await cache.get(1) is None
+
+    @pytest.mark.asyncio
+    async def test_set_unsaved(self, fixture_place):
+        """
+        Тестирование пропуска объектов, не сохраненных в БД.
+
+        :param fixture_place: Фикстура объекта любимого места.
+        :return:
+        """
+
+        memory = MemoryCache(max_size=10, ttl=60)
+        fixture_place.id = None
+        await PlacesCache(memory).set(fixture_place)
+
+        assert len(memory) == 0
+
+    @pytest.mark.asyncio
+    async def test_shared(self, fixture_place):
+        """
+        Тестирование получения объектов из общего кэша.
+
+        :param fixture_place: Фикстура объекта любимого места.
+        :return:
+        """
+
+        shared = LocalCache()
+        writer = PlacesCache(MemoryCache(max_size=10, ttl=60), shared=shared)
+        reader = PlacesCache(MemoryCache(max_size=10, ttl=60), shared=shared)
+        fixture_place.id = 1
+        await writer.set(fixture_place)
+
+        cached = await reader.get(1)
+        assert isinstance(cached, Place)
+        assert cached.latitude == fixture_place.latitude
+        assert len(reader.memory) == 1
+
+        await writer.delete([1])
+        assert await shared.get("place:1") is None
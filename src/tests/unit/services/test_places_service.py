@@ -0,0 +1,134 @@
+import pytest
+
+from clients.shemas import LocalityDTO
+from models import Place
+from schemas.places import PlaceBulkUpdate
+from services.places_service import PlacesService
+
+
+class TestPlacesService:
+    """
+    Тестирование сервиса для работы с информацией о любимых местах.
+    """
+
+    @pytest.mark.asyncio
+    async def test_update_places(self, mocker):
+        """
+        Тестирование пакетного обновления с обогащением только перемещенных объектов.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        mocker.patch("settings.settings.enrichment.mode", "sync")
+        service = PlacesService(mocker.AsyncMock())
+        moved = Place(id=1, latitude=10.0, longitude=20.0, description="Первое")
+        renamed = Place(id=2, latitude=30.0, longitude=40.0, description="Второе")
+        enriched = Place(
+            id=1, latitude=10.0, longitude=20.0, description="Первое", city="City"
+        )
+        update_many = mocker.patch.object(
+            service.places_repository,
+            "update_many",
+            side_effect=[
+                [
+                    (moved, {"latitude": 11.0, "longitude": 20.0}),
+                    (renamed, {"latitude": 30.0, "longitude": 40.0}),
+                ],
+                [(enriched, {})],
+            ],
+        )
+        get_locations = mocker.patch.object(
+            service.locations_service,
+            "get_locations",
+            return_value=[LocalityDTO(city="City", alpha2code="AA", locality="Loc")],
+        )
+        publish = mocker.patch.object(
+            service.events_service, "publish_country_city_many"
+        )
+
+        result = await service.update_places(
+            [
+                PlaceBulkUpdate(id=2, description="Черновик"),
+                PlaceBulkUpdate(id=1, latitude=10.0),
+                PlaceBulkUpdate(id=2, description="Второе"),
+                PlaceBulkUpdate(id=3, description="Отсутствует"),
+            ]
+        )
+
+        assert update_many.call_args_list[0].args[0] == [
+            {"id": 2, "description": "Второе"},
+            {"id": 1, "latitude": 10.0},
+            {"id": 3, "description": "Отсутствует"},
+        ]
+        get_locations.assert_awaited_once_with([(10.0, 20.0)])
+        assert update_many.call_args_list[1].args[0] == [
+            {"id": 1, "country": "AA", "city": "City", "locality": "Loc"}
+        ]
+        assert list(publish.call_args.args[0]) == [("City", "AA")]
+        assert [place.id for place in result] == [2, 1]
+        assert result[1].city == "City"
+
+    @pytest.mark.asyncio
+    async def test_update_places_small_move(self, mocker):
+        """
+        Тестирование обновления без запроса к API при перемещении меньше порогового.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        mocker.patch("settings.settings.enrichment.mode", "sync")
+        mocker.patch("settings.settings.enrichment.relocation_threshold", 50.0)
+        service = PlacesService(mocker.AsyncMock())
+        place = Place(id=1, latitude=10.0001, longitude=20.0, description="Место")
+        mocker.patch.object(
+            service.places_repository,
+            "update_many",
+            return_value=[(place, {"latitude": 10.0, "longitude": 20.0})],
+        )
+        get_locations = mocker.patch.object(service.locations_service, "get_locations")
+
+        result = await service.update_places([PlaceBulkUpdate(id=1, latitude=10.0001)])
+
+        get_locations.assert_not_called()
+        assert result == [place]
+
+    @pytest.mark.asyncio
+    async def test_update_places_same_city(self, mocker):
+        """
+        Тестирование обновления без публикации события, если город и страна не изменились.
+
+        :param mocker: Фикстура для создания мок-объектов.
+        :return:
+        """
+
+        mocker.patch("settings.settings.enrichment.mode", "sync")
+        service = PlacesService(mocker.AsyncMock())
+        place = Place(
+            id=1,
+            latitude=10.01,
+            longitude=20.0,
+            description="Место",
+            country="AA",
+            city="City",
+            locality="Old",
+        )
+        update_many = mocker.patch.object(
+            service.places_repository,
+            "update_many",
+            side_effect=[[(place, {"latitude": 10.0, "longitude": 20.0})], []],
+        )
+        mocker.patch.object(
+            service.locations_service,
+            "get_locations",
+            return_value=[LocalityDTO(city="City", alpha2code="AA", locality="New")],
+        )
+        publish = mocker.patch.object(
+            service.events_service, "publish_country_city_many"
+        )
+
+        await service.update_places([PlaceBulkUpdate(id=1, latitude=10.01)])
+
+        assert update_many.call_args_list[1].args[0][0]["locality"] == "New"
+        assert not list(publish.call_args.args[0])
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from models import Place
+from utils.export import to_csv, to_ndjson
+
+
+class TestExport:
+    """
+    Тестирование преобразования данных для выгрузки.
+    """
+
+    def test_to_ndjson(self):
+        """
+        Тестирование преобразования объектов в NDJSON.
+
+        :return:
+        """
+
+        places = [
+            Place(id=1, latitude=10.0, longitude=20.0, description="Первое"),
+            Place(id=2, latitude=30.0, longitude=40.0, description="Второе"),
+        ]
+
+        lines = to_ndjson(places).splitlines()
+        assert len(lines) == 2
+        assert Place.parse_raw(lines[1]).description == "Второе"
+        assert to_ndjson([]) == ""
+
+    def test_to_csv(self):
+        """
+        Тестирование преобразования строк значений в CSV.
+
+        :return:
+        """
+
+        created_at = datetime(2022, 11, 1, 12, 30)
+        result = to_csv([["id", "city", "created_at"], [1, None, created_at]])
+
+        assert result == "id,city,created_at\n1,,2022-11-01T12:30:00\n"
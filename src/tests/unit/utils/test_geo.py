@@ -0,0 +1,33 @@
+import pytest
+
+from utils.geo import haversine_distance, quantize_coordinates
+
+
+class TestGeo:
+    """
+    Тестирование функций для работы с географическими координатами.
+    """
+
+    def test_quantize_coordinates(self):
+        """
+        Тестирование округления координат.
+
+        :return:
+        """
+
+        assert quantize_coordinates(55.755831, 37.617673, 4) == (55.7558, 37.6177)
+
+    def test_haversine_distance(self):
+        """
+        Тестирование расчета расстояния между точками.
+
+        :return:
+        """
+
+        assert haversine_distance(10.0, 20.0, 10.0, 20.0) == 0
+        # один градус широты – около 111,2 км
+        assert haversine_distance(0.0, 0.0, 1.0, 0.0) == pytest.approx(111195, rel=1e-3)
+        # Москва – Санкт-Петербург
+        assert haversine_distance(55.7558, 37.6173, 59.9311, 30.3609) == pytest.approx(
+            634000, rel=1e-2
+        )
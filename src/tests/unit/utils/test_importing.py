@@ -0,0 +1,81 @@
+import pytest
+
+from utils.importing import iter_lines, parse_csv, parse_ndjson
+
+
+async def stream(*chunks: bytes):
+    """
+    Поток данных из переданных частей.
+
+    :param chunks: Части потока.
+    :return:
+    """
+
+    for chunk in chunks:
+        yield chunk
+
+
+class TestImporting:
+    """
+    Тестирование постепенного разбора загружаемых данных.
+    """
+
+    @pytest.mark.asyncio
+    async def test_iter_lines(self):
+        """
+        Тестирование разбиения потока на строки на границах частей.
+
+        :return:
+        """
+
+        lines = [
+            line
+            async for line in iter_lines(stream(b"first\r\nsec", b"ond\n", b"third"))
+        ]
+
+        assert lines == ["first", "second", "third"]
+
+    @pytest.mark.asyncio
+    async def test_parse_ndjson(self):
+        """
+        Тестирование разбора NDJSON.
+
+        :return:
+        """
+
+        rows = [
+            row
+            async for row in parse_ndjson(
+                iter_lines(stream(b'{"latitude": 1.0}\n\n[1]\n{invalid\n'))
+            )
+        ]
+
+        assert rows[0] == {"latitude": 1.0}
+        assert isinstance(rows[1], ValueError)
+        assert isinstance(rows[2], ValueError)
+        assert len(rows) == 3
+
+    @pytest.mark.asyncio
+    async def test_parse_csv(self):
+        """
+        Тестирование разбора CSV со значениями, содержащими переводы строк.
+
+        :return:
+        """
+
+        data = (
+            b"latitude,longitude,description,city\n"
+            b'1.0,2.0,"First ""quoted""\nmultiline",\n'
+            b"3.0,4.0\n"
+            b"5.0,6.0,Third,City\n"
+        )
+        rows = [row async for row in parse_csv(iter_lines(stream(data)))]
+
+        assert rows[0] == {
+            "latitude": "1.0",
+            "longitude": "2.0",
+            "description": 'First "quoted"\nmultiline',
+            "city": None,
+        }
+        assert isinstance(rows[1], ValueError)
+        assert rows[2]["city"] == "City"
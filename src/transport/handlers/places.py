@@ -1,10 +1,30 @@
-from fastapi import APIRouter, Depends, Query, status
+from typing import Literal, Optional
 
-from exceptions import ApiHTTPException, ObjectNotFoundException
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from exceptions import ApiHTTPException, InvalidCursorException, ObjectNotFoundException
 from models.places import Place
-from schemas.places import PlaceResponse, PlacesListResponse, PlaceUpdate
+from repositories.pagination import InvalidCursorError
+from schemas.places import (
+    PlaceBulkResult,
+    PlaceResponse,
+    PlacesBulkCreateRequest,
+    PlacesBulkDeleteResponse,
+    PlacesBulkResponse,
+    PlacesBulkUpdateRequest,
+    PlacesBulkUpdateResponse,
+    PlacesImportResponse,
+    PlacesListResponse,
+    PlaceUpdate,
+)
 from schemas.routes import MetadataTag
+from services.import_service import ImportService
 from services.places_service import PlacesService
+from settings import settings
+from utils.export import MEDIA_TYPES
+from utils.importing import iter_lines
 
 router = APIRouter()
 
@@ -21,20 +41,107 @@ tag_places = MetadataTag(
     response_model=PlacesListResponse,
 )
 async def get_list(
+    limit: int = Query(
+        20, gt=0, le=100, description="Ограничение на количество объектов в выборке"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Курсор страницы (next_cursor или prev_cursor из ответа)"
+    ),
+    order_by: Literal["id", "created_at"] = Query(
+        "id", description="Атрибут сортировки"
+    ),
+    descending: bool = Query(False, description="Сортировка по убыванию"),
+    places_service: PlacesService = Depends(),
+) -> PlacesListResponse:
+    """
+    Получение страницы списка любимых мест.
+
+    :param limit: Ограничение на количество объектов в выборке.
+    :param cursor: Курсор страницы.
+    :param order_by: Атрибут сортировки.
+    :param descending: Сортировка по убыванию.
+    :param places_service: Сервис для работы с информацией о любимых местах.
+    :return:
+    """
+
+    try:
+        page = await places_service.get_places_list(
+            limit=limit, cursor=cursor, order_by=order_by, descending=descending
+        )
+    except InvalidCursorError as exc:
+        raise InvalidCursorException from exc
+
+    return PlacesListResponse(
+        data=page.items, next_cursor=page.next_cursor, prev_cursor=page.prev_cursor
+    )
+
+
+@router.get(
+    "/nearby",
+    summary="Получение списка ближайших объектов",
+    response_model=PlacesListResponse,
+)
+async def get_nearby(
+    lat: float = Query(..., ge=-90, le=90, description="Широта точки поиска"),
+    lon: float = Query(..., ge=-180, le=180, description="Долгота точки поиска"),
+    radius: float = Query(
+        1000, gt=0, le=1_000_000, description="Радиус поиска (в метрах)"
+    ),
     limit: int = Query(
         20, gt=0, le=100, description="Ограничение на количество объектов в выборке"
     ),
     places_service: PlacesService = Depends(),
 ) -> PlacesListResponse:
     """
-    Получение списка любимых мест.
+    Получение списка любимых мест в заданном радиусе в порядке увеличения расстояния.
 
+    :param lat: Широта точки поиска.
+    :param lon: Долгота точки поиска.
+    :param radius: Радиус поиска (в метрах).
     :param limit: Ограничение на количество объектов в выборке.
     :param places_service: Сервис для работы с информацией о любимых местах.
     :return:
     """
 
-    return PlacesListResponse(data=await places_service.get_places_list(limit=limit))
+    return PlacesListResponse(
+        data=await places_service.get_nearby_places(
+            latitude=lat, longitude=lon, radius=radius, limit=limit
+        )
+    )
+
+
+@router.get(
+    "/export",
+    summary="Выгрузка всех объектов",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {media_type: {} for media_type in MEDIA_TYPES.values()}
+        }
+    },
+)
+async def export(
+    export_format: Literal["ndjson", "csv"] = Query(
+        "ndjson", alias="format", description="Формат выгрузки"
+    ),
+    places_service: PlacesService = Depends(),
+) -> StreamingResponse:
+    """
+    Потоковая выгрузка всех любимых мест.
+    Данные отправляются клиенту по мере чтения из БД.
+
+    :param export_format: Формат выгрузки.
+    :param places_service: Сервис для работы с информацией о любимых местах.
+    :return:
+    """
+
+    return StreamingResponse(
+        places_service.export_places(export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="places.{export_format}"'
+        },
+    )
 
 
 @router.get(
@@ -76,8 +183,8 @@ async def create(
     :return:
     """
 
-    if primary_key := await places_service.create_place(place):
-        return PlaceResponse(data=await places_service.get_place(primary_key))
+    if created := await places_service.create_place(place):
+        return PlaceResponse(data=created)
 
     raise ApiHTTPException(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -85,6 +192,101 @@ async def create(
     )
 
 
+@router.post(
+    "/bulk",
+    summary="Пакетное создание объектов",
+    response_model=PlacesBulkResponse,
+)
+async def create_bulk(
+    places: PlacesBulkCreateRequest, places_service: PlacesService = Depends()
+) -> PlacesBulkResponse:
+    """
+    Пакетное создание объектов любимых мест по переданным данным.
+    Объекты с ошибками валидации не создаются и не прерывают обработку остальных.
+
+    :param places: Данные создаваемых объектов.
+    :param places_service: Сервис для работы с информацией о любимых местах.
+    :return: Результаты обработки в порядке переданных объектов.
+    """
+
+    results = [PlaceBulkResult(index=index) for index in range(len(places.data))]
+    valid: list[tuple[int, Place]] = []
+    for index, data in enumerate(places.data):
+        try:
+            valid.append((index, Place.validate(data)))
+        except ValidationError as exc:
+            results[index].errors = exc.errors()
+
+    if valid:
+        primary_keys = await places_service.create_places([place for _, place in valid])
+        for (index, _), primary_key in zip(valid, primary_keys):
+            results[index].id = primary_key
+
+    return PlacesBulkResponse(data=results)
+
+
+@router.post(
+    "/import",
+    summary="Загрузка объектов из файла",
+    response_model=PlacesImportResponse,
+)
+async def import_places(
+    request: Request,
+    import_format: Literal["ndjson", "csv"] = Query(
+        "ndjson", alias="format", description="Формат данных"
+    ),
+    enrich: bool = Query(
+        False, description="Обогащение объектов данными о местонахождении в фоне"
+    ),
+    import_service: ImportService = Depends(),
+) -> PlacesImportResponse:
+    """
+    Загрузка любимых мест из файла, переданного в теле запроса.
+    Файл обрабатывается по мере получения, без загрузки в память целиком.
+
+    :param request: Объект запроса.
+    :param import_format: Формат данных.
+    :param enrich: Обогащение объектов данными о местонахождении.
+    :param import_service: Сервис для загрузки любимых мест.
+    :return:
+    """
+
+    stats = await import_service.import_places(
+        iter_lines(request.stream()), import_format, enrich=enrich
+    )
+
+    return PlacesImportResponse(
+        total=stats.total,
+        imported=stats.imported,
+        invalid=stats.invalid,
+        errors=stats.errors,
+        elapsed=stats.elapsed,
+        rows_per_second=stats.rows_per_second,
+    )
+
+
+@router.patch(
+    "",
+    summary="Пакетное обновление объектов",
+    response_model=PlacesBulkUpdateResponse,
+)
+async def update_bulk(
+    places: PlacesBulkUpdateRequest, places_service: PlacesService = Depends()
+) -> PlacesBulkUpdateResponse:
+    """
+    Пакетное обновление объектов любимых мест по переданным данным в одной транзакции.
+    Отсутствующие объекты пропускаются.
+
+    :param places: Данные для обновления объектов.
+    :param places_service: Сервис для работы с информацией о любимых местах.
+    :return: Обновленные объекты.
+    """
+
+    return PlacesBulkUpdateResponse(
+        data=await places_service.update_places(places.data)
+    )
+
+
 @router.patch(
     "/{primary_key}",
     summary="Обновление объекта по его идентификатору",
@@ -102,10 +304,36 @@ async def update(
     :return:
     """
 
-    if not await places_service.update_place(primary_key, place):
-        raise ObjectNotFoundException
+    if updated := await places_service.update_place(primary_key, place):
+        return PlaceResponse(data=updated)
+
+    raise ObjectNotFoundException
+
+
+@router.delete(
+    "",
+    summary="Пакетное удаление объектов по идентификаторам",
+    response_model=PlacesBulkDeleteResponse,
+)
+async def delete_bulk(
+    ids: list[int] = Query(
+        ...,
+        min_items=1,
+        max_items=settings.bulk.max_items,
+        description="Идентификаторы объектов",
+    ),
+    places_service: PlacesService = Depends(),
+) -> PlacesBulkDeleteResponse:
+    """
+    Удаление объектов любимых мест по идентификаторам одним запросом.
+    Отсутствующие идентификаторы пропускаются.
+
+    :param ids: Идентификаторы объектов.
+    :param places_service: Сервис для работы с информацией о любимых местах.
+    :return: Идентификаторы удаленных объектов.
+    """
 
-    return PlaceResponse(data=await places_service.get_place(primary_key))
+    return PlacesBulkDeleteResponse(data=await places_service.delete_places(ids))
 
 
 @router.delete(
@@ -0,0 +1,49 @@
+"""
+Вспомогательные функции для выгрузки данных в текстовых форматах.
+"""
+
+import csv
+import io
+from datetime import date, datetime
+from typing import Any, Iterable, Sequence
+
+from pydantic import BaseModel
+
+#: типы содержимого по форматам выгрузки
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def to_ndjson(models: Iterable[BaseModel]) -> str:
+    """
+    Преобразование объектов в формат NDJSON (один JSON-объект на строку).
+
+    :param models: Объекты для преобразования.
+    :return:
+    """
+
+    return "".join(f"{model.json()}\n" for model in models)
+
+
+def to_csv(rows: Iterable[Sequence[Any]]) -> str:
+    """
+    Преобразование строк значений в формат CSV.
+    Даты преобразуются в формат ISO 8601, пустые значения – в пустые строки.
+
+    :param rows: Строки значений для преобразования.
+    :return:
+    """
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows(
+        [
+            value.isoformat() if isinstance(value, (date, datetime)) else value
+            for value in row
+        ]
+        for row in rows
+    )
+
+    return buffer.getvalue()
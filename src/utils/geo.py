@@ -0,0 +1,48 @@
+"""
+Вспомогательные функции для работы с географическими координатами.
+"""
+import math
+
+
+def quantize_coordinates(
+    latitude: float, longitude: float, precision: int
+) -> tuple[float, float]:
+    """
+    Округление координат до заданной точности.
+    Близкие точки (в пределах одной ячейки сетки) получают одинаковый результат.
+
+    :param latitude: Широта
+    :param longitude: Долгота
+    :param precision: Количество знаков после запятой
+    :return:
+    """
+
+    return round(latitude, precision), round(longitude, precision)
+
+
+#: средний радиус Земли (в метрах)
+EARTH_RADIUS = 6371008.8
+
+
+def haversine_distance(
+    latitude: float, longitude: float, other_latitude: float, other_longitude: float
+) -> float:
+    """
+    Расстояние между точками по поверхности Земли (формула гаверсинусов).
+
+    :param latitude: Широта первой точки
+    :param longitude: Долгота первой точки
+    :param other_latitude: Широта второй точки
+    :param other_longitude: Долгота второй точки
+    :return: Расстояние (в метрах)
+    """
+
+    phi, other_phi = math.radians(latitude), math.radians(other_latitude)
+    delta_phi = other_phi - phi
+    delta_lambda = math.radians(other_longitude - longitude)
+    value = (
+        math.sin(delta_phi / 2) ** 2
+        + math.cos(phi) * math.cos(other_phi) * math.sin(delta_lambda / 2) ** 2
+    )
+
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(value)))
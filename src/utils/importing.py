@@ -0,0 +1,93 @@
+"""
+Вспомогательные функции для постепенного разбора загружаемых данных.
+"""
+
+import csv
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Union
+
+#: строка данных: значения атрибутов или описание ошибки разбора
+ParsedRow = Union[dict[str, Any], ValueError]
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """
+    Разбиение потока байтов на строки.
+    Строки могут разрываться на границах частей потока.
+
+    :param chunks: Части потока данных.
+    :return: Строки без символов перевода строки.
+    """
+
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r").decode("utf-8-sig")
+
+    if buffer.strip():
+        yield buffer.rstrip(b"\r").decode("utf-8-sig")
+
+
+async def parse_ndjson(lines: AsyncIterable[str]) -> AsyncIterator[ParsedRow]:
+    """
+    Разбор строк в формате NDJSON (один JSON-объект на строку).
+    Пустые строки пропускаются.
+
+    :param lines: Строки данных.
+    :return: Значения атрибутов или ошибка разбора для каждой строки.
+    """
+
+    async for line in lines:
+        if not line.strip():
+            continue
+
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield ValueError(f"Invalid JSON: {exc}")
+            continue
+
+        yield row if isinstance(row, dict) else ValueError("JSON object expected")
+
+
+async def parse_csv(lines: AsyncIterable[str]) -> AsyncIterator[ParsedRow]:
+    """
+    Разбор строк в формате CSV с заголовком.
+    Значения в кавычках могут содержать переводы строк,
+    пустые значения преобразуются в None.
+
+    :param lines: Строки данных.
+    :return: Значения атрибутов или ошибка разбора для каждой записи.
+    """
+
+    header = None
+    record: list[str] = []
+    async for line in lines:
+        record.append(line)
+        # запись не завершена, пока кавычки не сбалансированы (экранирование – удвоением)
+        if sum(part.count('"') for part in record) % 2:
+            continue
+
+        values: list[str] = next(csv.reader(["\n".join(record)]), [])
+        record = []
+        if not values:
+            continue
+
+        if header is None:
+            header = values
+        elif len(values) != len(header):
+            yield ValueError(f"Expected {len(header)} values, got {len(values)}")
+        else:
+            yield {key: value or None for key, value in zip(header, values)}
+
+    if record:
+        yield ValueError("Unexpected end of data")
+
+
+#: функции разбора по форматам загрузки
+PARSERS = {
+    "ndjson": parse_ndjson,
+    "csv": parse_csv,
+}